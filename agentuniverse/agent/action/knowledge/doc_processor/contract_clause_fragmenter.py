@@ -332,6 +332,8 @@ class ContractClauseFragmenter(DocProcessor):
             List of clause documents.
         """
         clause_docs = []
+        # Lower-case each clause head once instead of once per reference lookup.
+        clause_heads = [(c.id, c.text.lower()[:100]) for c in clauses] if self.extract_references else None
 
         for clause in clauses:
             # Build metadata
@@ -357,7 +359,7 @@ class ContractClauseFragmenter(DocProcessor):
 
             # Extract references if enabled
             if self.extract_references:
-                references = self._extract_references(clause.text, clauses)
+                references = self._extract_references(clause.text, clauses, clause_heads)
                 if references:
                     metadata['clause_references'] = references
 
@@ -372,12 +374,15 @@ class ContractClauseFragmenter(DocProcessor):
 
         return clause_docs
 
-    def _extract_references(self, text: str, all_clauses: List[ClauseNode]) -> List[str]:
+    def _extract_references(self, text: str, all_clauses: List[ClauseNode],
+                            clause_heads: Optional[List[Tuple[str, str]]] = None) -> List[str]:
         """Extract cross-references to other clauses.
 
         Args:
             text: Clause text.
             all_clauses: All clauses in the document.
+            clause_heads: Precomputed (clause id, lower-cased first 100 chars)
+                pairs for `all_clauses`; built here when omitted.
 
         Returns:
             List of referenced clause IDs.
@@ -392,15 +397,18 @@ class ContractClauseFragmenter(DocProcessor):
             r'第(.+?)条',  # Chinese
         ]
 
+        if clause_heads is None:
+            clause_heads = [(c.id, c.text.lower()[:100]) for c in all_clauses]
+
         for pattern in patterns:
             matches = re.finditer(pattern, text, re.IGNORECASE)
             for match in matches:
-                ref_text = match.group(0)
+                ref_text = match.group(0).lower()
                 # Try to find matching clause
-                for clause in all_clauses:
-                    if ref_text.lower() in clause.text.lower()[:100]:  # Check beginning of clause
-                        if clause.id not in references:
-                            references.append(clause.id)
+                for clause_id, head in clause_heads:
+                    if ref_text in head:  # Check beginning of clause
+                        if clause_id not in references:
+                            references.append(clause_id)
 
         return references
 
@@ -188,15 +188,17 @@ class FinancialEventAggregator(DocProcessor):
         """
         n = len(docs)
         similarity_matrix = np.zeros((n, n))
+        # Tokenize each document once; the pair loop only touches these sets.
+        word_sets = [set(doc.text.lower().split()) for doc in docs]
 
         for i in range(n):
+            words_i = word_sets[i]
             for j in range(i, n):
                 if i == j:
                     similarity_matrix[i][j] = 1.0
                 else:
                     # Simple word overlap similarity
-                    words_i = set(docs[i].text.lower().split())
-                    words_j = set(docs[j].text.lower().split())
+                    words_j = word_sets[j]
                     overlap = len(words_i & words_j)
                     union = len(words_i | words_j)
                     sim = overlap / union if union > 0 else 0.0
@@ -5,6 +5,7 @@
 # @Author  : kaichuan
 # @FileName: threshold_filter.py
 
+import heapq
 import math
 from typing import List, Dict, Any, Optional, Literal
 
@@ -165,14 +166,7 @@ class ThresholdFilter(DocProcessor):
         """
         k = config.get("k", len(docs))
 
-        # Score each document
-        scored_docs = [(doc, self._get_score(doc)) for doc in docs]
-
-        # Sort by score descending
-        scored_docs.sort(key=lambda x: x[1], reverse=True)
-
-        # Return top K
-        return [doc for doc, score in scored_docs[:k]]
+        return self._top_by_score(docs, k)
 
     def _apply_percentile_filter(self, docs: List[Document], config: Dict[str, Any]) -> List[Document]:
         """Keep top X% documents by score.
@@ -193,14 +187,33 @@ class ThresholdFilter(DocProcessor):
 
         cutoff_count = math.ceil(len(docs) * percentile)
 
+        return self._top_by_score(docs, cutoff_count)
+
+    def _top_by_score(self, docs: List[Document], count: int) -> List[Document]:
+        """Return the `count` highest-scoring documents, best first.
+
+        Partial selection with heapq.nlargest is O(n log count) instead of a
+        full sort, and keeps the stable tie order of a descending sort.
+
+        Args:
+            docs: Documents to select from.
+            count: Number of documents to keep. Values that are not a
+                non-negative int (e.g. None) fall back to slicing the sorted
+                list, so None keeps every document.
+
+        Returns:
+            List[Document]: Selected documents in descending score order.
+        """
+        if isinstance(count, int) and 0 <= count < len(docs):
+            return heapq.nlargest(count, docs, key=self._get_score)
+
         # Score each document
         scored_docs = [(doc, self._get_score(doc)) for doc in docs]
 
         # Sort by score descending
         scored_docs.sort(key=lambda x: x[1], reverse=True)
 
-        # Return top percentile
-        return [doc for doc, score in scored_docs[:cutoff_count]]
+        return [doc for doc, score in scored_docs[:count]]
 
     def _get_score(self, doc: Document) -> float:
         """Extract score from document metadata.
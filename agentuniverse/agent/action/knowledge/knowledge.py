@@ -387,7 +387,7 @@ class Knowledge(ComponentBase):
         copied.insert_processors = self.insert_processors.copy()
         copied.update_processors = self.update_processors.copy()
         copied.post_processors = self.post_processors.copy()
-        copied.readers = deepcopy(self.readers)
+        copied.readers = self.readers.copy()
         if self.ext_info is not None:
             copied.ext_info = deepcopy(self.ext_info)
         return copied
@@ -5,13 +5,17 @@
 # @Author  : Saladday
 # @Email   : fanjing.luo@zju.edu.cn
 # @FileName: zip_reader.py
+import contextlib
 import io
+import mmap
+import os
 import shutil
 import tempfile
 import uuid
 import zipfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path, PurePosixPath
-from typing import Dict, List, Optional, Union, Type
+from typing import BinaryIO, Dict, Iterator, List, Optional, Union, Type
 
 from agentuniverse.agent.action.knowledge.reader.file.code_reader import CODE_FILE_EXTENSIONS, CodeReader
 from agentuniverse.agent.action.knowledge.reader.file.csv_reader import CSVReader
@@ -23,7 +27,9 @@ from agentuniverse.agent.action.knowledge.reader.file.pptx_reader import PptxRea
 from agentuniverse.agent.action.knowledge.reader.file.txt_reader import TxtReader
 from agentuniverse.agent.action.knowledge.reader.file.xlsx_reader import XlsxReader
 from agentuniverse.agent.action.knowledge.reader.reader import Reader
+from agentuniverse.agent.action.knowledge.reader.utils import detect_file_encoding
 from agentuniverse.agent.action.knowledge.store.document import Document
+from agentuniverse.base.util.logging.logging_util import LOGGER
 
 TEXT_FALLBACK_EXTENSIONS = {
     ".json",
@@ -39,6 +45,59 @@ TEXT_FALLBACK_EXTENSIONS = {
     ".rst",
 }
 
+# Leading bytes of common binary formats; a text-suffixed member starting with
+# one of these (or containing NUL bytes early on) is skipped instead of decoded.
+BINARY_MAGIC_PREFIXES = frozenset({
+    b"\x89PNG",
+    b"GIF8",
+    b"\xff\xd8\xff\xe0",
+    b"\xff\xd8\xff\xe1",
+    b"\xff\xd8\xff\xdb",
+    b"\xff\xd8\xff\xee",
+    b"PK\x03\x04",
+    b"%PDF",
+    b"\x7fELF",
+    b"Rar!",
+    b"7z\xbc\xaf",
+    b"\xca\xfe\xba\xbe",
+})
+SHORT_BINARY_MAGIC_PREFIXES = frozenset({
+    b"\x1f\x8b",
+})
+BINARY_SNIFF_SIZE = 512
+# Archives with fewer text members than this are decoded inline; below it the
+# thread pool costs more than it saves.
+PARALLEL_DECODE_THRESHOLD = 64
+INLINE_TEXT_EXTENSIONS = TEXT_FALLBACK_EXTENSIONS | {".txt"}
+
+
+class _MappedFile(io.RawIOBase):
+    """Seekable file object over an mmap, which zipfile cannot take directly before 3.13."""
+
+    def __init__(self, mapped: mmap.mmap):
+        super().__init__()
+        self._mapped = mapped
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        return self._mapped.read(size)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        try:
+            self._mapped.seek(offset, whence)
+        except ValueError as exc:
+            # Regular files raise OSError here, which zipfile relies on.
+            raise OSError(str(exc)) from exc
+        return self._mapped.tell()
+
+    def tell(self) -> int:
+        return self._mapped.tell()
+
 
 class ZipReader(Reader):
     max_total_size: int = 512 * 1024 * 1024
@@ -47,6 +106,7 @@ class ZipReader(Reader):
     max_files: int = 4096
     max_compression_ratio: int = 100
     stream_chunk_size: int = 1024 * 1024
+    max_workers: Optional[int] = None
         
     def _get_reader(self, suffix: str) -> Reader:
         if suffix not in self._readers:
@@ -79,7 +139,7 @@ class ZipReader(Reader):
         }
         
         ext_meta = dict(ext_info or {})
-        with zipfile.ZipFile(file) as archive:
+        with self._open_archive_source(file) as source, zipfile.ZipFile(source) as archive:
             with tempfile.TemporaryDirectory() as temp_dir:
                 return self._iterate_archive(
                     archive,
@@ -90,6 +150,19 @@ class ZipReader(Reader):
                     [],
                 )
 
+    @staticmethod
+    @contextlib.contextmanager
+    def _open_archive_source(file: Path) -> Iterator[BinaryIO]:
+        # Member reads are served from the page cache through the mapping
+        # rather than a read() syscall each; empty files cannot be mapped and
+        # are handed to zipfile as-is so it reports them as bad archives.
+        with open(file, "rb") as handle:
+            if os.fstat(handle.fileno()).st_size == 0:
+                yield handle
+                return
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield _MappedFile(mapped)
+
     def _iterate_archive(
         self,
         archive: zipfile.ZipFile,
@@ -99,21 +172,34 @@ class ZipReader(Reader):
         depth: int,
         path_stack: List[str],
     ) -> List[Document]:
-        documents: List[Document] = []
-        for info in archive.infolist():
-            if info.is_dir():
-                continue
-            member_path = self._normalize_member(info.filename)
-            if member_path is None:
-                continue
-            self._enforce_limits(info)
-            suffix = member_path.suffix.lower()
-            current_stack = path_stack + [member_path.as_posix()]
-            metadata = self._build_metadata(archive_path, current_stack, depth, ext_meta)
-            
-            if suffix == ".zip":
-                documents.extend(
-                    self._handle_nested_zip(
+        infos = archive.infolist()
+        text_member_count = sum(
+            1 for info in infos
+            if PurePosixPath(info.filename).suffix.lower() in INLINE_TEXT_EXTENSIONS
+        )
+        executor = None
+        workers = self.max_workers or os.cpu_count() or 1
+        if workers > 1 and text_member_count >= PARALLEL_DECODE_THRESHOLD:
+            # Members are decompressed outside ZipFile's shared file lock, so
+            # reads of different members overlap across threads.
+            executor = ThreadPoolExecutor(max_workers=workers)
+
+        # One slot per member, filled by index; skipped members stay None.
+        results: List[Optional[Union[List[Document], Future]]] = [None] * len(infos)
+        try:
+            for index, info in enumerate(infos):
+                if info.is_dir():
+                    continue
+                member_path = self._normalize_member(info.filename)
+                if member_path is None:
+                    continue
+                self._enforce_limits(info)
+                suffix = member_path.suffix.lower()
+                current_stack = path_stack + [member_path.as_posix()]
+                metadata = self._build_metadata(archive_path, current_stack, depth, ext_meta)
+
+                if suffix == ".zip":
+                    results[index] = self._handle_nested_zip(
                         archive,
                         info,
                         archive_path,
@@ -122,18 +208,28 @@ class ZipReader(Reader):
                         depth,
                         current_stack,
                     )
-                )
-            elif suffix in TEXT_FALLBACK_EXTENSIONS:
-                documents.extend(
-                    self._handle_text_fallback(archive, info, metadata)
-                )
-            elif suffix in CODE_FILE_EXTENSIONS or suffix in self._reader_classes:
-                reader = self._get_reader(suffix)
-                if reader:
-                    documents.extend(
-                        self._handle_reader_with_temp(archive, info, temp_dir, metadata, reader)
-                    )
-        return documents
+                elif suffix in INLINE_TEXT_EXTENSIONS:
+                    handler = self._handle_plain_text if suffix == ".txt" else self._handle_text_fallback
+                    if executor is not None:
+                        results[index] = executor.submit(handler, archive, info, metadata)
+                    else:
+                        results[index] = handler(archive, info, metadata)
+                elif suffix in CODE_FILE_EXTENSIONS or suffix in self._reader_classes:
+                    reader = self._get_reader(suffix)
+                    if reader:
+                        results[index] = self._handle_reader_with_temp(
+                            archive, info, temp_dir, metadata, reader
+                        )
+
+            documents: List[Document] = []
+            for result in results:
+                if result is None:
+                    continue
+                documents.extend(result.result() if isinstance(result, Future) else result)
+            return documents
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
 
     def _handle_nested_zip(
         self,
@@ -191,11 +287,35 @@ class ZipReader(Reader):
         metadata: Dict,
     ) -> List[Document]:
         with archive.open(info) as raw:
+            if self._is_binary(raw.peek(BINARY_SNIFF_SIZE)):
+                return []
             text = self._read_text(raw)
         if not text:
             return []
         return [Document(text=text, metadata=dict(metadata))]
 
+    def _handle_plain_text(
+        self,
+        archive: zipfile.ZipFile,
+        info: zipfile.ZipInfo,
+        metadata: Dict,
+    ) -> List[Document]:
+        # Same result as TxtReader on an extracted copy, without the temp file
+        # round trip that dominates archives with many small text members.
+        with archive.open(info) as raw:
+            data = raw.read()
+        if self._is_binary(data):
+            return []
+        try:
+            text = data.decode(detect_file_encoding(data))
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+            return [Document(text=text, metadata=dict(metadata))]
+        except Exception as exc:
+            # Like the reader-backed members, one unreadable member is skipped
+            # rather than aborting the whole archive.
+            LOGGER.warn(f"Skipping unreadable zip member {info.filename}: {exc}")
+            return []
+
     def _write_temp_file(
         self,
         archive: zipfile.ZipFile,
@@ -249,6 +369,15 @@ class ZipReader(Reader):
             metadata.update(ext_meta)
         return metadata
 
+    @staticmethod
+    def _is_binary(head: bytes) -> bool:
+        head = head[:BINARY_SNIFF_SIZE]
+        return (
+            head[:4] in BINARY_MAGIC_PREFIXES
+            or head[:2] in SHORT_BINARY_MAGIC_PREFIXES
+            or b"\x00" in head
+        )
+
     def _read_text(self, stream: io.BufferedReader) -> str:
         text_chunks: List[str] = []
         reader = io.TextIOWrapper(stream, encoding="utf-8", errors="ignore")
@@ -11,6 +11,13 @@ import pickle
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+
+try:
+    import faiss
+except ImportError:
+    faiss = None
+
 from agentuniverse.agent.action.knowledge.embedding.embedding_manager import EmbeddingManager
 from agentuniverse.agent.action.knowledge.store.document import Document
 from agentuniverse.agent.action.knowledge.store.query import Query
@@ -72,15 +79,12 @@ class FAISSStore(Store):
 
     def _new_client(self) -> Any:
         """Initialize the FAISS index and load existing data if available."""
-        try:
-            import faiss
-            import numpy as np
-        except ImportError as e:
+        if faiss is None:
             FAISS_NOT_INSTALLED_MSG = (
                 "FAISS is not installed. Please install it with 'pip install faiss-cpu' "
                 "for CPU version or 'pip install faiss-gpu' for GPU version."
             )
-            raise ImportError(FAISS_NOT_INSTALLED_MSG) from e
+            raise ImportError(FAISS_NOT_INSTALLED_MSG)
         self._load_index_and_metadata()
         return self.faiss_index
 
@@ -312,6 +316,9 @@ class FAISSStore(Store):
         if not embeddings_to_add:
             return
 
+        # Convert embeddings to numpy array once, for training and adding
+        embeddings_array = np.array(embeddings_to_add, dtype=np.float32)
+
         # Initialize index if needed
         if self.faiss_index is None:
             dimension = len(embeddings_to_add[0])
@@ -326,11 +333,7 @@ class FAISSStore(Store):
                         f"properly (need at least {nlist})"
                     )
                     logger.warning(warning_msg)
-                train_vectors = np.array(embeddings_to_add, dtype=np.float32)
-                self.faiss_index.train(train_vectors)
-
-        # Convert embeddings to numpy array
-        embeddings_array = np.array(embeddings_to_add, dtype=np.float32)
+                self.faiss_index.train(embeddings_array)
 
         # Add to FAISS index
         self.faiss_index.add(embeddings_array)
@@ -41,6 +41,7 @@ class RedisVectorStore(Store):
     _IDENTIFIER: ClassVar[re.Pattern[str]] = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
     _PREFIX: ClassVar[re.Pattern[str]] = re.compile(r"^[A-Za-z0-9:_-]+$")
     _DISTANCES: ClassVar[dict[str, str]] = {"cosine": "COSINE", "l2": "L2", "inner_product": "IP"}
+    _PLAIN_NUMBER_TYPES: ClassVar[frozenset[type]] = frozenset({int, float})
     _TAG_ESCAPE: ClassVar[re.Pattern[str]] = re.compile(r"([\\,\.<>\{\}\[\]\"':;!@#$%\^&*\(\)\-\+=~|/ ])")
 
     def _initialize_by_component_configer(self, configer: ComponentConfiger) -> "RedisVectorStore":
@@ -224,14 +225,18 @@ class RedisVectorStore(Store):
         return vectors
 
     def _check_vector(self, vector: Any) -> None:
-        if (
-            not isinstance(vector, list)
-            or not vector
-            or any(
+        if not isinstance(vector, list) or not vector:
+            raise ValueError("embedding must be a non-empty list of finite numbers")
+        # Plain int/float vectors are checked with C-level map() passes; anything
+        # else (e.g. numpy scalars, bools) takes the per-element path below.
+        if self._PLAIN_NUMBER_TYPES.issuperset(map(type, vector)):
+            valid = all(map(math.isfinite, vector))
+        else:
+            valid = not any(
                 isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(float(value))
                 for value in vector
             )
-        ):
+        if not valid:
             raise ValueError("embedding must be a non-empty list of finite numbers")
         if self.dimensions is None:
             self.dimensions = len(vector)
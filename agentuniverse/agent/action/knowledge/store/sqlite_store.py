@@ -8,10 +8,11 @@
 import sqlite3
 import json
 import math
-from typing import List, Optional, Set
+from typing import Dict, List, Optional, Set
 from collections import Counter
 
 import jieba
+import numpy as np
 
 from agentuniverse.agent.action.knowledge.store.store import Store
 from agentuniverse.agent.action.knowledge.store.document import Document
@@ -120,20 +121,26 @@ class SQLiteStore(Store):
             return _doc[0].keywords
 
     def insert_document(self, documents: List[Document], **kwargs):
+        # Collect all rows first and write them with one executemany per
+        # table instead of one statement per document and per term.
+        document_rows = []
+        index_rows = []
+        for document in documents:
+            metadata = json.dumps(
+                document.metadata) if document.metadata else None
+            document_rows.append(
+                (document.id, document.text, len(jieba.lcut(document.text)), metadata))
+            self._get_document_keyword(document)
+            index_rows.extend((term, document.id) for term in set(document.keywords))
         with self.conn:
-            for document in documents:
-                metadata = json.dumps(
-                    document.metadata) if document.metadata else None
-                self.conn.execute(
-                    'INSERT OR REPLACE INTO documents (id, text, word_count, metadata) VALUES (?, ?, ?, ?)',
-                    (document.id, document.text, len(jieba.lcut(document.text)), metadata)
-                )
-                self._get_document_keyword(document)
-                for term in set(document.keywords):
-                    self.conn.execute(
-                        'INSERT INTO inverted_index (term, doc_id) VALUES (?, ?)',
-                        (term, document.id)
-                    )
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO documents (id, text, word_count, metadata) VALUES (?, ?, ?, ?)',
+                document_rows
+            )
+            self.conn.executemany(
+                'INSERT INTO inverted_index (term, doc_id) VALUES (?, ?)',
+                index_rows
+            )
 
     def delete_document(self, document_id: int):
         with self.conn:
@@ -147,26 +154,32 @@ class SQLiteStore(Store):
             )
 
     def upsert_document(self, documents: List[Document], **kwargs):
+        # Later documents win when the batch repeats an id, as they would
+        # with one write per document; the stale index rows of every
+        # incoming id are then cleared in one pass before re-indexing.
+        incoming = {document.id: document for document in documents}
+        document_rows = []
+        index_rows = []
+        for document in incoming.values():
+            metadata = json.dumps(
+                document.metadata) if document.metadata else None
+            document_rows.append(
+                (document.id, document.text, len(jieba.lcut(document.text)), metadata))
+            self._get_document_keyword(document)
+            index_rows.extend((term, document.id) for term in set(document.keywords))
         with self.conn:
-            for document in documents:
-                metadata = json.dumps(
-                    document.metadata) if document.metadata else None
-                self.conn.execute(
-                    'INSERT OR REPLACE INTO documents (id, text, word_count, metadata) VALUES (?, ?, ?, ?)',
-                    (
-                    document.id, document.text, len(jieba.lcut(document.text)),
-                    metadata)
-                )
-                self.conn.execute(
-                    'DELETE FROM inverted_index WHERE doc_id = ?',
-                    (document.id,)
-                )
-                self._get_document_keyword(document)
-                for term in set(document.keywords):
-                    self.conn.execute(
-                        'INSERT INTO inverted_index (term, doc_id) VALUES (?, ?)',
-                        (term, document.id)
-                    )
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO documents (id, text, word_count, metadata) VALUES (?, ?, ?, ?)',
+                document_rows
+            )
+            self.conn.executemany(
+                'DELETE FROM inverted_index WHERE doc_id = ?',
+                [(doc_id,) for doc_id in incoming]
+            )
+            self.conn.executemany(
+                'INSERT INTO inverted_index (term, doc_id) VALUES (?, ?)',
+                index_rows
+            )
 
     def query(self, query: Query, **kwargs) -> List[Document]:
         if len(query.keywords) > 0:
@@ -190,31 +203,24 @@ class SQLiteStore(Store):
                 cursor.close()
 
         # Count every document's bm25.
-        doc_scores = []
         total_doc_count = self._get_all_docs_count()
         total_word_count = self._get_all_docs_words_count()
-        for doc_id in relevant_docs:
-            cursor = self.conn.cursor()
-            cursor.execute('SELECT text FROM documents WHERE id = ?',
-                           (doc_id,))
-            doc_text = cursor.fetchone()[0]
-            cursor.close()
-
-            bm25_score = self.compute_bm25(query.query_str, doc_text,
-                                           inverted_index, total_doc_count, total_word_count)
-            doc_scores.append((doc_id, bm25_score))
+        doc_rows = self._fetch_documents(list(relevant_docs))
+        if not doc_rows:
+            return []
+        scores = self._compute_bm25_scores(
+            jieba.lcut(query.query_str), [row[1] for row in doc_rows],
+            inverted_index, total_doc_count, total_word_count)
 
         # Order the docs with bm25, and return top k.
-        doc_scores.sort(key=lambda x: x[1], reverse=True)
-        top_docs = doc_scores[:self.similarity_top_k]
+        top_k = min(self.similarity_top_k, len(doc_rows))
+        if top_k <= 0:
+            return []
+        top_idx = np.argpartition(-scores, top_k - 1)[:top_k]
+        top_idx = top_idx[np.argsort(-scores[top_idx], kind='stable')]
         results = []
-        for doc_id, score in top_docs:
-            cursor = self.conn.cursor()
-            cursor.execute('SELECT * FROM documents WHERE id = ?',
-                           (doc_id,))
-            doc_row = cursor.fetchone()
-            cursor.close()
-
+        for idx in top_idx:
+            doc_row = doc_rows[idx]
             document = Document(id=doc_row[0], text=doc_row[1],
                                 word_count=doc_row[2],
                                 metadata=json.loads(doc_row[3]))
@@ -222,6 +228,56 @@ class SQLiteStore(Store):
 
         return results
 
+    def _fetch_documents(self, doc_ids: List[str]) -> List[tuple]:
+        """Fetch document rows in batches instead of one query per id."""
+        rows = []
+        # Stay below SQLITE_MAX_VARIABLE_NUMBER of older sqlite builds.
+        batch_size = 900
+        with self.conn:
+            for start in range(0, len(doc_ids), batch_size):
+                batch = doc_ids[start:start + batch_size]
+                placeholders = ','.join('?' * len(batch))
+                cursor = self.conn.cursor()
+                cursor.execute(
+                    f'SELECT * FROM documents WHERE id IN ({placeholders})',
+                    batch)
+                rows.extend(cursor.fetchall())
+                cursor.close()
+        return rows
+
+    def _compute_bm25_scores(self, query_words: List[str], doc_texts: List[str],
+                             inverted_index: Dict[str, List[str]],
+                             total_doc_count: int,
+                             total_word_count: int) -> np.ndarray:
+        """Batch version of `compute_bm25`, tokenizing the query only once."""
+        query_counter = Counter(term for term in query_words
+                                if term in inverted_index)
+        scores = np.zeros(len(doc_texts), dtype=np.float64)
+        if not query_counter:
+            return scores
+        terms = list(query_counter)
+        term_pos = {term: i for i, term in enumerate(terms)}
+
+        tf = np.zeros((len(doc_texts), len(terms)), dtype=np.float64)
+        doc_lengths = np.empty(len(doc_texts), dtype=np.float64)
+        for row, doc_text in enumerate(doc_texts):
+            doc_words = jieba.lcut(doc_text)
+            doc_lengths[row] = len(doc_words)
+            for word in doc_words:
+                col = term_pos.get(word)
+                if col is not None:
+                    tf[row, col] += 1
+
+        df = np.array([len(inverted_index[term]) for term in terms],
+                      dtype=np.float64)
+        idf = np.log((total_doc_count - df + 0.5) / (df + 0.5) + 1)
+        weights = idf * np.array([query_counter[term] for term in terms],
+                                 dtype=np.float64)
+        avg_doc_length = total_word_count / total_doc_count
+        norm = self.k1 * (1 - self.b + self.b * doc_lengths / avg_doc_length)
+        scores = (tf * (self.k1 + 1) / (tf + norm[:, None])) @ weights
+        return scores
+
     @staticmethod
     def to_documents(query_result) -> List[Document]:
         """Convert the query results of sqlite to the agentUniverse(aU) document format."""
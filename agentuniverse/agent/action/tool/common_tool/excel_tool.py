@@ -7,9 +7,15 @@
 # @FileName: excel_tool.py
 
 import os
+import re
 import json
 import asyncio
-from typing import Optional, List, Dict, Any, Union
+import datetime
+import threading
+import zipfile
+from collections import OrderedDict
+from itertools import islice
+from typing import Optional, List, Dict, Any, Literal, Union
 from enum import Enum
 from dataclasses import dataclass
 from pydantic import Field
@@ -19,6 +25,17 @@ from agentuniverse.base.annotation.retry import retry
 from agentuniverse.base.util.logging.logging_util import LOGGER
 
 
+# System directories that the tool refuses to touch, matched as path prefixes.
+FORBIDDEN_DIRS = ('/etc', '/sys', '/proc', '/dev', '/boot', '/root',
+                  'C:\\Windows', 'C:\\System32', '/System', '/Library')
+_FORBIDDEN_DIR_PATTERN = re.compile('|'.join(re.escape(d) for d in FORBIDDEN_DIRS))
+# Active sheet index in xl/workbook.xml (<workbookView activeTab="N"/>).
+_ACTIVE_TAB_PATTERN = re.compile(rb'<(?:\w+:)?workbookView\b[^>]*?\sactiveTab="(\d+)"')
+# Sheet names xlsxwriter accepts: 1-31 chars, none of []:*?/\ and no leading
+# or trailing apostrophe. openpyxl only warns about longer names.
+_XLSXWRITER_SHEET_NAME_PATTERN = re.compile(r"(?!')[^\[\]:*?/\\]{1,31}(?<!')")
+
+
 class ExcelMode(Enum):
     """Excel operation modes"""
     READ = "read"
@@ -62,6 +79,17 @@ class ExcelTool(Tool):
     max_read_size: int = Field(50 * 1024 * 1024, description="Maximum file size for reading (50MB)")
     max_write_size: int = Field(10 * 1024 * 1024, description="Maximum file size for writing (10MB)")
     allowed_extensions: List[str] = Field(default_factory=lambda: ['.xlsx', '.xls'], description="Allowed file extensions")
+    write_engine: Literal["auto", "xlsxwriter", "openpyxl"] = Field(
+        "auto", description="Engine for write mode: 'xlsxwriter', 'openpyxl', or 'auto' (xlsxwriter when "
+                            "installed and it accepts the sheet name, else openpyxl)")
+    sheet_cache_max_cells: int = Field(200_000, description="Total cells of fully read sheets kept for reuse; "
+                                                            "0 disables the cache")
+    sheet_cache: OrderedDict = Field(default_factory=OrderedDict, exclude=True,
+                                     description="(cell count, parsed sheet) keyed by path, sheet name, "
+                                                 "mtime and size, least recently used first. create_copy() "
+                                                 "is shallow, so every copy of the tool shares this cache.")
+    sheet_cache_lock: Any = Field(default_factory=threading.Lock, exclude=True,
+                                  description="Guards sheet_cache across copies and worker threads.")
 
     def _validate_path(self, file_path: str) -> Dict[str, Any]:
         """
@@ -74,17 +102,14 @@ class ExcelTool(Tool):
             Dict with 'valid' bool and optional 'error' message
         """
         # 1. Check for system sensitive directories
-        forbidden_dirs = ['/etc', '/sys', '/proc', '/dev', '/boot', '/root',
-                         'C:\\Windows', 'C:\\System32', '/System', '/Library']
-
         abs_path = os.path.abspath(file_path)
 
-        for forbidden in forbidden_dirs:
-            if abs_path.startswith(forbidden):
-                return {
-                    "valid": False,
-                    "error": f"Access denied: Cannot access system directory {forbidden}"
-                }
+        forbidden = _FORBIDDEN_DIR_PATTERN.match(abs_path)
+        if forbidden:
+            return {
+                "valid": False,
+                "error": f"Access denied: Cannot access system directory {forbidden.group(0)}"
+            }
 
         # 2. Prevent path traversal
         normalized = os.path.normpath(file_path)
@@ -135,20 +160,94 @@ class ExcelTool(Tool):
 
         Args:
             file_path: Path to Excel file
-            sheet_name: Sheet name to read (default: first sheet)
+            sheet_name: Sheet name to read (default: active sheet)
             max_rows: Maximum rows to read (default: all)
 
         Returns:
             Dict with status, data, and metadata
         """
+        try:
+            stat = os.stat(file_path)
+            key = (os.path.abspath(file_path), sheet_name, stat.st_mtime_ns, stat.st_size)
+            sheet = self._get_cached_sheet(key)
+            if sheet is None:
+                # A limited read stops parsing after max_rows and is not cached;
+                # only full reads are kept for reuse.
+                sheet = self._load_sheet(file_path, sheet_name, max_rows)
+                if "error" in sheet:
+                    return dict(sheet)
+                if not max_rows:
+                    self._cache_sheet(key, sheet)
+
+            rows = sheet["rows"][:max_rows] if max_rows else sheet["rows"]
+            data = [list(row) for row in rows]
+
+            return {
+                "status": "success",
+                "file_path": file_path,
+                "sheet_name": sheet["sheet_name"],
+                "rows_read": len(data),
+                "columns": len(data[0]) if data else 0,
+                "data": data,
+                "total_rows": sheet["total_rows"],
+                "total_columns": sheet["total_columns"]
+            }
+
+        except ImportError:
+            raise
+        except Exception as e:
+            LOGGER.error(f"Error reading Excel file: {str(e)}")
+            return {
+                "status": "error",
+                "error": f"Failed to read Excel file: {str(e)}",
+                "file_path": file_path
+            }
+
+    def _get_cached_sheet(self, key: tuple) -> Optional[Dict[str, Any]]:
+        """Return the parsed sheet cached under key and mark it recently used."""
+        with self.sheet_cache_lock:
+            cached = self.sheet_cache.get(key)
+            if cached is None:
+                return None
+            self.sheet_cache.move_to_end(key)
+            return cached[1]
+
+    def _cache_sheet(self, key: tuple, sheet: Dict[str, Any]) -> None:
+        """Cache a parsed sheet, evicting least recently used sheets over budget.
+
+        The key holds the file's modification time and size, so a rewritten
+        file misses the cache and its stale entry ages out.
+        """
+        cells = sum(len(row) for row in sheet["rows"])
+        if self.sheet_cache_max_cells <= 0 or cells > self.sheet_cache_max_cells:
+            return
+        with self.sheet_cache_lock:
+            self.sheet_cache[key] = (cells, sheet)
+            total = sum(cached_cells for cached_cells, _ in self.sheet_cache.values())
+            while total > self.sheet_cache_max_cells:
+                _, (evicted_cells, _) = self.sheet_cache.popitem(last=False)
+                total -= evicted_cells
+
+    @staticmethod
+    def _load_sheet(file_path: str, sheet_name: Optional[str] = None,
+                    max_rows: Optional[int] = None) -> Dict[str, Any]:
+        """Parse a sheet with calamine when it can match openpyxl, else openpyxl."""
+        sheet = ExcelTool._read_sheet_calamine(file_path, sheet_name, max_rows)
+        if sheet is None:
+            sheet = ExcelTool._read_sheet_openpyxl(file_path, sheet_name, max_rows)
+        return sheet
+
+    @staticmethod
+    def _read_sheet_openpyxl(file_path: str, sheet_name: Optional[str] = None,
+                             max_rows: Optional[int] = None) -> Dict[str, Any]:
+        """Read up to max_rows rows of a sheet with openpyxl in read-only mode."""
         try:
             import openpyxl
         except ImportError:
             raise ImportError("openpyxl is required. Install with: pip install openpyxl")
 
+        workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
         try:
-            workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
-
             # Select sheet
             if sheet_name:
                 if sheet_name not in workbook.sheetnames:
@@ -160,36 +259,96 @@ class ExcelTool(Tool):
             else:
                 sheet = workbook.active
 
-            # Read data
-            data = []
-            row_count = 0
-            for row in sheet.iter_rows(values_only=True):
-                if max_rows and row_count >= max_rows:
-                    break
-                data.append(list(row))
-                row_count += 1
-
-            workbook.close()
-
             return {
-                "status": "success",
-                "file_path": file_path,
                 "sheet_name": sheet.title,
-                "rows_read": len(data),
-                "columns": len(data[0]) if data else 0,
-                "data": data,
+                "rows": tuple(islice(sheet.iter_rows(values_only=True), max_rows or None)),
                 "total_rows": sheet.max_row,
                 "total_columns": sheet.max_column
             }
+        finally:
+            workbook.close()
+
+    @staticmethod
+    def _read_sheet_calamine(file_path: str, sheet_name: Optional[str] = None,
+                             max_rows: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Read up to max_rows rows of a sheet with the native python-calamine parser.
+
+        Returns None when python-calamine is not installed, cannot parse the
+        file, or cannot tell which sheet openpyxl would treat as active, so the
+        caller falls back to openpyxl.
+        """
+        try:
+            from python_calamine import CalamineWorkbook
+        except ImportError:
+            return None
+
+        try:
+            workbook = CalamineWorkbook.from_path(file_path)
+            if sheet_name:
+                if sheet_name not in workbook.sheet_names:
+                    return {
+                        "status": "error",
+                        "error": f"Sheet '{sheet_name}' not found. Available: {workbook.sheet_names}"
+                    }
+                sheet = workbook.get_sheet_by_name(sheet_name)
+            else:
+                active_index = ExcelTool._active_sheet_index(file_path)
+                if active_index is None or active_index >= len(workbook.sheet_names):
+                    return None
+                sheet = workbook.get_sheet_by_index(active_index)
+
+            # iter_rows yields rows from the first row of the sheet but starts
+            # each one at the first used column; pad it back to column A.
+            padding = [None] * (sheet.start[1] if sheet.start else 0)
+            rows = tuple(tuple(padding + [ExcelTool._normalize_calamine_value(value) for value in row])
+                         for row in islice(sheet.iter_rows(), max_rows or None))
 
-        except Exception as e:
-            LOGGER.error(f"Error reading Excel file: {str(e)}")
             return {
-                "status": "error",
-                "error": f"Failed to read Excel file: {str(e)}",
-                "file_path": file_path
+                "sheet_name": sheet.name,
+                "rows": rows,
+                # openpyxl reports the used range from A1, as does sheet.end.
+                "total_rows": sheet.end[0] + 1 if sheet.end else 1,
+                "total_columns": sheet.end[1] + 1 if sheet.end else 1
             }
 
+        except Exception as e:
+            LOGGER.warn(f"Calamine failed to read {file_path}, falling back to openpyxl: {str(e)}")
+            return None
+
+    @staticmethod
+    def _active_sheet_index(file_path: str) -> Optional[int]:
+        """
+        Index of the sheet openpyxl's workbook.active would return.
+
+        For .xlsx this is the activeTab of the first workbook view (0 when
+        unset). Returns None when the workbook part is not where openpyxl
+        reads it from. .xls is not readable by openpyxl, so calamine's first
+        sheet is used.
+        """
+        if os.path.splitext(file_path)[1].lower() == '.xls':
+            return 0
+        try:
+            with zipfile.ZipFile(file_path) as archive:
+                workbook_xml = archive.read('xl/workbook.xml')
+        except (KeyError, zipfile.BadZipFile):
+            return None
+        match = _ACTIVE_TAB_PATTERN.search(workbook_xml)
+        return int(match.group(1)) if match else 0
+
+    @staticmethod
+    def _normalize_calamine_value(value: Any) -> Any:
+        """Map calamine cell values onto what openpyxl returns for the same cell."""
+        # Calamine reports empty cells as "", every number as float and
+        # date-only cells as date; openpyxl gives None, int and datetime.
+        if value == "":
+            return None
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        if isinstance(value, datetime.date) and not isinstance(value, datetime.datetime):
+            return datetime.datetime.combine(value, datetime.time())
+        return value
+
     @retry(3, 1.0)
     def _write_excel(self, file_path: str, data: List[List[Any]],
                     sheet_name: str = "Sheet1", overwrite: bool = False) -> Dict[str, Any]:
@@ -224,21 +383,16 @@ class ExcelTool(Tool):
             if directory and not os.path.exists(directory):
                 os.makedirs(directory, exist_ok=True)
 
-            # Create workbook and write data
-            workbook = openpyxl.Workbook()
-            sheet = workbook.active
-            sheet.title = sheet_name
-
-            for row_data in data:
-                sheet.append(row_data)
-
-            # Apply basic formatting to header row
-            if data:
-                for cell in sheet[1]:
-                    cell.font = openpyxl.styles.Font(bold=True)
-
-            workbook.save(file_path)
-            workbook.close()
+            existed = os.path.exists(file_path)
+            try:
+                if not self._write_rows_xlsxwriter(file_path, data, sheet_name):
+                    self._write_rows_openpyxl(file_path, data, sheet_name)
+            except Exception:
+                # Do not leave a partial workbook behind, or a retry with
+                # overwrite=False would report that the file already exists.
+                if not existed and os.path.exists(file_path):
+                    os.remove(file_path)
+                raise
 
             file_size = os.path.getsize(file_path)
 
@@ -260,6 +414,65 @@ class ExcelTool(Tool):
                 "file_path": file_path
             }
 
+    def _write_rows_xlsxwriter(self, file_path: str, data: List[List[Any]], sheet_name: str) -> bool:
+        """
+        Write rows with xlsxwriter in constant_memory mode, flushing each row
+        to disk as it is written.
+
+        Returns False when the openpyxl engine should be used instead.
+        """
+        if self.write_engine == "openpyxl":
+            return False
+        try:
+            import xlsxwriter
+        except ImportError:
+            if self.write_engine == "xlsxwriter":
+                raise ImportError("xlsxwriter is required. Install with: pip install xlsxwriter")
+            return False
+
+        if not _XLSXWRITER_SHEET_NAME_PATTERN.fullmatch(sheet_name):
+            if self.write_engine == "xlsxwriter":
+                raise ValueError(f"xlsxwriter cannot write sheet name '{sheet_name}': names must be 1-31 "
+                                 f"characters without []:*?/\\ or a leading or trailing apostrophe")
+            return False
+
+        # The file is only created by close(), so a failed write leaves
+        # nothing at file_path.
+        workbook = xlsxwriter.Workbook(file_path, {'constant_memory': True, 'strings_to_urls': False})
+        sheet = workbook.add_worksheet(sheet_name)
+        bold = workbook.add_format({'bold': True})
+        for row_index, row_data in enumerate(data):
+            sheet.write_row(row_index, 0, row_data, bold if row_index == 0 else None)
+        workbook.close()
+        return True
+
+    @staticmethod
+    def _write_rows_openpyxl(file_path: str, data: List[List[Any]], sheet_name: str) -> None:
+        """Write rows through an openpyxl write-only workbook."""
+        import openpyxl
+        from openpyxl.cell import WriteOnlyCell
+
+        # Stream rows through a write-only workbook so no cell tree is
+        # kept in memory; the header row is emitted as bold cells.
+        workbook = openpyxl.Workbook(write_only=True)
+        sheet = workbook.create_sheet(title=sheet_name)
+
+        rows = iter(data)
+        header = next(rows, None)
+        if header is not None:
+            bold = openpyxl.styles.Font(bold=True)
+            header_cells = []
+            for value in header:
+                cell = WriteOnlyCell(sheet, value=value)
+                cell.font = bold
+                header_cells.append(cell)
+            sheet.append(header_cells)
+        for row_data in rows:
+            sheet.append(row_data)
+
+        workbook.save(file_path)
+        workbook.close()
+
     @retry(3, 1.0)
     def _append_excel(self, file_path: str, data: List[List[Any]],
                      sheet_name: Optional[str] = None) -> Dict[str, Any]:
@@ -454,8 +667,9 @@ class ExcelTool(Tool):
                         "file_path": file_path
                     })
 
-                # Check data size
-                data_size = len(json.dumps(data).encode('utf-8'))
+                # Check data size. json.dumps escapes non-ASCII by default, so
+                # the string length already equals its UTF-8 byte length.
+                data_size = len(json.dumps(data))
                 if data_size > self.max_write_size:
                     return json.dumps({
                         "status": "error",
@@ -109,20 +109,24 @@ class PubMedTool(Tool):
             raise ValueError("page and max_results cannot address records beyond PubMed's first 9,999 results")
 
         try:
-            search_data = self._search(
-                query,
-                max_results,
-                retstart,
-                normalized_sort,
-                normalized_mindate,
-                normalized_maxdate,
-                normalized_datetype,
-            )
-            search_result = search_data.get("esearchresult", {})
-            pmids = search_result.get("idlist", [])
-            total_results = int(search_result.get("count", 0))
-
-            papers = self._fetch_articles(pmids) if pmids else []
+            # ESearch and EFetch hit the same host, so one session lets the
+            # second call reuse the pooled keep-alive connection.
+            with requests.Session() as session:
+                search_data = self._search(
+                    session,
+                    query,
+                    max_results,
+                    retstart,
+                    normalized_sort,
+                    normalized_mindate,
+                    normalized_maxdate,
+                    normalized_datetype,
+                )
+                search_result = search_data.get("esearchresult", {})
+                pmids = search_result.get("idlist", [])
+                total_results = int(search_result.get("count", 0))
+
+                papers = self._fetch_articles(session, pmids) if pmids else []
             return {
                 "query": query,
                 "max_results": max_results,
@@ -206,6 +210,7 @@ class PubMedTool(Tool):
 
     def _search(
         self,
+        session: requests.Session,
         query: str,
         max_results: int,
         retstart: int,
@@ -230,7 +235,7 @@ class PubMedTool(Tool):
             if maxdate:
                 params["maxdate"] = maxdate
 
-        response = requests.get(
+        response = session.get(
             f"{self.base_url}/esearch.fcgi",
             params=params,
             timeout=self.timeout,
@@ -305,8 +310,8 @@ class PubMedTool(Tool):
             day = 1
         return date(year, month, day)
 
-    def _fetch_articles(self, pmids: List[str]) -> List[Dict[str, Any]]:
-        response = requests.get(
+    def _fetch_articles(self, session: requests.Session, pmids: List[str]) -> List[Dict[str, Any]]:
+        response = session.get(
             f"{self.base_url}/efetch.fcgi",
             params={
                 **self._common_params(),
@@ -34,7 +34,9 @@ connection: tests stub :meth:`_get_ticker` and feed fixed dicts to the pure
 formatters.
 """
 
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
 from pydantic import Field
 
@@ -89,6 +91,25 @@ class YahooFinanceTool(Tool):
                     "truncated to keep the agent context compact.",
     )
 
+    response_cache_ttl: float = Field(
+        0.0,
+        description="Seconds a fetched payload is reused for the same mode and "
+                    "symbol (and period / interval in history mode). 0 "
+                    "disables caching, so every call hits Yahoo Finance.",
+    )
+    response_cache_max_entries: int = Field(
+        256,
+        description="Upper bound on cached payloads. Expired entries are "
+                    "dropped first, then the oldest ones.",
+    )
+    response_cache: Dict[Tuple[str, ...], Tuple[float, Any]] = Field(
+        default_factory=dict, exclude=True,
+        description="Fetched payloads keyed by request, with their expiry. "
+                    "create_copy() is shallow, so every copy shares it.")
+    response_cache_lock: Any = Field(
+        default_factory=threading.Lock, exclude=True,
+        description="Guards response_cache across copies and worker threads.")
+
     # ------------------------------------------------------------------ #
     # Public entry point
     # ------------------------------------------------------------------ #
@@ -119,13 +140,12 @@ class YahooFinanceTool(Tool):
                     "Must be one of: quote, history, info.")
 
         try:
-            ticker = self._get_ticker(symbol)
+            payload = self._fetch_cached(mode, symbol, period, interval)
             if mode == "quote":
-                return self._format_quote(symbol, self._fetch_quote(ticker))
+                return self._format_quote(symbol, payload)
             if mode == "info":
-                return self._format_info(symbol, self._fetch_info(ticker))
-            return self._format_history(
-                symbol, self._fetch_history(ticker, period=period, interval=interval))
+                return self._format_info(symbol, payload)
+            return self._format_history(symbol, payload)
         except ImportError:
             return ("Error: yfinance is required. "
                     "Install it with: pip install yfinance")
@@ -136,6 +156,44 @@ class YahooFinanceTool(Tool):
     # Data fetching (network) — lazy yfinance import, isolated for testing
     # ------------------------------------------------------------------ #
 
+    def _fetch_cached(self, mode: str, symbol: str, period: str, interval: str) -> Any:
+        """Fetch the payload for ``mode``, reusing it within the cache TTL."""
+        key = (mode, symbol, period, interval) if mode == "history" else (mode, symbol)
+        now = time.monotonic()
+        if self.response_cache_ttl > 0:
+            with self.response_cache_lock:
+                cached = self.response_cache.get(key)
+                if cached is not None:
+                    if cached[0] > now:
+                        return cached[1]
+                    del self.response_cache[key]
+
+        ticker = self._get_ticker(symbol)
+        if mode == "quote":
+            payload = self._fetch_quote(ticker)
+        elif mode == "info":
+            payload = self._fetch_info(ticker)
+        else:
+            payload = self._fetch_history(ticker, period=period, interval=interval)
+
+        if self.response_cache_ttl > 0:
+            self._store_cached(key, payload, now)
+        return payload
+
+    def _store_cached(self, key: Tuple[str, ...], payload: Any, now: float) -> None:
+        """Cache ``payload``, evicting expired and then the oldest entries."""
+        if self.response_cache_max_entries <= 0:
+            return
+        cache = self.response_cache
+        with self.response_cache_lock:
+            for stale in [k for k, (expires_at, _) in cache.items() if expires_at <= now]:
+                del cache[stale]
+            cache.pop(key, None)
+            while len(cache) >= self.response_cache_max_entries:
+                # Dicts keep insertion order, so the first key is the oldest entry.
+                del cache[next(iter(cache))]
+            cache[key] = (now + self.response_cache_ttl, payload)
+
     def _get_ticker(self, symbol: str):
         """Return a ``yfinance.Ticker`` for the symbol (lazy import)."""
         import yfinance  # noqa: WPS433 - lazy on purpose
@@ -153,9 +211,12 @@ class YahooFinanceTool(Tool):
         df = ticker.history(period=period, interval=interval)
         if df is None or getattr(df, "empty", True):
             return []
-        # Reset the date index into a column, then take the most recent rows.
+        # Keep only the most recent rows before converting, so a multi-year
+        # history is not boxed cell by cell just to be cut down to a page.
+        df = df.tail(self.max_history_rows)
+        # Reset the date index into a column, newest row first.
         rows = df.reset_index().rename(columns=str.lower).to_dict(orient="records")
-        return rows[::-1][:self.max_history_rows]
+        return rows[::-1]
 
     @retry(3, 1.0)
     def _fetch_info(self, ticker) -> Dict[str, Any]:
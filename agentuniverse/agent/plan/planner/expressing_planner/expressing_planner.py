@@ -37,11 +37,12 @@ class ExpressingPlanner(Planner):
         llm: LLM = self.handle_llm(agent_model)
 
         prompt: Prompt = self.handle_prompt(agent_model, planner_input)
-        process_llm_token(llm, prompt.as_langchain(), agent_model.profile, planner_input)
+        lc_prompt = prompt.as_langchain()
+        process_llm_token(llm, lc_prompt, agent_model.profile, planner_input)
 
         assemble_memory_input(memory, planner_input)
 
-        chain = prompt.as_langchain() | llm.as_langchain_runnable(agent_model.llm_params()) | StrOutputParser()
+        chain = lc_prompt | llm.as_langchain_runnable(agent_model.llm_params()) | StrOutputParser()
         res = self.invoke_chain(agent_model, chain, planner_input, None, input_object)
 
         assemble_memory_output(memory=memory,
@@ -60,12 +60,13 @@ class ReActPlanner(Planner):
         llm: LLM = self.handle_llm(agent_model)
         tools = self.acquire_tools(agent_model.action)
         prompt: Prompt = self.handle_prompt(agent_model, planner_input)
-        process_llm_token(llm, prompt.as_langchain(), agent_model.profile, planner_input)
+        lc_prompt = prompt.as_langchain()
+        process_llm_token(llm, lc_prompt, agent_model.profile, planner_input)
         assemble_memory_input(memory, planner_input)
         stop_sequence = []
         if agent_model.plan.get('stop_sequence'):
             stop_sequence = agent_model.profile.get('stop_sequence')
-        agent = create_react_agent(llm.as_langchain(), tools, prompt.as_langchain(), stop_sequence=stop_sequence,
+        agent = create_react_agent(llm.as_langchain(), tools, lc_prompt, stop_sequence=stop_sequence,
                                    bind_params=agent_model.llm_params())
         agent_executor = AgentExecutor(agent=agent, tools=tools,
                                        verbose=True,
@@ -41,13 +41,13 @@ class ContextualIterationAgentTemplate(AgentTemplate):
     def customized_execute(self, input_object: InputObject, agent_input: dict, memory: Memory, llm: LLM, prompt: Prompt,
                            **kwargs) -> dict:
         assemble_memory_input(memory, agent_input)
-        process_llm_token(llm, prompt.as_langchain(), self.agent_model.profile,
+        lc_prompt_template = prompt.as_langchain()
+        process_llm_token(llm, lc_prompt_template, self.agent_model.profile,
                           agent_input)
         conversation_history = []
         combined_res = ''
 
         # first llm call step
-        lc_prompt_template = prompt.as_langchain()
         prompt_input_dict = {key: agent_input[key] for key in lc_prompt_template.input_variables
                              if key in agent_input}
 
@@ -111,13 +111,13 @@ class ContextualIterationAgentTemplate(AgentTemplate):
                                        prompt: Prompt, **kwargs) -> dict:
 
         assemble_memory_input(memory, agent_input)
-        process_llm_token(llm, prompt.as_langchain(), self.agent_model.profile,
+        lc_prompt_template = prompt.as_langchain()
+        process_llm_token(llm, lc_prompt_template, self.agent_model.profile,
                           agent_input)
         conversation_history = []
         combined_res = ''
 
         # first llm call step
-        lc_prompt_template = prompt.as_langchain()
         prompt_input_dict = {key: agent_input[key] for key in
                              lc_prompt_template.input_variables
                              if key in agent_input}
@@ -103,9 +103,10 @@ class ExecutingAgentTemplate(AgentTemplate):
             agent_input_copy['background'] = f"knowledge result: {knowledge_res} \n\n tools result: {tools_res}"
             agent_input_copy['input'] = subtask
 
-            process_llm_token(llm, prompt.as_langchain(), self.agent_model.profile, agent_input_copy)
+            lc_prompt = prompt.as_langchain()
+            process_llm_token(llm, lc_prompt, self.agent_model.profile, agent_input_copy)
             self.load_memory(memory, agent_input_copy)
-            chain = prompt.as_langchain() | llm.as_langchain_runnable(
+            chain = lc_prompt | llm.as_langchain_runnable(
                 self.agent_model.llm_params()) | StrOutputParser()
             res = self.invoke_chain(chain, agent_input_copy, input_object_copy)
             self.add_memory(memory, f"Human: {agent_input.get('input')}, AI: {res}", agent_input=agent_input)
@@ -62,9 +62,10 @@ class ReActAgentTemplate(AgentTemplate):
     def customized_execute(self, input_object: InputObject, agent_input: dict, memory: Memory, llm: LLM, prompt: Prompt,
                            **kwargs) -> dict:
         self.load_memory(memory, agent_input)
-        process_llm_token(llm, prompt.as_langchain(), self.agent_model.profile, agent_input)
+        lc_prompt = prompt.as_langchain()
+        process_llm_token(llm, lc_prompt, self.agent_model.profile, agent_input)
         lc_tools: List[LangchainTool] = self._convert_to_langchain_tool()
-        agent = self.create_react_agent(llm.as_langchain(), lc_tools, prompt.as_langchain(),
+        agent = self.create_react_agent(llm.as_langchain(), lc_tools, lc_prompt,
                                         stop_sequence=self.stop_sequence,
                                         bind_params=self.agent_model.llm_params())
         agent_executor = AgentExecutor(agent=agent, tools=lc_tools,
@@ -82,9 +83,10 @@ class ReActAgentTemplate(AgentTemplate):
     async def customized_async_execute(self, input_object: InputObject, agent_input: dict, memory: Memory,
                                        llm: LLM, prompt: Prompt, **kwargs) -> dict:
         self.load_memory(memory, agent_input)
-        process_llm_token(llm, prompt.as_langchain(), self.agent_model.profile, agent_input)
+        lc_prompt = prompt.as_langchain()
+        process_llm_token(llm, lc_prompt, self.agent_model.profile, agent_input)
         lc_tools: List[LangchainTool] = await self._async_convert_to_langchain_tool()
-        agent = self.create_react_agent(llm.as_langchain(), lc_tools, prompt.as_langchain(),
+        agent = self.create_react_agent(llm.as_langchain(), lc_tools, lc_prompt,
                                         stop_sequence=self.stop_sequence,
                                         bind_params=self.agent_model.llm_params())
         agent_executor = AgentExecutor(agent=agent, tools=lc_tools,
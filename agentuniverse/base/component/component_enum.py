@@ -47,7 +47,8 @@ class ComponentEnum(Enum):
     @staticmethod
     def from_value(value):
         """Return the enum member corresponding to the given value."""
-        for item in ComponentEnum:
-            if item.value == value:
-                return item
-        raise ValueError(f"No enum member with value {value}")
+        # Enum's own by-value lookup is a dict hit rather than a member scan.
+        try:
+            return ComponentEnum(value)
+        except ValueError:
+            raise ValueError(f"No enum member with value {value}") from None
@@ -14,6 +14,9 @@ import yaml
 from agentuniverse.base.annotation.singleton import singleton
 from agentuniverse.base.config.config_type_enum import ConfigTypeEnum
 
+# Prefer the libyaml-backed loader when PyYAML was built with it.
+_YAML_SAFE_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 @singleton
 class PlaceholderResolver:
@@ -199,6 +202,6 @@ class Configer(object):
             dict: the value of the yaml file
         """
         with open(path, 'r', encoding='utf-8') as stream:
-            config_data = yaml.safe_load(stream)
+            config_data = yaml.load(stream, Loader=_YAML_SAFE_LOADER)
         config_data = PlaceholderResolver().resolve(config_data)
         return config_data
@@ -25,9 +25,11 @@ class FrameworkContextManager:
 
     @property
     def context_dict(self) -> dict:
-        if not self.__context_dict.get(None):
-            self.__context_dict.set({})
-        return self.__context_dict.get({})
+        context_dict = self.__context_dict.get(None)
+        if not context_dict:
+            context_dict = {}
+            self.__context_dict.set(context_dict)
+        return context_dict
 
     def is_context_exist(self, var_name: str) -> bool:
         """Judge whether context variable exist in current context.
@@ -50,11 +52,14 @@ class FrameworkContextManager:
             var_value (`Any`):
                 Value of the context variable.
         """
-        if var_name not in self.context_dict:
+        context_dict = self.context_dict
+        context_var = context_dict.get(var_name)
+        if context_var is None:
             with self.__dict_edit_lock:
-                if var_name not in self.context_dict:
-                    self.context_dict[var_name] = ContextVar(var_name)
-        return self.context_dict[var_name].set(var_value)
+                context_var = context_dict.get(var_name)
+                if context_var is None:
+                    context_var = context_dict[var_name] = ContextVar(var_name)
+        return context_var.set(var_value)
 
     def get_context(self,
                     var_name: str,
@@ -67,9 +72,10 @@ class FrameworkContextManager:
             default_value (`Any`, defaults to `None`):
                 Value to be returned if target context variable doesn't exist.
         """
-        if var_name not in self.context_dict:
+        context_var = self.context_dict.get(var_name)
+        if context_var is None:
             return default_value
-        return self.context_dict[var_name].get(default_value)
+        return context_var.get(default_value)
 
     def del_context(self, var_name: str, force: bool = False):
         """Set a context variable to None.
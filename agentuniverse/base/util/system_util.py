@@ -6,6 +6,7 @@
 # @Email   : fanen.lhy@antgroup.com
 # @FileName: system_util.py
 import ast
+import functools
 import inspect
 import os
 from pathlib import Path
@@ -100,6 +101,24 @@ def get_module_path(yaml_path: str, root_name: str) -> str:
     return module_path
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_yaml_func_call(func_expr: str) -> ast.Call:
+    """Parse and validate the inner call of an @FUNC expression.
+
+    The same expressions recur across many yaml configs, so the parsed call
+    node is cached by expression string. Failed parses raise and are not cached.
+    """
+    try:
+        parsed_expr = ast.parse(func_expr, mode='eval')
+    except SyntaxError as e:
+        raise ValueError(f"Invalid function expression: {func_expr}. Error: {e}")
+
+    # Ensure the expression is a function call
+    if not isinstance(parsed_expr.body, ast.Call):
+        raise ValueError(f"Expected a function call, got: {func_expr}")
+    return parsed_expr.body
+
+
 def process_yaml_func(func_expr: str, yaml_func_instance: Any) -> str:
     """
     Process the YAML configuration by resolving @FUNC expressions.
@@ -127,19 +146,13 @@ def process_yaml_func(func_expr: str, yaml_func_instance: Any) -> str:
         # Extract the method name and arguments
         func_expr = func_expr[len('@FUNC('):-1]  # Remove '@FUNC(' and ')'
         # Parse the function call expression using AST
-        try:
-            parsed_expr = ast.parse(func_expr, mode='eval')
-        except SyntaxError as e:
-            raise ValueError(f"Invalid function expression: {func_expr}. Error: {e}")
-
-        # Ensure the expression is a function call
-        if not isinstance(parsed_expr.body, ast.Call):
-            raise ValueError(f"Expected a function call, got: {func_expr}")
-
-        # Extract function name and arguments
-        func_name = parsed_expr.body.func.id
-        args = [ast.literal_eval(arg) for arg in parsed_expr.body.args]
-        kwargs = {kw.arg: ast.literal_eval(kw.value) for kw in parsed_expr.body.keywords}
+        call = _parse_yaml_func_call(func_expr)
+
+        # Extract function name and arguments; literals are evaluated per call
+        # so callers never share mutable argument values.
+        func_name = call.func.id
+        args = [ast.literal_eval(arg) for arg in call.args]
+        kwargs = {kw.arg: ast.literal_eval(kw.value) for kw in call.keywords}
 
         # Check if the method exists in the yaml function instance
         if hasattr(yaml_func_instance, func_name):
@@ -17,7 +17,9 @@ class PromptProcessEnum(Enum):
 
     @classmethod
     def from_value(cls, value):
-        for member in cls:
-            if member.value.lower() == value.lower():
-                return member
-        raise ValueError(f"No enum member with value: {value}")
+        # Member values are all lower case, so a by-value lookup of the
+        # lowered input matches case-insensitively without a member scan.
+        try:
+            return cls(value.lower())
+        except ValueError:
+            raise ValueError(f"No enum member with value: {value}") from None
@@ -19,6 +19,56 @@ from agentuniverse.workflow.workflow_output import WorkflowOutput
 class Graph(nx.DiGraph):
     """The basic class of the graph."""
 
+    def __init__(self, incoming_graph_data=None, **attr):
+        # Topological order of the nodes, dropped whenever the structure changes.
+        # Set before super().__init__, which may add incoming nodes and edges.
+        self._sorted_nodes_cache: Optional[list] = None
+        super().__init__(incoming_graph_data, **attr)
+
+    def _invalidate_sorted_nodes(self) -> None:
+        """Drop the cached topological order after a structural change."""
+        self._sorted_nodes_cache = None
+
+    def add_node(self, node_for_adding, **attr):
+        self._invalidate_sorted_nodes()
+        super().add_node(node_for_adding, **attr)
+
+    def add_nodes_from(self, nodes_for_adding, **attr):
+        self._invalidate_sorted_nodes()
+        super().add_nodes_from(nodes_for_adding, **attr)
+
+    def remove_node(self, n):
+        self._invalidate_sorted_nodes()
+        super().remove_node(n)
+
+    def remove_nodes_from(self, nodes):
+        self._invalidate_sorted_nodes()
+        super().remove_nodes_from(nodes)
+
+    def add_edge(self, u_of_edge, v_of_edge, **attr):
+        self._invalidate_sorted_nodes()
+        super().add_edge(u_of_edge, v_of_edge, **attr)
+
+    def add_edges_from(self, ebunch_to_add, **attr):
+        self._invalidate_sorted_nodes()
+        super().add_edges_from(ebunch_to_add, **attr)
+
+    def remove_edge(self, u, v):
+        self._invalidate_sorted_nodes()
+        super().remove_edge(u, v)
+
+    def remove_edges_from(self, ebunch):
+        self._invalidate_sorted_nodes()
+        super().remove_edges_from(ebunch)
+
+    def clear(self):
+        self._invalidate_sorted_nodes()
+        super().clear()
+
+    def clear_edges(self):
+        self._invalidate_sorted_nodes()
+        super().clear_edges()
+
     def build(self, workflow_id: str, config: dict) -> 'Graph':
         """Build the graph."""
         nodes_config = config.get('nodes')
@@ -33,6 +83,7 @@ class Graph(nx.DiGraph):
             self._add_graph_edge(edge_config)
         if not nx.is_directed_acyclic_graph(self):
             raise ValueError("The provided configuration does not form a DAG.")
+        self._sorted_nodes_cache = list(nx.topological_sort(self))
         return self
 
     def _add_graph_node(self, workflow_id: str, node_config: dict) -> None:
@@ -69,7 +120,7 @@ class Graph(nx.DiGraph):
         Args:
             workflow_output: The workflow output.
         """
-        sorted_nodes = list(nx.topological_sort(self))
+        sorted_nodes = self._get_sorted_nodes()
         predecessor_node: Node | None = None
         while True:
             next_node = self._get_next_node(workflow_output, sorted_nodes, predecessor_node)
@@ -83,6 +134,20 @@ class Graph(nx.DiGraph):
                 break
             predecessor_node = next_node
 
+    def _get_sorted_nodes(self) -> list:
+        """Get the topological order of the nodes.
+
+        The order is computed by build() and reused by every run of the
+        workflow; any node or edge mutation drops it, so it is sorted again
+        on the next run.
+
+        Returns:
+            The node ids in topological order.
+        """
+        if self._sorted_nodes_cache is None:
+            self._sorted_nodes_cache = list(nx.topological_sort(self))
+        return self._sorted_nodes_cache
+
     def _get_next_node(self, workflow_output: WorkflowOutput, nodes: Any,
                        predecessor_node: Optional[Node] = None) -> Optional[Node]:
         """Get the next node in the graph.
@@ -27,10 +27,11 @@ class NodeEnum(Enum):
     @staticmethod
     def from_value(value):
         """Return the enum member corresponding to the given value."""
-        for item in NodeEnum:
-            if item.value == value:
-                return item
-        raise ValueError(f"No enum member with value {value}")
+        # Enum's own by-value lookup is a dict hit rather than a member scan.
+        try:
+            return NodeEnum(value)
+        except ValueError:
+            raise ValueError(f"No enum member with value {value}") from None
 
 
 class NodeStatusEnum(Enum):
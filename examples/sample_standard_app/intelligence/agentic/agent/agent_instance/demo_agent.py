@@ -69,7 +69,8 @@ class DemoAgent(AgentTemplate):
                Returns:
                    dict: A dict including key `"output"`, merged with other fields.
                """
-        return {**agent_result, 'output': agent_result['output']}
+        # `customized_execute` already returns a fresh dict carrying "output".
+        return agent_result
 
     def execute(self, input_object: InputObject, agent_input: dict) -> dict:
         """The standard execution pipeline for this agent.
@@ -96,8 +97,8 @@ class DemoAgent(AgentTemplate):
         prompt: Prompt = self.process_prompt(agent_input)
         tool_res: str = self.invoke_tools(input_object)
         knowledge_res: str = self.invoke_knowledge(agent_input.get('input'), input_object)
-        agent_input['background'] = (agent_input['background']
-                                     + f"tool_res: {tool_res} \n\n knowledge_res: {knowledge_res}")
+        agent_input['background'] = (f"{agent_input['background']}"
+                                     f"tool_res: {tool_res} \n\n knowledge_res: {knowledge_res}")
         return self.customized_execute(input_object, agent_input, memory, llm, prompt)
 
     def customized_execute(self, input_object: InputObject, agent_input: dict, memory: Memory, llm: LLM, prompt: Prompt,
@@ -125,8 +126,9 @@ class DemoAgent(AgentTemplate):
                     RuntimeError: If chain invocation fails.
                 """
         assemble_memory_input(memory, agent_input)
-        process_llm_token(llm, prompt.as_langchain(), self.agent_model.profile, agent_input)
-        chain = prompt.as_langchain() | llm.as_langchain_runnable(
+        lc_prompt = prompt.as_langchain()
+        process_llm_token(llm, lc_prompt, self.agent_model.profile, agent_input)
+        chain = lc_prompt | llm.as_langchain_runnable(
             self.agent_model.llm_params()) | ReasoningOutputParser()
         res = self.invoke_chain(chain, agent_input, input_object, **kwargs)
         assemble_memory_output(memory=memory,
@@ -246,6 +246,17 @@ Current task: {{input}}'''
         }
     }
 
+    # Keyword -> domain mapping, checked in order by _extract_domain
+    DOMAIN_KEYWORDS = {
+        'medical': 'medical', 'diagnosis': 'medical', 'symptom': 'medical', 'healthcare': 'medical',
+        'financial': 'financial', 'finance': 'financial', 'stock': 'financial', 'investment': 'financial', 'bank': 'financial',
+        'education': 'education', 'learning': 'education', 'teaching': 'education', 'academic': 'education',
+        'customer_service': 'customer_service', 'service': 'service', 'support': 'customer_service',
+        'legal': 'legal', 'contract': 'legal', 'law': 'legal',
+        'sales': 'sales', 'marketing': 'marketing',
+        'technical': 'technical', 'development': 'technical', 'programming': 'technical', 'technology': 'technical'
+    }
+
     @classmethod
     def generate_prompt_template(cls,
                                 task_description: str,
@@ -329,10 +340,10 @@ Current task: {{input}}'''
         yaml_content = ""
 
         if prompt_model.introduction:
-            yaml_content += f"introduction: {prompt_model.introduction}\n"
+            yaml_content += f"introduction: {cls._quote_yaml_scalar(prompt_model.introduction)}\n"
 
         if prompt_model.target:
-            yaml_content += f"target: {prompt_model.target}\n"
+            yaml_content += f"target: {cls._quote_yaml_scalar(prompt_model.target)}\n"
 
         if prompt_model.instruction:
             # Process multi-line instruction
@@ -341,7 +352,7 @@ Current task: {{input}}'''
                 for line in prompt_model.instruction.split('\n'):
                     yaml_content += f"  {line}\n"
             else:
-                yaml_content += f"instruction: {prompt_model.instruction}\n"
+                yaml_content += f"instruction: {cls._quote_yaml_scalar(prompt_model.instruction)}\n"
 
         # Add metadata
         yaml_content += "metadata:\n"
@@ -354,20 +365,15 @@ Current task: {{input}}'''
 
         return yaml_content
 
+    @staticmethod
+    def _quote_yaml_scalar(value: str) -> str:
+        """Quote a single-line value so characters like ': ' stay plain text in YAML."""
+        return "'" + value.replace("'", "''") + "'"
+
     @classmethod
     def _extract_domain(cls, task_description: str) -> Optional[str]:
         """Extract domain information from task description."""
-        domain_keywords = {
-            'medical': 'medical', 'diagnosis': 'medical', 'symptom': 'medical', 'healthcare': 'medical',
-            'financial': 'financial', 'finance': 'financial', 'stock': 'financial', 'investment': 'financial', 'bank': 'financial',
-            'education': 'education', 'learning': 'education', 'teaching': 'education', 'academic': 'education',
-            'customer_service': 'customer_service', 'service': 'service', 'support': 'customer_service',
-            'legal': 'legal', 'contract': 'legal', 'law': 'legal',
-            'sales': 'sales', 'marketing': 'marketing',
-            'technical': 'technical', 'development': 'technical', 'programming': 'technical', 'technology': 'technical'
-        }
-
-        for keyword, domain in domain_keywords.items():
+        for keyword, domain in cls.DOMAIN_KEYWORDS.items():
             if keyword in task_description:
                 return domain
         return None
@@ -37,6 +37,23 @@ class PromptComplexity(Enum):
     COMPLEX = "complex"
 
 
+# Scenario keywords in priority order; the first scenario with a match wins.
+# Each keyword list is compiled into one alternation so a scenario costs a
+# single scan of the content.
+_SCENARIO_KEYWORD_PATTERNS = tuple(
+    (scenario, re.compile('|'.join(map(re.escape, keywords))))
+    for scenario, keywords in (
+        (PromptScenario.CODE_GENERATION, ['代码', '编程', '开发', 'code', 'programming']),
+        (PromptScenario.ANALYTICAL, ['分析', '数据', '统计', 'analysis', 'data']),
+        (PromptScenario.CREATIVE, ['创意', '创作', 'creative', 'design']),
+        (PromptScenario.REASONING, ['推理', '逻辑', 'reasoning', 'logic']),
+        (PromptScenario.CUSTOMER_SERVICE, ['客服', '服务', 'customer', 'service']),
+        (PromptScenario.EDUCATIONAL, ['教育', '学习', 'education', 'learning']),
+        (PromptScenario.RESEARCH, ['研究', '调查', 'research', 'investigation']),
+    )
+)
+
+
 @dataclass
 class ScenarioContext:
     """Context information for prompt generation.
@@ -196,22 +213,10 @@ class PromptGenerator:
         # Simple keyword-based analysis (can be enhanced with ML models)
         content_lower = content.lower()
         
-        if any(keyword in content_lower for keyword in ['代码', '编程', '开发', 'code', 'programming']):
-            return PromptScenario.CODE_GENERATION
-        elif any(keyword in content_lower for keyword in ['分析', '数据', '统计', 'analysis', 'data']):
-            return PromptScenario.ANALYTICAL
-        elif any(keyword in content_lower for keyword in ['创意', '创作', 'creative', 'design']):
-            return PromptScenario.CREATIVE
-        elif any(keyword in content_lower for keyword in ['推理', '逻辑', 'reasoning', 'logic']):
-            return PromptScenario.REASONING
-        elif any(keyword in content_lower for keyword in ['客服', '服务', 'customer', 'service']):
-            return PromptScenario.CUSTOMER_SERVICE
-        elif any(keyword in content_lower for keyword in ['教育', '学习', 'education', 'learning']):
-            return PromptScenario.EDUCATIONAL
-        elif any(keyword in content_lower for keyword in ['研究', '调查', 'research', 'investigation']):
-            return PromptScenario.RESEARCH
-        else:
-            return PromptScenario.CONVERSATIONAL
+        for scenario, pattern in _SCENARIO_KEYWORD_PATTERNS:
+            if pattern.search(content_lower):
+                return scenario
+        return PromptScenario.CONVERSATIONAL
     
     def _initialize_scenario_templates(self) -> Dict[PromptScenario, Dict[str, str]]:
         """Initialize scenario-specific templates.
@@ -7,6 +7,7 @@
 # @FileName: prompt_toolkit.py
 """Prompt Toolkit module for comprehensive prompt management and optimization."""
 
+import copy
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from agentuniverse.prompt.prompt_model import AgentPromptModel
@@ -252,7 +253,8 @@ class PromptToolkit:
                 for score in quality_scores
             ],
             "overall_score": sum(score.score for score in quality_scores) / len(quality_scores),
-            "recommendations": self.optimizer.suggest_improvements(prompt)
+            # Same as optimizer.suggest_improvements(prompt), without re-running the analysis
+            "recommendations": [suggestion for score in quality_scores for suggestion in score.suggestions]
         }
     
     def batch_generate_prompts(
@@ -268,10 +270,18 @@ class PromptToolkit:
             List[PromptToolkitResult]: List of generation results.
         """
         results = []
+        # Generation is deterministic, so identical requests are generated once.
+        # The dataclass repr covers every field and, unlike the request, is hashable.
+        generated: Dict[str, PromptToolkitResult] = {}
         
         for request in requests:
+            key = repr(request)
+            if key in generated:
+                results.append(copy.deepcopy(generated[key]))
+                continue
             try:
                 result = self.generate_prompt_from_request(request)
+                generated[key] = result
                 results.append(result)
             except Exception as e:
                 # Create error result
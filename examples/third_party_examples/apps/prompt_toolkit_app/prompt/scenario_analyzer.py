@@ -89,6 +89,8 @@ class ScenarioAnalyzer:
         self._complexity_indicators = self._initialize_complexity_indicators()
         self._constraint_patterns = self._initialize_constraint_patterns()
         self._example_patterns = self._initialize_example_patterns()
+        self._constraint_regexes = [re.compile(p, re.IGNORECASE) for p in self._constraint_patterns]
+        self._example_regexes = [re.compile(p, re.IGNORECASE) for p in self._example_patterns]
     
     def analyze_scenario(
         self, 
@@ -410,14 +412,13 @@ class ScenarioAnalyzer:
         """
         constraints = []
         
-        for pattern in self._constraint_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            for match in matches:
+        for regex in self._constraint_regexes:
+            for match in regex.findall(content):
                 constraints.append(ExtractedContext(
                     context_type=ContextType.CONSTRAINTS,
                     value=match,
                     confidence=AnalysisConfidence.HIGH,
-                    source=pattern,
+                    source=regex.pattern,
                     suggestions=["确保约束条件在prompt中得到明确体现"]
                 ))
         
@@ -434,14 +435,13 @@ class ScenarioAnalyzer:
         """
         examples = []
         
-        for pattern in self._example_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            for match in matches:
+        for regex in self._example_regexes:
+            for match in regex.findall(content):
                 examples.append(ExtractedContext(
                     context_type=ContextType.EXAMPLES,
                     value=match,
                     confidence=AnalysisConfidence.MEDIUM,
-                    source=pattern,
+                    source=regex.pattern,
                     suggestions=["考虑在prompt中包含更多具体示例"]
                 ))
         
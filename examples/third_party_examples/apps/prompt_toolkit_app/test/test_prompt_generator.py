@@ -16,9 +16,13 @@ from examples.third_party_examples.apps.prompt_toolkit_app.prompt.prompt_generat
 class TestPromptGenerator(unittest.TestCase):
     """Test cases for PromptGenerator class."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Set up the generator once; it keeps no per-call state."""
+        cls.generator = PromptGenerator()
+    
     def setUp(self):
         """Set up test fixtures."""
-        self.generator = PromptGenerator()
         self.sample_context = ScenarioContext(
             domain="技术",
             user_role="开发者",
@@ -16,9 +16,13 @@ from examples.third_party_examples.apps.prompt_toolkit_app.prompt.prompt_optimiz
 class TestPromptOptimizer(unittest.TestCase):
     """Test cases for PromptOptimizer class."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Set up the optimizer once; it keeps no per-call state."""
+        cls.optimizer = PromptOptimizer()
+    
     def setUp(self):
         """Set up test fixtures."""
-        self.optimizer = PromptOptimizer()
         self.sample_prompt = AgentPromptModel(
             introduction="你是一个助手",
             target="帮助用户解决问题",
@@ -8,7 +8,8 @@
 """Unit tests for prompt toolkit module."""
 
 import unittest
-from unittest.mock import Mock
+from types import SimpleNamespace
+from unittest.mock import patch
 
 from examples.third_party_examples.apps.prompt_toolkit_app.prompt.prompt_generator import PromptScenario, \
     PromptComplexity
@@ -25,10 +26,20 @@ from agentuniverse.prompt.prompt_model import AgentPromptModel
 class TestPromptToolkit(unittest.TestCase):
     """Test cases for PromptToolkit class."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Set up the toolkit once; it keeps no per-call state."""
+        cls.config = PromptToolkitConfig()
+        cls.toolkit = PromptToolkit(cls.config)
+        # Read-only: none of the toolkit calls modify the prompt they are given.
+        cls.basic_prompt = AgentPromptModel(
+            introduction="你是一个助手",
+            target="帮助用户",
+            instruction="回答问题"
+        )
+    
     def setUp(self):
         """Set up test fixtures."""
-        self.config = PromptToolkitConfig()
-        self.toolkit = PromptToolkit(self.config)
         self.sample_request = PromptGenerationRequest(
             scenario_description="我需要一个编程助手",
             content="帮助我写Python代码",
@@ -90,11 +101,7 @@ class TestPromptToolkit(unittest.TestCase):
     
     def test_optimize_existing_prompt(self):
         """Test optimization of existing prompt."""
-        prompt = AgentPromptModel(
-            introduction="你是一个助手",
-            target="帮助用户",
-            instruction="回答问题"
-        )
+        prompt = self.basic_prompt
         
         result = self.toolkit.optimize_existing_prompt(prompt)
         
@@ -106,11 +113,7 @@ class TestPromptToolkit(unittest.TestCase):
     
     def test_optimize_existing_prompt_with_strategies(self):
         """Test optimization with specific strategies."""
-        prompt = AgentPromptModel(
-            introduction="你是一个助手",
-            target="帮助用户",
-            instruction="回答问题"
-        )
+        prompt = self.basic_prompt
         
         strategies = [OptimizationStrategy.CLARITY, OptimizationStrategy.STRUCTURE]
         result = self.toolkit.optimize_existing_prompt(prompt, strategies)
@@ -120,11 +123,7 @@ class TestPromptToolkit(unittest.TestCase):
     
     def test_analyze_prompt_quality(self):
         """Test prompt quality analysis."""
-        prompt = AgentPromptModel(
-            introduction="你是一个助手",
-            target="帮助用户",
-            instruction="回答问题"
-        )
+        prompt = self.basic_prompt
         
         result = self.toolkit.analyze_prompt_quality(prompt)
         
@@ -159,6 +158,25 @@ class TestPromptToolkit(unittest.TestCase):
             self.assertIsInstance(result, PromptToolkitResult)
             self.assertIsInstance(result.generated_prompt, AgentPromptModel)
     
+    def test_batch_generate_prompts_dedup(self):
+        """Test identical requests in a batch are generated once."""
+        requests = [
+            PromptGenerationRequest(
+                scenario_description="编程助手",
+                domain="技术"
+            )
+            for _ in range(10)
+        ]
+        
+        with patch.object(self.toolkit, "generate_prompt_from_request",
+                          wraps=self.toolkit.generate_prompt_from_request) as generate:
+            results = self.toolkit.batch_generate_prompts(requests)
+        
+        self.assertEqual(generate.call_count, 1)
+        self.assertEqual(len(results), 10)
+        self.assertEqual(results[0].generated_prompt, results[9].generated_prompt)
+        self.assertIsNot(results[0], results[9])
+    
     def test_batch_generate_prompts_with_error(self):
         """Test batch generation with error handling."""
         # Create a request that might cause an error
@@ -180,11 +198,7 @@ class TestPromptToolkit(unittest.TestCase):
     
     def test_compare_prompts(self):
         """Test prompt comparison."""
-        prompt1 = AgentPromptModel(
-            introduction="你是一个助手",
-            target="帮助用户",
-            instruction="回答问题"
-        )
+        prompt1 = self.basic_prompt
         
         prompt2 = AgentPromptModel(
             introduction="你是一个专业助手",
@@ -207,65 +221,36 @@ class TestPromptToolkit(unittest.TestCase):
         self.assertIsInstance(result["score_difference"], float)
         self.assertIsInstance(result["detailed_comparison"], dict)
     
-    def test_export_prompt_config_yaml(self):
-        """Test prompt export as YAML."""
-        prompt = AgentPromptModel(
-            introduction="你是一个助手",
-            target="帮助用户",
-            instruction="回答问题"
-        )
-        
-        yaml_config = self.toolkit.export_prompt_config(prompt, "yaml")
-        
-        self.assertIsInstance(yaml_config, str)
-        self.assertIn("introduction:", yaml_config)
-        self.assertIn("target:", yaml_config)
-        self.assertIn("instruction:", yaml_config)
-        self.assertIn("metadata:", yaml_config)
-    
-    def test_export_prompt_config_json(self):
-        """Test prompt export as JSON."""
-        prompt = AgentPromptModel(
-            introduction="你是一个助手",
-            target="帮助用户",
-            instruction="回答问题"
-        )
-        
-        json_config = self.toolkit.export_prompt_config(prompt, "json")
-        
-        self.assertIsInstance(json_config, str)
-        self.assertIn("introduction", json_config)
-        self.assertIn("target", json_config)
-        self.assertIn("instruction", json_config)
-        self.assertIn("metadata", json_config)
+    def test_export_prompt_config(self):
+        """Test prompt export in each supported format."""
+        expected_keys = {
+            "yaml": ["introduction:", "target:", "instruction:", "metadata:"],
+            "json": ["introduction", "target", "instruction", "metadata"],
+        }
+        for format_type, keys in expected_keys.items():
+            with self.subTest(format_type=format_type):
+                config = self.toolkit.export_prompt_config(self.basic_prompt, format_type)
+                
+                self.assertIsInstance(config, str)
+                for key in keys:
+                    self.assertIn(key, config)
     
     def test_export_prompt_config_unsupported_format(self):
         """Test export with unsupported format."""
-        prompt = AgentPromptModel(
-            introduction="你是一个助手",
-            target="帮助用户",
-            instruction="回答问题"
-        )
+        prompt = self.basic_prompt
         
         with self.assertRaises(ValueError):
             self.toolkit.export_prompt_config(prompt, "xml")
     
     def test_generate_recommendations(self):
         """Test recommendations generation."""
-        # Mock analysis result
-        analysis_result = Mock()
-        analysis_result.confidence_score = 0.4
-        analysis_result.suggestions = ["建议1", "建议2"]
+        # Stub analysis result
+        analysis_result = SimpleNamespace(confidence_score=0.4, suggestions=["建议1", "建议2"])
         
-        # Mock optimization result
-        optimization_result = Mock()
-        optimization_result.suggestions = ["优化建议1", "优化建议2"]
+        # Stub optimization result
+        optimization_result = SimpleNamespace(suggestions=["优化建议1", "优化建议2"])
         
-        prompt = AgentPromptModel(
-            introduction="你是一个助手",
-            target="帮助用户",
-            instruction="回答问题"
-        )
+        prompt = self.basic_prompt
         
         recommendations = self.toolkit._generate_recommendations(
             analysis_result,
@@ -278,13 +263,11 @@ class TestPromptToolkit(unittest.TestCase):
     
     def test_calculate_overall_confidence(self):
         """Test overall confidence calculation."""
-        # Mock analysis result
-        analysis_result = Mock()
-        analysis_result.confidence_score = 0.8
+        # Stub analysis result
+        analysis_result = SimpleNamespace(confidence_score=0.8)
         
-        # Mock optimization result
-        optimization_result = Mock()
-        optimization_result.confidence_score = 0.9
+        # Stub optimization result
+        optimization_result = SimpleNamespace(confidence_score=0.9)
         
         confidence = self.toolkit._calculate_overall_confidence(
             analysis_result,
@@ -297,9 +280,8 @@ class TestPromptToolkit(unittest.TestCase):
     
     def test_calculate_overall_confidence_without_optimization(self):
         """Test confidence calculation without optimization."""
-        # Mock analysis result
-        analysis_result = Mock()
-        analysis_result.confidence_score = 0.8
+        # Stub analysis result
+        analysis_result = SimpleNamespace(confidence_score=0.8)
         
         confidence = self.toolkit._calculate_overall_confidence(
             analysis_result,
@@ -310,11 +292,7 @@ class TestPromptToolkit(unittest.TestCase):
     
     def test_export_as_yaml(self):
         """Test YAML export functionality."""
-        prompt = AgentPromptModel(
-            introduction="你是一个助手",
-            target="帮助用户",
-            instruction="回答问题"
-        )
+        prompt = self.basic_prompt
         
         yaml_content = self.toolkit._export_as_yaml(prompt)
         
@@ -326,11 +304,7 @@ class TestPromptToolkit(unittest.TestCase):
     
     def test_export_as_json(self):
         """Test JSON export functionality."""
-        prompt = AgentPromptModel(
-            introduction="你是一个助手",
-            target="帮助用户",
-            instruction="回答问题"
-        )
+        prompt = self.basic_prompt
         
         json_content = self.toolkit._export_as_json(prompt)
         
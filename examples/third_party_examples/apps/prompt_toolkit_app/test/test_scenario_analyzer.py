@@ -18,9 +18,13 @@ from examples.third_party_examples.apps.prompt_toolkit_app.prompt.scenario_analy
 class TestScenarioAnalyzer(unittest.TestCase):
     """Test cases for ScenarioAnalyzer class."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Set up the analyzer once; it keeps no per-call state."""
+        cls.analyzer = ScenarioAnalyzer()
+    
     def setUp(self):
         """Set up test fixtures."""
-        self.analyzer = ScenarioAnalyzer()
         self.sample_content = "我需要一个编程助手来帮助我写Python代码"
         self.sample_additional_context = {
             "domain": "技术",
@@ -218,85 +222,30 @@ class TestScenarioAnalyzer(unittest.TestCase):
         )
         self.assertEqual(value, "默认")
     
-    def test_domain_patterns_initialization(self):
-        """Test domain patterns initialization."""
-        patterns = self.analyzer._domain_patterns
-        
-        self.assertIsInstance(patterns, dict)
-        self.assertGreater(len(patterns), 0)
-        
-        for domain, keyword_list in patterns.items():
-            self.assertIsInstance(domain, str)
-            self.assertIsInstance(keyword_list, list)
-            self.assertGreater(len(keyword_list), 0)
-    
-    def test_role_patterns_initialization(self):
-        """Test role patterns initialization."""
-        patterns = self.analyzer._role_patterns
-        
-        self.assertIsInstance(patterns, dict)
-        self.assertGreater(len(patterns), 0)
-        
-        for role, keyword_list in patterns.items():
-            self.assertIsInstance(role, str)
-            self.assertIsInstance(keyword_list, list)
-            self.assertGreater(len(keyword_list), 0)
-    
-    def test_audience_patterns_initialization(self):
-        """Test audience patterns initialization."""
-        patterns = self.analyzer._audience_patterns
-        
-        self.assertIsInstance(patterns, dict)
-        self.assertGreater(len(patterns), 0)
-        
-        for audience, keyword_list in patterns.items():
-            self.assertIsInstance(audience, str)
-            self.assertIsInstance(keyword_list, list)
-            self.assertGreater(len(keyword_list), 0)
-    
-    def test_tone_patterns_initialization(self):
-        """Test tone patterns initialization."""
-        patterns = self.analyzer._tone_patterns
-        
-        self.assertIsInstance(patterns, dict)
-        self.assertGreater(len(patterns), 0)
-        
-        for tone, keyword_list in patterns.items():
-            self.assertIsInstance(tone, str)
-            self.assertIsInstance(keyword_list, list)
-            self.assertGreater(len(keyword_list), 0)
-    
-    def test_complexity_indicators_initialization(self):
-        """Test complexity indicators initialization."""
-        indicators = self.analyzer._complexity_indicators
-        
-        self.assertIsInstance(indicators, dict)
-        self.assertGreater(len(indicators), 0)
-        
-        for complexity, indicator_list in indicators.items():
-            self.assertIsInstance(complexity, str)
-            self.assertIsInstance(indicator_list, list)
-            self.assertGreater(len(indicator_list), 0)
-    
-    def test_constraint_patterns_initialization(self):
-        """Test constraint patterns initialization."""
-        patterns = self.analyzer._constraint_patterns
-        
-        self.assertIsInstance(patterns, list)
-        self.assertGreater(len(patterns), 0)
-        
-        for pattern in patterns:
-            self.assertIsInstance(pattern, str)
-    
-    def test_example_patterns_initialization(self):
-        """Test example patterns initialization."""
-        patterns = self.analyzer._example_patterns
-        
-        self.assertIsInstance(patterns, list)
-        self.assertGreater(len(patterns), 0)
-        
-        for pattern in patterns:
-            self.assertIsInstance(pattern, str)
+    def test_patterns_initialization(self):
+        """Test keyword tables and pattern lists initialization."""
+        for attr in ('_domain_patterns', '_role_patterns', '_audience_patterns',
+                     '_tone_patterns', '_complexity_indicators'):
+            with self.subTest(attr=attr):
+                patterns = getattr(self.analyzer, attr)
+                
+                self.assertIsInstance(patterns, dict)
+                self.assertGreater(len(patterns), 0)
+                
+                for key, keyword_list in patterns.items():
+                    self.assertIsInstance(key, str)
+                    self.assertIsInstance(keyword_list, list)
+                    self.assertGreater(len(keyword_list), 0)
+        
+        for attr in ('_constraint_patterns', '_example_patterns'):
+            with self.subTest(attr=attr):
+                patterns = getattr(self.analyzer, attr)
+                
+                self.assertIsInstance(patterns, list)
+                self.assertGreater(len(patterns), 0)
+                
+                for pattern in patterns:
+                    self.assertIsInstance(pattern, str)
 
 
 if __name__ == '__main__':
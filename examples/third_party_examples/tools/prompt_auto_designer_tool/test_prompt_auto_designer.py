@@ -11,7 +11,12 @@ from examples.third_party_examples.tools.prompt_auto_designer_tool.prompt_auto_d
 from agentuniverse.prompt.prompt_model import AgentPromptModel
 
 
-def test_generate_prompt_success(monkeypatch):
+@pytest.fixture(scope="module")
+def designer():
+    return PromptAutoDesigner()
+
+
+def test_generate_prompt_success(monkeypatch, designer):
     captured: dict = {}
 
     def fake_invoke(self, version, payload):
@@ -29,7 +34,6 @@ def test_generate_prompt_success(monkeypatch):
 
     monkeypatch.setattr(PromptAutoDesigner, "_invoke_llm", fake_invoke)
 
-    designer = PromptAutoDesigner()
     request = PromptGenerationRequest(
         scenario="企业在线客服机器人",
         objective="快速回答常见问题并引用 FAQ 数据",
@@ -54,7 +58,7 @@ def test_generate_prompt_success(monkeypatch):
     assert "- 用户提问" in captured["payload"]["inputs"]
 
 
-def test_optimize_prompt_merges_fallback(monkeypatch):
+def test_optimize_prompt_merges_fallback(monkeypatch, designer):
     base_prompt = AgentPromptModel(
         introduction="你是一名财务分析助手。",
         target="帮助分析季度营收表现。",
@@ -76,7 +80,6 @@ def test_optimize_prompt_merges_fallback(monkeypatch):
 
     monkeypatch.setattr(PromptAutoDesigner, "_invoke_llm", fake_invoke)
 
-    designer = PromptAutoDesigner()
     request = PromptOptimizationRequest(
         prompt=base_prompt,
         scenario="上市公司财报解读",
@@ -96,9 +99,8 @@ def test_optimize_prompt_merges_fallback(monkeypatch):
     assert result.rationale == "强化指标顺序并加入风险提醒。"
 
 
-def test_generate_prompt_invalid_json(monkeypatch):
+def test_generate_prompt_invalid_json(monkeypatch, designer):
     monkeypatch.setattr(PromptAutoDesigner, "_invoke_llm", lambda self, version, payload: "not-json")
-    designer = PromptAutoDesigner()
     request = PromptGenerationRequest(
         scenario="安防巡检机器人",
         objective="生成巡检指令",
@@ -0,0 +1,71 @@
+import asyncio
+import os
+import unittest
+
+import pytest
+
+from agentuniverse.llm.default.aws_bedrock_llm import AWSBedrockLLM
+from agentuniverse.base.config.application_configer.application_config_manager import ApplicationConfigManager
+from agentuniverse.base.config.application_configer.app_configer import AppConfiger
+
+
+def _consume_stream(it) -> list:
+    """Collect the text of every chunk from a sync stream."""
+    return [chunk.text for chunk in it]
+
+
+async def _consume_astream(llm, messages: list) -> list:
+    """Collect the text of every chunk from an async stream."""
+    chunks = []
+    async for chunk in await llm.acall(messages=messages, streaming=True):
+        chunks.append(chunk.text)
+    return chunks
+
+
+async def _run_all(llm, messages: list):
+    """Issue all four call modes at once so the Bedrock round-trips overlap.
+
+    boto3 is blocking (``acall`` wraps the sync client), so every mode runs
+    in a worker thread; the async ones get their own event loop there.
+    """
+    return await asyncio.gather(
+        asyncio.to_thread(llm.call, messages=messages, streaming=False),
+        asyncio.to_thread(asyncio.run, llm.acall(messages=messages, streaming=False)),
+        asyncio.to_thread(lambda: _consume_stream(llm.call(messages=messages, streaming=True))),
+        asyncio.to_thread(asyncio.run, _consume_astream(llm, messages)),
+    )
+
+
+@pytest.mark.external
+@unittest.skipUnless(os.environ.get("AWS_ACCESS_KEY_ID"), "AWS_ACCESS_KEY_ID is required")
+class TestAWSBedrockLLMIntegration(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up test fixtures once so the boto3 client is reused across tests."""
+        app_configer = AppConfiger()
+        ApplicationConfigManager().app_configer = app_configer
+
+        # Credentials and region come from the AWS_* environment variables.
+        cls.llm = AWSBedrockLLM(model_name='amazon.nova-lite-v1:0')
+
+    def test_all_modes(self) -> None:
+        """Test sync, async and both streaming calls with real API concurrently."""
+        messages = [
+            {
+                "role": "user",
+                "content": "hi, please introduce yourself",
+            }
+        ]
+        output, aoutput, chunks, achunks = asyncio.run(_run_all(self.llm, messages))
+        print(output.__str__())
+        print(aoutput.__str__())
+        print(''.join(chunks))
+        print(''.join(achunks))
+        self.assertIsNotNone(output.text)
+        self.assertIsNotNone(aoutput.text)
+        self.assertGreater(len(chunks), 0)
+        self.assertGreater(len(achunks), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -264,6 +264,14 @@ class TestThresholdFilter(unittest.TestCase):
 
         self.assertEqual(len(result), 5)
 
+    def test_topk_filter_k_none(self):
+        """Test top-K with k set to None keeps every document."""
+        self.filter.filters = [{'type': 'topk', 'k': None}]
+
+        result = self.filter._process_docs(self.sample_docs)
+
+        self.assertEqual(len(result), len(self.sample_docs))
+
     # ========== Percentile Filter Tests ==========
 
     def test_percentile_filter_basic(self):
@@ -1,3 +1,4 @@
+import io
 import unittest
 import tempfile
 import os
@@ -8,12 +9,15 @@ from agentuniverse.agent.action.knowledge.reader.file.sevenzip_reader import Sev
 
 class TestSevenZipReaderBasic(unittest.TestCase):
     """SevenZipReader 基础功能测试"""
+    @classmethod
+    def setUpClass(cls):
+        cls.reader = SevenZipReader()
     def setUp(self):
-        self.reader = SevenZipReader()
+        self.reader = type(self).reader
+        self.reader._reader_cache.clear()
         self.temp_dir = tempfile.mkdtemp()
     def tearDown(self):
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
     def create_test_files(self):
         test_txt_path = os.path.join(self.temp_dir, "test.txt")
         with open(test_txt_path, 'w', encoding='utf-8') as f:
@@ -111,12 +115,15 @@ class TestSevenZipReaderBasic(unittest.TestCase):
 
 class TestSevenZipReaderComplexScenarios(unittest.TestCase):
     """SevenZipReader 复杂场景测试"""
+    @classmethod
+    def setUpClass(cls):
+        cls.reader = SevenZipReader()
     def setUp(self):
-        self.reader = SevenZipReader()
+        self.reader = type(self).reader
+        self.reader._reader_cache.clear()
         self.temp_dir = tempfile.mkdtemp()
     def tearDown(self):
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
     def create_complex_project_structure(self):
         project_dir = os.path.join(self.temp_dir, "complex_project")
         os.makedirs(project_dir, exist_ok=True)
@@ -267,12 +274,15 @@ class TestSevenZipReaderComplexScenarios(unittest.TestCase):
 
 class TestSevenZipReaderSizeLimits(unittest.TestCase):
     """SevenZipReader 大小限制测试"""
+    @classmethod
+    def setUpClass(cls):
+        cls.reader = SevenZipReader()
     def setUp(self):
-        self.reader = SevenZipReader()
+        self.reader = type(self).reader
+        self.reader._reader_cache.clear()
         self.temp_dir = tempfile.mkdtemp()
     def tearDown(self):
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
     def test_max_file_size_limit(self):
         try:
             import py7zr
@@ -359,12 +369,15 @@ class TestSevenZipReaderSizeLimits(unittest.TestCase):
 
 class TestSevenZipReaderRealWorldScenarios(unittest.TestCase):
     """SevenZipReader 真实世界场景测试"""
+    @classmethod
+    def setUpClass(cls):
+        cls.reader = SevenZipReader()
     def setUp(self):
-        self.reader = SevenZipReader()
+        self.reader = type(self).reader
+        self.reader._reader_cache.clear()
         self.temp_dir = tempfile.mkdtemp()
     def tearDown(self):
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
     def create_software_distribution_package(self):
         dist_dir = os.path.join(self.temp_dir, "myapp_v2.0.0")
         os.makedirs(dist_dir, exist_ok=True)
@@ -441,12 +454,15 @@ class TestSevenZipReaderRealWorldScenarios(unittest.TestCase):
 
 class TestSevenZipReaderEdgeCases(unittest.TestCase):
     """SevenZipReader 边界情况测试"""
+    @classmethod
+    def setUpClass(cls):
+        cls.reader = SevenZipReader()
     def setUp(self):
-        self.reader = SevenZipReader()
+        self.reader = type(self).reader
+        self.reader._reader_cache.clear()
         self.temp_dir = tempfile.mkdtemp()
     def tearDown(self):
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
     def test_empty_7z_archive(self):
         try:
             import py7zr
@@ -474,15 +490,11 @@ class TestSevenZipReaderEdgeCases(unittest.TestCase):
             "mixed_case_FILE.TXT": "混合大小写的文件名",
             "unicode_测试_文件🎉.txt": "包含Unicode表情的文件名",
         }
-        files_dir = os.path.join(self.temp_dir, "special_names")
-        os.makedirs(files_dir, exist_ok=True)
-        for filename, content in special_files.items():
-            with open(os.path.join(files_dir, filename), 'w', encoding='utf-8') as f:
-                f.write(content)
         sevenzip_path = os.path.join(self.temp_dir, "special_names.7z")
         try:
             with py7zr.SevenZipFile(sevenzip_path, 'w') as archive:
-                archive.writeall(files_dir, '')
+                for filename, content in special_files.items():
+                    archive.writef(io.BytesIO(content.encode('utf-8')), filename)
         except Exception as e:
             self.skipTest(f"Failed to create special names 7Z: {e}")
         documents = self.reader._load_data(sevenzip_path)
@@ -495,18 +507,12 @@ class TestSevenZipReaderEdgeCases(unittest.TestCase):
             import py7zr
         except ImportError:
             self.skipTest("py7zr not available")
-        deep_dir = self.temp_dir
         depth = 8
-        for i in range(depth):
-            deep_dir = os.path.join(deep_dir, f"level_{i:02d}")
-            os.makedirs(deep_dir, exist_ok=True)
-        deep_file = os.path.join(deep_dir, "deep_nested_file.txt")
-        with open(deep_file, 'w', encoding='utf-8') as f:
-            f.write("这是位于深层嵌套目录中的文件。")
-        mid_file = os.path.join(self.temp_dir, "level_00", "level_01", "mid_level_file.yaml")
-        os.makedirs(os.path.dirname(mid_file), exist_ok=True)
-        with open(mid_file, 'w', encoding='utf-8') as f:
-            f.write("config:\n  level: mid\n  description: 中间层文件")
+        deep_dir = os.path.join(self.temp_dir, *[f"level_{i:02d}" for i in range(depth)])
+        os.makedirs(deep_dir, exist_ok=True)
+        Path(deep_dir, "deep_nested_file.txt").write_bytes("这是位于深层嵌套目录中的文件。".encode('utf-8'))
+        mid_file = Path(self.temp_dir, "level_00", "level_01", "mid_level_file.yaml")
+        mid_file.write_bytes("config:\n  level: mid\n  description: 中间层文件".encode('utf-8'))
         sevenzip_path = os.path.join(self.temp_dir, "deep_structure.7z")
         try:
             with py7zr.SevenZipFile(sevenzip_path, 'w') as archive:
@@ -525,8 +531,7 @@ class TestSevenZipReaderEdgeCases(unittest.TestCase):
         except ImportError:
             self.skipTest("py7zr not available")
         test_file = os.path.join(self.temp_dir, "path_test.txt")
-        with open(test_file, 'w', encoding='utf-8') as f:
-            f.write("路径处理测试文件")
+        Path(test_file).write_bytes("路径处理测试文件".encode('utf-8'))
         sevenzip_path = os.path.join(self.temp_dir, "path_test.7z")
         try:
             with py7zr.SevenZipFile(sevenzip_path, 'w') as archive:
@@ -544,18 +549,16 @@ class TestSevenZipReaderEdgeCases(unittest.TestCase):
             import py7zr
         except ImportError:
             self.skipTest("py7zr not available")
-        files_dir = os.path.join(self.temp_dir, "mixed_encodings")
-        os.makedirs(files_dir, exist_ok=True)
-        with open(os.path.join(files_dir, "utf8_bom.txt"), 'w', encoding='utf-8-sig') as f:
-            f.write("UTF-8 with BOM: 测试文本")
-        with open(os.path.join(files_dir, "utf8_nobom.txt"), 'w', encoding='utf-8') as f:
-            f.write("UTF-8 without BOM: 测试文本")
-        with open(os.path.join(files_dir, "unicode_chars.txt"), 'w', encoding='utf-8') as f:
-            f.write("Unicode 测试: 🌟🎉🚀 中文测试 ©®™")
+        encoded_files = {
+            "utf8_bom.txt": b'\xef\xbb\xbf' + "UTF-8 with BOM: 测试文本".encode('utf-8'),
+            "utf8_nobom.txt": "UTF-8 without BOM: 测试文本".encode('utf-8'),
+            "unicode_chars.txt": "Unicode 测试: 🌟🎉🚀 中文测试 ©®™".encode('utf-8'),
+        }
         sevenzip_path = os.path.join(self.temp_dir, "mixed_encodings.7z")
         try:
             with py7zr.SevenZipFile(sevenzip_path, 'w') as archive:
-                archive.writeall(files_dir, '')
+                for filename, data in encoded_files.items():
+                    archive.writef(io.BytesIO(data), filename)
         except Exception as e:
             self.skipTest(f"Failed to create mixed encodings 7Z: {e}")
         documents = self.reader._load_data(sevenzip_path)
@@ -567,12 +570,15 @@ class TestSevenZipReaderEdgeCases(unittest.TestCase):
 
 class TestSevenZipReaderPerformance(unittest.TestCase):
     """SevenZipReader 性能测试"""
+    @classmethod
+    def setUpClass(cls):
+        cls.reader = SevenZipReader()
     def setUp(self):
-        self.reader = SevenZipReader()
+        self.reader = type(self).reader
+        self.reader._reader_cache.clear()
         self.temp_dir = tempfile.mkdtemp()
     def tearDown(self):
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
     def test_large_number_of_small_files(self):
         try:
             import py7zr
@@ -582,21 +588,21 @@ class TestSevenZipReaderPerformance(unittest.TestCase):
         os.makedirs(files_dir, exist_ok=True)
         file_count = 100
         for i in range(file_count):
-            filepath = os.path.join(files_dir, f"small_file_{i:03d}.txt")
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(f"这是小文件 {i} 的内容，用于性能测试。")
+            Path(files_dir, f"small_file_{i:03d}.txt").write_bytes(f"这是小文件 {i} 的内容，用于性能测试。".encode('utf-8'))
         sevenzip_path = os.path.join(self.temp_dir, "many_small_files.7z")
         try:
             with py7zr.SevenZipFile(sevenzip_path, 'w') as archive:
                 archive.writeall(files_dir, '')
         except Exception as e:
             self.skipTest(f"Failed to create many small files 7Z: {e}")
-        start_time = time.time()
+        start = time.perf_counter()
+        cpu_start = time.process_time()
         documents = self.reader._load_data(sevenzip_path, max_files=file_count)
-        elapsed_time = time.time() - start_time
+        elapsed = time.perf_counter() - start
+        cpu = time.process_time() - cpu_start
         self.assertLessEqual(len(documents), file_count)
-        self.assertLess(elapsed_time, 30, f"处理 {file_count} 个文件耗时 {elapsed_time:.2f} 秒，超过性能要求")
-        print(f"\n性能测试: 处理 {len(documents)}/{file_count} 个文件耗时 {elapsed_time:.2f} 秒")
+        self.assertLess(elapsed, 30, f"处理 {file_count} 个文件耗时 {elapsed:.2f} 秒，超过性能要求")
+        self.assertLess(cpu, 15, f"处理 {file_count} 个文件占用 CPU {cpu:.2f} 秒，超过性能要求")
     def test_reader_cache_efficiency(self):
         try:
             import py7zr
@@ -615,13 +621,14 @@ class TestSevenZipReaderPerformance(unittest.TestCase):
         except Exception as e:
             self.skipTest(f"Failed to create cache test 7Z: {e}")
         self.reader._reader_cache.clear()
-        documents1 = self.reader._load_data(sevenzip_path)
+        documents = self.reader._load_data(sevenzip_path)
+        self.assertGreater(len(documents), 0)
         cache_size_after_first = len(self.reader._reader_cache)
         self.assertGreater(cache_size_after_first, 0)
-        documents2 = self.reader._load_data(sevenzip_path)
-        cache_size_after_second = len(self.reader._reader_cache)
-        self.assertEqual(cache_size_after_first, cache_size_after_second)
-        self.assertEqual(len(documents1), len(documents2))
+        # 直接走读取器工厂路径验证缓存命中，无需再次解压整个 7Z 文件
+        for filename in file_types:
+            self.assertIsNotNone(self.reader._get_reader_for_file(Path(filename)))
+        self.assertEqual(len(self.reader._reader_cache), cache_size_after_first)
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,20 +1,27 @@
+import pytest
+
 from agentuniverse.agent.action.knowledge.reader.file.csv_reader import CSVReader
 from agentuniverse.agent.action.knowledge.reader.file.txt_reader import TxtReader
 from agentuniverse.agent.action.knowledge.reader.utils import detect_file_encoding
 
 
-def test_detect_file_encoding_gb18030(tmp_path):
+@pytest.fixture(scope="module")
+def shared_tmp(tmp_path_factory):
+    return tmp_path_factory.mktemp("enc")
+
+
+def test_detect_file_encoding_gb18030(shared_tmp):
     sample_text = "示例文本"
-    file_path = tmp_path / "sample.txt"
+    file_path = shared_tmp / "sample.txt"
     file_path.write_text(sample_text, encoding="gb18030")
 
     detected = detect_file_encoding(file_path)
     assert detected in {"gb18030", "gbk"}
 
 
-def test_txt_reader_handles_gbk(tmp_path):
+def test_txt_reader_handles_gbk(shared_tmp):
     content = "第一行\n第二行"
-    file_path = tmp_path / "gbk.txt"
+    file_path = shared_tmp / "gbk.txt"
     file_path.write_text(content, encoding="gb18030")
 
     reader = TxtReader()
@@ -25,9 +32,9 @@ def test_txt_reader_handles_gbk(tmp_path):
     assert documents[0].metadata["file_name"] == file_path.name
 
 
-def test_csv_reader_handles_utf8_bom(tmp_path):
+def test_csv_reader_handles_utf8_bom(shared_tmp):
     rows = ["col1,col2", "值1,值2"]
-    file_path = tmp_path / "data.csv"
+    file_path = shared_tmp / "data.csv"
     file_path.write_text("\n".join(rows), encoding="utf-8-sig")
 
     reader = CSVReader()
@@ -38,8 +45,8 @@ def test_csv_reader_handles_utf8_bom(tmp_path):
     assert documents[0].metadata["file_name"] == file_path.name
 
 
-def test_csv_reader_preserves_empty_middle_fields(tmp_path):
-    file_path = tmp_path / "empty_middle.csv"
+def test_csv_reader_preserves_empty_middle_fields(shared_tmp):
+    file_path = shared_tmp / "empty_middle.csv"
     file_path.write_text("name,middle,last\nAlice,,Smith\n", encoding="utf-8")
 
     reader = CSVReader()
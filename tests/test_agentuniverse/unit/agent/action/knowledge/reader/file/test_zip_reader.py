@@ -5,93 +5,192 @@
 # @Author  : Saladday
 # @Email   : fanjing.luo@zju.edu.cn
 # @FileName: test_zip_reader.py
+import functools
+import importlib.util
 import io
+import os
 import tempfile
 import unittest
 import zipfile
+from collections import Counter
 from pathlib import Path
+from typing import Dict, Mapping, Union
+from unittest.mock import patch
 
+from agentuniverse.agent.action.knowledge.reader.file import zip_reader
 from agentuniverse.agent.action.knowledge.reader.file.zip_reader import ZipReader
 
 
+DOCX_AVAILABLE = importlib.util.find_spec("docx") is not None
+PPTX_AVAILABLE = importlib.util.find_spec("pptx") is not None
+OPENPYXL_AVAILABLE = importlib.util.find_spec("openpyxl") is not None
+
+FIXED_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+IN_MEMORY_TMP_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+HIGHLY_COMPRESSIBLE_BYTES = b"a" * 100_000
+REPETITIVE_BYTES = ("重复内容 " * 100).encode("utf-8")
+LARGE_TXT_BYTES = b"a" * 4096
+# Minimal one-page PDF (Helvetica, text "Sample PDF document") with a valid xref table.
+SAMPLE_PDF_BYTES = (
+    b'%PDF-1.4\n'
+    b'1 0 obj\n'
+    b'<< /Type /Catalog /Pages 2 0 R >>\n'
+    b'endobj\n'
+    b'2 0 obj\n'
+    b'<< /Type /Pages /Kids [3 0 R] /Count 1 >>\n'
+    b'endobj\n'
+    b'3 0 obj\n'
+    b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R /Resources << /Font << /F1 5 0 R >> >> >>\n'
+    b'endobj\n'
+    b'4 0 obj\n'
+    b'<< /Length 51 >>\n'
+    b'stream\n'
+    b'BT /F1 12 Tf 100 750 Td (Sample PDF document) Tj ET\n'
+    b'endstream\n'
+    b'endobj\n'
+    b'5 0 obj\n'
+    b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>\n'
+    b'endobj\n'
+    b'xref\n'
+    b'0 6\n'
+    b'0000000000 65535 f \n'
+    b'0000000009 00000 n \n'
+    b'0000000058 00000 n \n'
+    b'0000000115 00000 n \n'
+    b'0000000241 00000 n \n'
+    b'0000000342 00000 n \n'
+    b'trailer\n'
+    b'<< /Size 6 /Root 1 0 R >>\n'
+    b'startxref\n'
+    b'412\n'
+    b'%%EOF\n'
+)
+
+
+def _fixed_zip_info(name: str) -> zipfile.ZipInfo:
+    # A ZipInfo is recorded in the archive's central directory, so every entry
+    # needs its own instance; the fixed timestamp skips per-entry clock reads.
+    info = zipfile.ZipInfo(name, date_time=FIXED_DATE_TIME)
+    info.compress_type = zipfile.ZIP_STORED
+    return info
+
+
+def _make_zip(entries: Dict[str, Union[str, bytes]]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_STORED, strict_timestamps=False) as archive:
+        for name, data in entries.items():
+            archive.writestr(_fixed_zip_info(name), data)
+    return buffer.getvalue()
+
+
+def _nested_zip_entry(outer: zipfile.ZipFile, name: str, entries: Mapping[str, Union[str, bytes]]) -> None:
+    """Stream a STORED zip holding ``entries`` into ``outer`` as member ``name``."""
+    with outer.open(_fixed_zip_info(name), "w") as dst:
+        with zipfile.ZipFile(dst, "w", compression=zipfile.ZIP_STORED, strict_timestamps=False) as nested:
+            for entry_name, data in entries.items():
+                nested.writestr(_fixed_zip_info(entry_name), data)
+
+
+@functools.lru_cache(maxsize=None)
+def _build_many_files_zip(count: int) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_STORED, strict_timestamps=False) as archive:
+        for i in range(count):
+            archive.writestr(_fixed_zip_info(f"file_{i}.txt"), f"内容 {i}".encode("utf-8"))
+    return buffer.getvalue()
+
+
+@functools.lru_cache(maxsize=None)
+def _build_depth_bomb(levels: int) -> bytes:
+    current: bytes = _make_zip({"data.txt": b"deepest"})
+
+    # Each level holds a single entry and is closed before the next one is
+    # built, so one ZipInfo template can be renamed and reused safely.
+    info = _fixed_zip_info("level.zip")
+    for i in range(levels):
+        buffer = io.BytesIO()
+        info.filename = "nested.zip" if i == levels - 1 else f"level{i}.zip"
+        with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_STORED, strict_timestamps=False) as z:
+            z.writestr(info, current)
+        current = buffer.getvalue()
+    return current
+
+
+@functools.lru_cache(maxsize=None)
+def _create_docx_file(text: str) -> bytes:
+    from docx import Document
+    doc = Document()
+    doc.add_paragraph(text)
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def _create_pdf_file(text: str) -> bytes:
+    # The reader only needs a parseable PDF, so a canned one-page document
+    # replaces rendering ``text`` through reportlab.
+    return SAMPLE_PDF_BYTES
+
+
+@functools.lru_cache(maxsize=None)
+def _create_pptx_file(text: str) -> bytes:
+    from pptx import Presentation
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[0])
+    title = slide.shapes.title
+    title.text = text
+    buffer = io.BytesIO()
+    prs.save(buffer)
+    return buffer.getvalue()
+
+
+@functools.lru_cache(maxsize=None)
+def _create_xlsx_file() -> bytes:
+    from openpyxl import Workbook
+    wb = Workbook()
+    ws = wb.active
+    ws['A1'] = '姓名'
+    ws['B1'] = '年龄'
+    ws['A2'] = '张三'
+    ws['B2'] = 25
+    ws['A3'] = '李四'
+    ws['B3'] = 30
+    buffer = io.BytesIO()
+    wb.save(buffer)
+    return buffer.getvalue()
+
+
+def _render_office_fixtures() -> Dict[str, bytes]:
+    jobs = {}
+    if DOCX_AVAILABLE:
+        jobs["report.docx"] = (_create_docx_file, "这是一个Word文档，包含重要信息")
+        jobs["notes.docx"] = (_create_docx_file, "Word文档测试内容\n包含多行文字")
+    if PPTX_AVAILABLE:
+        jobs["slides.pptx"] = (_create_pptx_file, "项目演示PPT")
+    if OPENPYXL_AVAILABLE:
+        jobs["employees.xlsx"] = (_create_xlsx_file,)
+    # Render in this process so the memoized builders keep the payloads.
+    return {name: builder(*args) for name, (builder, *args) in jobs.items()}
+
+
 class TestZipReader(unittest.TestCase):
-    def setUp(self) -> None:
-        self.temp_dir = tempfile.TemporaryDirectory()
-        self.reader = ZipReader()
-
-    def tearDown(self) -> None:
-        self.temp_dir.cleanup()
-
-    def _create_docx_file(self, text: str) -> bytes:
-        try:
-            from docx import Document
-            doc = Document()
-            doc.add_paragraph(text)
-            buffer = io.BytesIO()
-            doc.save(buffer)
-            buffer.seek(0)
-            return buffer.read()
-        except ImportError:
-            return b""
-
-    def _create_pdf_file(self, text: str) -> bytes:
-        try:
-            from reportlab.pdfgen import canvas
-            from reportlab.lib.pagesizes import letter
-            buffer = io.BytesIO()
-            pdf = canvas.Canvas(buffer, pagesize=letter)
-            pdf.drawString(100, 750, text)
-            pdf.save()
-            buffer.seek(0)
-            return buffer.read()
-        except ImportError:
-            return b""
-
-    def _create_pptx_file(self, text: str) -> bytes:
-        try:
-            from pptx import Presentation
-            prs = Presentation()
-            slide = prs.slides.add_slide(prs.slide_layouts[0])
-            title = slide.shapes.title
-            title.text = text
-            buffer = io.BytesIO()
-            prs.save(buffer)
-            buffer.seek(0)
-            return buffer.read()
-        except ImportError:
-            return b""
-
-    def _create_xlsx_file(self) -> bytes:
-        try:
-            from openpyxl import Workbook
-            wb = Workbook()
-            ws = wb.active
-            ws['A1'] = '姓名'
-            ws['B1'] = '年龄'
-            ws['A2'] = '张三'
-            ws['B2'] = 25
-            ws['A3'] = '李四'
-            ws['B3'] = 30
-            buffer = io.BytesIO()
-            wb.save(buffer)
-            buffer.seek(0)
-            return buffer.read()
-        except ImportError:
-            return b""
+    """Tests share no mutable state, so the module is safe for ``pytest -n auto``."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # ZipReader only accepts filesystem paths, so keep fixtures on tmpfs when available.
+        cls.shared_root = tempfile.TemporaryDirectory(dir=IN_MEMORY_TMP_DIR)
+        # Every test writes a uniquely named archive, so one class-level directory suffices.
+        cls.temp_path = Path(cls.shared_root.name)
+        cls.reader = ZipReader()
+        cls.office_fixtures = _render_office_fixtures()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.shared_root.cleanup()
 
     def test_complex_nested_zip_structure(self) -> None:
-        archive_path = Path(self.temp_dir.name) / "complex_archive.zip"
-        
-        level3_zip = io.BytesIO()
-        with zipfile.ZipFile(level3_zip, "w") as z3:
-            z3.writestr("deep/secret.txt", "这是第三层深度的秘密文档")
-            z3.writestr("deep/config.json", '{"level": 3, "type": "configuration"}')
-        
-        level2_zip = io.BytesIO()
-        with zipfile.ZipFile(level2_zip, "w") as z2:
-            z2.writestr("reports/report.md", "# 第二层报告\n\n这是嵌套的markdown文档")
-            z2.writestr("data/metrics.txt", "CPU: 85%\nMemory: 60%\nDisk: 40%")
-            z2.writestr("archives/level3.zip", level3_zip.getvalue())
+        archive_path = self.temp_path / "complex_archive.zip"
         
         with zipfile.ZipFile(archive_path, "w") as main_zip:
             main_zip.writestr("README.md", "# 主文档\n\n这是根目录的说明文件")
@@ -106,21 +205,16 @@ class TestZipReader(unittest.TestCase):
             
             main_zip.writestr("data/sample.csv", "Name,Age,City\nAlice,28,Beijing\nBob,32,Shanghai\nCarol,25,Guangzhou")
             
-            docx_content = self._create_docx_file("这是一个Word文档，包含重要信息")
-            if docx_content:
-                main_zip.writestr("documents/report.docx", docx_content)
+            if DOCX_AVAILABLE:
+                main_zip.writestr("documents/report.docx", self.office_fixtures["report.docx"])
             
-            pdf_content = self._create_pdf_file("这是PDF文档的内容")
-            if pdf_content:
-                main_zip.writestr("documents/presentation.pdf", pdf_content)
+            main_zip.writestr("documents/presentation.pdf", _create_pdf_file("这是PDF文档的内容"))
             
-            pptx_content = self._create_pptx_file("项目演示PPT")
-            if pptx_content:
-                main_zip.writestr("documents/slides.pptx", pptx_content)
+            if PPTX_AVAILABLE:
+                main_zip.writestr("documents/slides.pptx", self.office_fixtures["slides.pptx"])
             
-            xlsx_content = self._create_xlsx_file()
-            if xlsx_content:
-                main_zip.writestr("data/employees.xlsx", xlsx_content)
+            if OPENPYXL_AVAILABLE:
+                main_zip.writestr("data/employees.xlsx", self.office_fixtures["employees.xlsx"])
             
             main_zip.writestr("logs/app.log", "[INFO] Application started\n[DEBUG] Loading configuration\n[INFO] Ready")
             main_zip.writestr("logs/error.log", "[ERROR] Sample error message")
@@ -128,38 +222,48 @@ class TestZipReader(unittest.TestCase):
             main_zip.writestr("web/index.html", "<html><body><h1>欢迎</h1></body></html>")
             main_zip.writestr("web/style.css", "body { font-family: Arial; }")
             
-            main_zip.writestr("nested_archives/level2.zip", level2_zip.getvalue())
+            _nested_zip_entry(main_zip, "nested_archives/level2.zip", {
+                "reports/report.md": "# 第二层报告\n\n这是嵌套的markdown文档",
+                "data/metrics.txt": "CPU: 85%\nMemory: 60%\nDisk: 40%",
+                "archives/level3.zip": _make_zip({
+                    "deep/secret.txt": "这是第三层深度的秘密文档",
+                    "deep/config.json": '{"level": 3, "type": "configuration"}',
+                }),
+            })
         
         docs = self.reader._load_data(archive_path)
         
         self.assertGreater(len(docs), 0)
         
-        file_names = [doc.metadata.get("file_name") for doc in docs]
-        archive_paths = [doc.metadata.get("archive_path") for doc in docs]
+        file_names = set()
+        extensions = Counter()
+        depths = set()
+        nested_count = deep_nested_count = 0
+        for doc in docs:
+            file_name = doc.metadata.get("file_name", "")
+            archive_path_meta = doc.metadata.get("archive_path", "")
+            file_names.add(file_name)
+            extensions[file_name.rsplit(".", 1)[-1]] += 1
+            depths.add(doc.metadata.get("archive_depth", 0))
+            nested_count += "level2.zip" in archive_path_meta
+            deep_nested_count += "level3.zip" in archive_path_meta
         
         self.assertIn("README.md", file_names)
         self.assertIn("main.py", file_names)
         self.assertIn("settings.json", file_names)
         
-        nested_docs = [d for d in docs if "level2.zip" in d.metadata.get("archive_path", "")]
-        self.assertGreater(len(nested_docs), 0)
-        
-        deep_nested = [d for d in docs if "level3.zip" in d.metadata.get("archive_path", "")]
-        self.assertGreater(len(deep_nested), 0)
-        
-        txt_docs = [d for d in docs if d.metadata.get("file_name", "").endswith(".txt")]
-        self.assertGreater(len(txt_docs), 0)
+        self.assertGreater(nested_count, 0)
+        self.assertGreater(deep_nested_count, 0)
         
-        py_docs = [d for d in docs if d.metadata.get("file_name", "").endswith(".py")]
-        self.assertEqual(len(py_docs), 2)
+        self.assertGreater(extensions["txt"], 0)
+        self.assertEqual(extensions["py"], 2)
         
-        depths = [doc.metadata.get("archive_depth", 0) for doc in docs]
         self.assertIn(0, depths)
         self.assertIn(1, depths)
         self.assertIn(2, depths)
 
     def test_load_text_file(self) -> None:
-        archive_path = Path(self.temp_dir.name) / "sample.zip"
+        archive_path = self.temp_path / "sample.zip"
         with zipfile.ZipFile(archive_path, "w") as archive:
             archive.writestr("docs/readme.txt", "hello world")
         docs = self.reader._load_data(archive_path)
@@ -170,13 +274,34 @@ class TestZipReader(unittest.TestCase):
         self.assertEqual(doc.metadata["archive_root"], "sample.zip")
         self.assertEqual(doc.metadata["archive_path"], "docs/readme.txt")
 
+    def test_load_gbk_text_file(self) -> None:
+        archive_path = self.temp_path / "gbk.zip"
+        with zipfile.ZipFile(archive_path, "w") as archive:
+            archive.writestr("gbk.txt", "中文内容，GBK 编码".encode("gbk"))
+        docs = self.reader._load_data(archive_path)
+        self.assertEqual([doc.text for doc in docs], ["中文内容，GBK 编码"])
+
+    def test_text_file_newlines_normalized(self) -> None:
+        archive_path = self.temp_path / "newlines.zip"
+        with zipfile.ZipFile(archive_path, "w") as archive:
+            archive.writestr("crlf.txt", b"line1\r\nline2\rline3\n")
+        docs = self.reader._load_data(archive_path)
+        self.assertEqual([doc.text for doc in docs], ["line1\nline2\nline3\n"])
+
+    def test_unreadable_text_member_is_skipped(self) -> None:
+        archive_path = self.temp_path / "unreadable.zip"
+        with zipfile.ZipFile(archive_path, "w") as archive:
+            archive.writestr("bad.txt", b"bad member")
+            archive.writestr("good.txt", b"good member")
+        with patch.object(zip_reader, "detect_file_encoding",
+                          side_effect=lambda data: "no-such-codec" if data.startswith(b"bad") else "utf-8"):
+            docs = self.reader._load_data(archive_path)
+        self.assertEqual([doc.text for doc in docs], ["good member"])
+
     def test_nested_zip(self) -> None:
-        archive_path = Path(self.temp_dir.name) / "nested.zip"
-        nested_buffer = io.BytesIO()
-        with zipfile.ZipFile(nested_buffer, "w") as nested:
-            nested.writestr("inner/data.txt", "nested data")
+        archive_path = self.temp_path / "nested.zip"
         with zipfile.ZipFile(archive_path, "w") as archive:
-            archive.writestr("folder/archive.zip", nested_buffer.getvalue())
+            _nested_zip_entry(archive, "folder/archive.zip", {"inner/data.txt": "nested data"})
         docs = self.reader._load_data(archive_path)
         self.assertEqual(len(docs), 1)
         doc = docs[0]
@@ -184,7 +309,7 @@ class TestZipReader(unittest.TestCase):
         self.assertEqual(doc.metadata["archive_path"], "folder/archive.zip/inner/data.txt")
 
     def test_multiple_file_types(self) -> None:
-        archive_path = Path(self.temp_dir.name) / "mixed.zip"
+        archive_path = self.temp_path / "mixed.zip"
         with zipfile.ZipFile(archive_path, "w") as archive:
             archive.writestr("document.txt", "文本内容")
             archive.writestr("readme.md", "# Markdown标题\n正文内容")
@@ -196,53 +321,40 @@ class TestZipReader(unittest.TestCase):
         docs = self.reader._load_data(archive_path)
         self.assertEqual(len(docs), 6)
         
-        extensions = {doc.metadata["file_name"].split(".")[-1] for doc in docs}
-        self.assertIn("txt", extensions)
-        self.assertIn("md", extensions)
-        self.assertIn("py", extensions)
-        self.assertIn("json", extensions)
+        extensions = Counter(doc.metadata["file_name"].split(".")[-1] for doc in docs)
+        self.assertEqual(extensions["txt"], 1)
+        self.assertEqual(extensions["md"], 1)
+        self.assertEqual(extensions["py"], 1)
+        self.assertEqual(extensions["json"], 1)
 
     def test_exceeds_file_size_limit(self) -> None:
-        archive_path = Path(self.temp_dir.name) / "limit.zip"
+        archive_path = self.temp_path / "limit.zip"
         with zipfile.ZipFile(archive_path, "w") as archive:
-            archive.writestr("large.txt", "a" * 4096)
+            archive.writestr("large.txt", LARGE_TXT_BYTES)
         limited_reader = ZipReader(max_file_size=1024, max_total_size=2048)
         with self.assertRaises(ValueError):
             limited_reader._load_data(archive_path)
 
     def test_exceeds_depth_limit(self) -> None:
-        archive_path = Path(self.temp_dir.name) / "deep.zip"
-        
-        current = io.BytesIO()
-        with zipfile.ZipFile(current, "w") as z:
-            z.writestr("data.txt", "deepest")
+        archive_path = self.temp_path / "deep.zip"
         
-        for i in range(10):
-            parent = io.BytesIO()
-            with zipfile.ZipFile(parent, "w") as z:
-                z.writestr(f"level{i}.zip", current.getvalue())
-            current = parent
-        
-        with zipfile.ZipFile(archive_path, "w") as archive:
-            archive.writestr("nested.zip", current.getvalue())
+        archive_path.write_bytes(_build_depth_bomb(11))
         
         shallow_reader = ZipReader(max_depth=2)
         with self.assertRaises(ValueError):
             shallow_reader._load_data(archive_path)
 
     def test_compression_ratio_limit(self) -> None:
-        archive_path = Path(self.temp_dir.name) / "compressed.zip"
-        highly_compressible = "a" * 100000
-        
+        archive_path = self.temp_path / "compressed.zip"
         with zipfile.ZipFile(archive_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
-            archive.writestr("repetitive.txt", highly_compressible)
+            archive.writestr("repetitive.txt", HIGHLY_COMPRESSIBLE_BYTES)
         
         strict_reader = ZipReader(max_compression_ratio=10)
         with self.assertRaises(ValueError):
             strict_reader._load_data(archive_path)
 
     def test_custom_metadata(self) -> None:
-        archive_path = Path(self.temp_dir.name) / "meta.zip"
+        archive_path = self.temp_path / "meta.zip"
         with zipfile.ZipFile(archive_path, "w") as archive:
             archive.writestr("file.txt", "content")
         
@@ -260,7 +372,7 @@ class TestZipReader(unittest.TestCase):
         self.assertEqual(doc.metadata["priority"], "高")
 
     def test_empty_files_ignored(self) -> None:
-        archive_path = Path(self.temp_dir.name) / "empty.zip"
+        archive_path = self.temp_path / "empty.zip"
         with zipfile.ZipFile(archive_path, "w") as archive:
             archive.writestr("empty.txt", "")
             archive.writestr("not_empty.txt", "有内容")
@@ -272,7 +384,7 @@ class TestZipReader(unittest.TestCase):
         self.assertEqual(non_empty_docs[0].text, "有内容")
 
     def test_special_characters_in_path(self) -> None:
-        archive_path = Path(self.temp_dir.name) / "special.zip"
+        archive_path = self.temp_path / "special.zip"
         with zipfile.ZipFile(archive_path, "w") as archive:
             archive.writestr("中文目录/文件名.txt", "中文内容")
             archive.writestr("folder with spaces/file name.txt", "content")
@@ -284,73 +396,70 @@ class TestZipReader(unittest.TestCase):
         self.assertIn("file name.txt", file_names)
 
     def test_ultra_complex_nested_structure(self) -> None:
-        archive_path = Path(self.temp_dir.name) / "ultra_complex.zip"
-        
-        level4_zip = io.BytesIO()
-        with zipfile.ZipFile(level4_zip, "w") as z4:
-            z4.writestr("final/ultimate.txt", "最深层文档内容")
-            z4.writestr("final/data.json", '{"depth": 4}')
-            z4.writestr("final/script.py", "print('level 4')")
-        
-        level3_zip = io.BytesIO()
-        with zipfile.ZipFile(level3_zip, "w") as z3:
-            z3.writestr("deep/secret.txt", "第三层秘密")
-            z3.writestr("deep/config.yml", "level: 3\ntype: config")
-            z3.writestr("deep/code.py", "def level3(): pass")
-            z3.writestr("archives/level4.zip", level4_zip.getvalue())
-        
-        level2_zip = io.BytesIO()
-        with zipfile.ZipFile(level2_zip, "w") as z2:
-            z2.writestr("reports/report.md", "# 第二层报告")
-            z2.writestr("reports/summary.txt", "总结内容")
-            z2.writestr("data/metrics.csv", "Name,Value\nCPU,85\nMemory,60")
-            z2.writestr("data/analysis.json", '{"status": "ok"}')
-            z2.writestr("scripts/process.py", "def process(): return True")
-            z2.writestr("archives/level3.zip", level3_zip.getvalue())
-        
-        level1_zip = io.BytesIO()
-        with zipfile.ZipFile(level1_zip, "w") as z1:
-            z1.writestr("docs/readme.md", "# Level 1 文档")
-            z1.writestr("docs/notes.txt", "笔记内容")
-            z1.writestr("code/main.py", "def main(): print('level1')")
-            z1.writestr("nested/level2.zip", level2_zip.getvalue())
-        
-        with zipfile.ZipFile(archive_path, "w") as main_zip:
-            main_zip.writestr("README.md", "# 超级复杂压缩包\n\n包含4层嵌套结构")
-            main_zip.writestr("LICENSE.txt", "MIT License")
-            main_zip.writestr("docs/intro.md", "## 介绍\n\n这是一个复杂的测试")
-            main_zip.writestr("docs/guide.md", "## 指南\n\n使用说明")
-            main_zip.writestr("src/app.py", "class App:\n    def run(self): pass")
-            main_zip.writestr("src/utils.py", "def helper(): return 42")
-            main_zip.writestr("src/config.py", "CONFIG = {'key': 'value'}")
-            main_zip.writestr("config/app.json", '{"name": "test"}')
-            main_zip.writestr("config/db.yml", "database: test")
-            main_zip.writestr("data/input.csv", "A,B,C\n1,2,3\n4,5,6")
-            main_zip.writestr("data/output.txt", "结果数据")
-            main_zip.writestr("tests/test_app.py", "def test_run(): assert True")
-            main_zip.writestr("archives/level1.zip", level1_zip.getvalue())
+        archive_path = self.temp_path / "ultra_complex.zip"
+        
+        level1_zip = _make_zip({
+            "docs/readme.md": "# Level 1 文档",
+            "docs/notes.txt": "笔记内容",
+            "code/main.py": "def main(): print('level1')",
+            "nested/level2.zip": _make_zip({
+                "reports/report.md": "# 第二层报告",
+                "reports/summary.txt": "总结内容",
+                "data/metrics.csv": "Name,Value\nCPU,85\nMemory,60",
+                "data/analysis.json": '{"status": "ok"}',
+                "scripts/process.py": "def process(): return True",
+                "archives/level3.zip": _make_zip({
+                    "deep/secret.txt": "第三层秘密",
+                    "deep/config.yml": "level: 3\ntype: config",
+                    "deep/code.py": "def level3(): pass",
+                    "archives/level4.zip": _make_zip({
+                        "final/ultimate.txt": "最深层文档内容",
+                        "final/data.json": '{"depth": 4}',
+                        "final/script.py": "print('level 4')",
+                    }),
+                }),
+            }),
+        })
+        
+        archive_path.write_bytes(_make_zip({
+            "README.md": "# 超级复杂压缩包\n\n包含4层嵌套结构",
+            "LICENSE.txt": "MIT License",
+            "docs/intro.md": "## 介绍\n\n这是一个复杂的测试",
+            "docs/guide.md": "## 指南\n\n使用说明",
+            "src/app.py": "class App:\n    def run(self): pass",
+            "src/utils.py": "def helper(): return 42",
+            "src/config.py": "CONFIG = {'key': 'value'}",
+            "config/app.json": '{"name": "test"}',
+            "config/db.yml": "database: test",
+            "data/input.csv": "A,B,C\n1,2,3\n4,5,6",
+            "data/output.txt": "结果数据",
+            "tests/test_app.py": "def test_run(): assert True",
+            "archives/level1.zip": level1_zip,
+        }))
         
         docs = self.reader._load_data(archive_path)
         
         self.assertGreater(len(docs), 20)
         
-        depths = [doc.metadata.get("archive_depth", 0) for doc in docs]
+        extensions = Counter()
+        depths = set()
+        level4_count = 0
+        for doc in docs:
+            extensions[doc.metadata.get("file_name", "").rsplit(".", 1)[-1]] += 1
+            depths.add(doc.metadata.get("archive_depth", 0))
+            level4_count += "level4.zip" in doc.metadata.get("archive_path", "")
+        
         self.assertIn(0, depths)
         self.assertIn(1, depths)
         self.assertIn(2, depths)
         self.assertIn(3, depths)
         
-        level4_docs = [d for d in docs if "level4.zip" in d.metadata.get("archive_path", "")]
-        self.assertGreater(len(level4_docs), 0)
-        
-        py_files = [d for d in docs if d.metadata.get("file_name", "").endswith(".py")]
-        self.assertGreater(len(py_files), 5)
-        
-        md_files = [d for d in docs if d.metadata.get("file_name", "").endswith(".md")]
-        self.assertGreater(len(md_files), 3)
+        self.assertGreater(level4_count, 0)
+        self.assertGreater(extensions["py"], 5)
+        self.assertGreater(extensions["md"], 3)
 
     def test_code_files_extraction(self) -> None:
-        archive_path = Path(self.temp_dir.name) / "code_archive.zip"
+        archive_path = self.temp_path / "code_archive.zip"
         with zipfile.ZipFile(archive_path, "w") as archive:
             archive.writestr("main.py", "#!/usr/bin/env python3\nprint('Python')")
             archive.writestr("app.js", "console.log('JavaScript');")
@@ -366,18 +475,12 @@ class TestZipReader(unittest.TestCase):
         docs = self.reader._load_data(archive_path)
         self.assertEqual(len(docs), 10)
         
-        languages = [doc.metadata.get("language") for doc in docs]
-        self.assertIn("python", languages)
-        self.assertIn("javascript", languages)
-        self.assertIn("typescript", languages)
-        self.assertIn("java", languages)
-        self.assertIn("go", languages)
-        self.assertIn("cpp", languages)
-        self.assertIn("rust", languages)
-        self.assertIn("shell", languages)
+        languages = Counter(doc.metadata.get("language") for doc in docs)
+        for language in ("python", "javascript", "typescript", "java", "go", "cpp", "rust", "shell"):
+            self.assertGreaterEqual(languages[language], 1, language)
 
     def test_mixed_documents_extraction(self) -> None:
-        archive_path = Path(self.temp_dir.name) / "docs_archive.zip"
+        archive_path = self.temp_path / "docs_archive.zip"
         
         with zipfile.ZipFile(archive_path, "w") as archive:
             archive.writestr("notes.txt", "这是文本笔记\n第二行内容")
@@ -390,25 +493,22 @@ class TestZipReader(unittest.TestCase):
             archive.writestr("data.xml", '<?xml version="1.0"?>\n<root><item>数据</item></root>')
             archive.writestr("app.log", "[2025-10-28 10:00:00] INFO: 应用启动\n[2025-10-28 10:00:01] DEBUG: 初始化完成")
             
-            docx_content = self._create_docx_file("Word文档测试内容\n包含多行文字")
-            if docx_content:
-                archive.writestr("report.docx", docx_content)
+            if DOCX_AVAILABLE:
+                archive.writestr("report.docx", self.office_fixtures["notes.docx"])
             
-            pdf_content = self._create_pdf_file("PDF测试文档")
-            if pdf_content:
-                archive.writestr("document.pdf", pdf_content)
+            archive.writestr("document.pdf", _create_pdf_file("PDF测试文档"))
         
         docs = self.reader._load_data(archive_path)
         self.assertGreater(len(docs), 8)
         
-        file_types = {doc.metadata.get("file_name", "").split(".")[-1] for doc in docs}
-        self.assertIn("txt", file_types)
-        self.assertIn("md", file_types)
-        self.assertIn("csv", file_types)
-        self.assertIn("json", file_types)
+        file_types = Counter(doc.metadata.get("file_name", "").split(".")[-1] for doc in docs)
+        self.assertGreaterEqual(file_types["txt"], 1)
+        self.assertGreaterEqual(file_types["md"], 1)
+        self.assertGreaterEqual(file_types["csv"], 1)
+        self.assertGreaterEqual(file_types["json"], 1)
 
     def test_deeply_nested_directories(self) -> None:
-        archive_path = Path(self.temp_dir.name) / "deep_dirs.zip"
+        archive_path = self.temp_path / "deep_dirs.zip"
         with zipfile.ZipFile(archive_path, "w") as archive:
             archive.writestr("level1/file1.txt", "内容1")
             archive.writestr("level1/level2/file2.txt", "内容2")
@@ -425,7 +525,7 @@ class TestZipReader(unittest.TestCase):
         self.assertTrue(any("a/b/c/d/e/f/g" in p for p in paths))
 
     def test_duplicate_filenames_different_paths(self) -> None:
-        archive_path = Path(self.temp_dir.name) / "duplicates.zip"
+        archive_path = self.temp_path / "duplicates.zip"
         with zipfile.ZipFile(archive_path, "w") as archive:
             archive.writestr("dir1/config.txt", "配置1")
             archive.writestr("dir2/config.txt", "配置2")
@@ -445,10 +545,8 @@ class TestZipReader(unittest.TestCase):
         self.assertIn("dir3/config.txt", paths)
 
     def test_file_count_limit(self) -> None:
-        archive_path = Path(self.temp_dir.name) / "many_files.zip"
-        with zipfile.ZipFile(archive_path, "w") as archive:
-            for i in range(100):
-                archive.writestr(f"file_{i}.txt", f"内容 {i}")
+        archive_path = self.temp_path / "many_files.zip"
+        archive_path.write_bytes(_build_many_files_zip(100))
         
         limited_reader = ZipReader(max_files=50)
         with self.assertRaises(ValueError) as context:
@@ -456,10 +554,11 @@ class TestZipReader(unittest.TestCase):
         self.assertIn("maximum file count", str(context.exception))
 
     def test_total_size_limit(self) -> None:
-        archive_path = Path(self.temp_dir.name) / "large_total.zip"
-        with zipfile.ZipFile(archive_path, "w") as archive:
+        archive_path = self.temp_path / "large_total.zip"
+        payload = b"x" * 1000
+        with zipfile.ZipFile(archive_path, "w", compression=zipfile.ZIP_STORED, strict_timestamps=False) as archive:
             for i in range(20):
-                archive.writestr(f"file_{i}.txt", "x" * 1000)
+                archive.writestr(_fixed_zip_info(f"file_{i}.txt"), payload)
         
         limited_reader = ZipReader(max_total_size=5000)
         with self.assertRaises(ValueError) as context:
@@ -467,7 +566,7 @@ class TestZipReader(unittest.TestCase):
         self.assertIn("maximum total size", str(context.exception))
 
     def test_path_traversal_protection(self) -> None:
-        archive_path = Path(self.temp_dir.name) / "traversal.zip"
+        archive_path = self.temp_path / "traversal.zip"
         with zipfile.ZipFile(archive_path, "w") as archive:
             archive.writestr("../../../etc/passwd", "should be blocked")
             archive.writestr("./../../sensitive.txt", "should be blocked")
@@ -481,7 +580,7 @@ class TestZipReader(unittest.TestCase):
             self.assertNotIn("..", path)
 
     def test_unsafe_members_are_skipped_not_normalized(self) -> None:
-        archive_path = Path(self.temp_dir.name) / "unsafe_members.zip"
+        archive_path = self.temp_path / "unsafe_members.zip"
         with zipfile.ZipFile(archive_path, "w") as archive:
             archive.writestr("../outside.txt", "blocked")
             archive.writestr("/absolute.txt", "blocked")
@@ -494,7 +593,7 @@ class TestZipReader(unittest.TestCase):
         self.assertEqual(docs[0].text, "allowed")
 
     def test_hidden_and_system_files(self) -> None:
-        archive_path = Path(self.temp_dir.name) / "hidden.zip"
+        archive_path = self.temp_path / "hidden.zip"
         with zipfile.ZipFile(archive_path, "w") as archive:
             archive.writestr(".hidden", "隐藏文件")
             archive.writestr(".gitignore", "*.pyc\n__pycache__/")
@@ -506,7 +605,7 @@ class TestZipReader(unittest.TestCase):
         self.assertGreater(len(docs), 0)
 
     def test_unicode_content(self) -> None:
-        archive_path = Path(self.temp_dir.name) / "unicode.zip"
+        archive_path = self.temp_path / "unicode.zip"
         with zipfile.ZipFile(archive_path, "w") as archive:
             archive.writestr("chinese.txt", "这是中文内容：你好世界！")
             archive.writestr("japanese.txt", "日本語のテキスト：こんにちは")
@@ -521,12 +620,10 @@ class TestZipReader(unittest.TestCase):
         self.assertIn("你好世界", chinese_doc.text)
 
     def test_various_compression_levels(self) -> None:
-        content = "重复内容 " * 100
-        
         for compression in [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED]:
-            archive_path = Path(self.temp_dir.name) / f"compress_{compression}.zip"
+            archive_path = self.temp_path / f"compress_{compression}.zip"
             with zipfile.ZipFile(archive_path, "w", compression=compression) as archive:
-                archive.writestr("data.txt", content)
+                archive.writestr("data.txt", REPETITIVE_BYTES)
             
             reader = ZipReader(max_compression_ratio=500)
             docs = reader._load_data(archive_path)
@@ -534,7 +631,7 @@ class TestZipReader(unittest.TestCase):
             self.assertIn("重复内容", docs[0].text)
 
     def test_empty_zip(self) -> None:
-        archive_path = Path(self.temp_dir.name) / "empty.zip"
+        archive_path = self.temp_path / "empty_archive.zip"
         with zipfile.ZipFile(archive_path, "w") as archive:
             pass
         
@@ -542,7 +639,7 @@ class TestZipReader(unittest.TestCase):
         self.assertEqual(len(docs), 0)
 
     def test_zip_with_only_directories(self) -> None:
-        archive_path = Path(self.temp_dir.name) / "only_dirs.zip"
+        archive_path = self.temp_path / "only_dirs.zip"
         with zipfile.ZipFile(archive_path, "w") as archive:
             archive.writestr("dir1/", "")
             archive.writestr("dir2/subdir/", "")
@@ -552,7 +649,7 @@ class TestZipReader(unittest.TestCase):
         self.assertEqual(len(docs), 0)
 
     def test_mixed_empty_and_content_files(self) -> None:
-        archive_path = Path(self.temp_dir.name) / "mixed_empty.zip"
+        archive_path = self.temp_path / "mixed_empty.zip"
         with zipfile.ZipFile(archive_path, "w") as archive:
             archive.writestr("empty1.txt", "")
             archive.writestr("content.txt", "有内容")
@@ -565,7 +662,7 @@ class TestZipReader(unittest.TestCase):
         self.assertLessEqual(len(docs), 5)
 
     def test_very_long_filenames(self) -> None:
-        archive_path = Path(self.temp_dir.name) / "long_names.zip"
+        archive_path = self.temp_path / "long_names.zip"
         long_name = "a" * 200 + ".txt"
         with zipfile.ZipFile(archive_path, "w") as archive:
             archive.writestr(long_name, "内容")
@@ -575,25 +672,12 @@ class TestZipReader(unittest.TestCase):
         self.assertEqual(len(docs), 2)
 
     def test_multiple_nested_zips_same_level(self) -> None:
-        archive_path = Path(self.temp_dir.name) / "multi_nested.zip"
-        
-        nested1 = io.BytesIO()
-        with zipfile.ZipFile(nested1, "w") as z:
-            z.writestr("data1.txt", "嵌套包1数据")
-        
-        nested2 = io.BytesIO()
-        with zipfile.ZipFile(nested2, "w") as z:
-            z.writestr("data2.txt", "嵌套包2数据")
-        
-        nested3 = io.BytesIO()
-        with zipfile.ZipFile(nested3, "w") as z:
-            z.writestr("data3.txt", "嵌套包3数据")
+        archive_path = self.temp_path / "multi_nested.zip"
         
         with zipfile.ZipFile(archive_path, "w") as archive:
             archive.writestr("root.txt", "根文件")
-            archive.writestr("archives/pack1.zip", nested1.getvalue())
-            archive.writestr("archives/pack2.zip", nested2.getvalue())
-            archive.writestr("archives/pack3.zip", nested3.getvalue())
+            for i in (1, 2, 3):
+                _nested_zip_entry(archive, f"archives/pack{i}.zip", {f"data{i}.txt": f"嵌套包{i}数据"})
         
         docs = self.reader._load_data(archive_path)
         self.assertEqual(len(docs), 4)
@@ -602,7 +686,7 @@ class TestZipReader(unittest.TestCase):
         self.assertEqual(len(nested_docs), 3)
 
     def test_csv_parsing_in_zip(self) -> None:
-        archive_path = Path(self.temp_dir.name) / "csv_test.zip"
+        archive_path = self.temp_path / "csv_test.zip"
         with zipfile.ZipFile(archive_path, "w") as archive:
             archive.writestr("data/sales.csv", "产品,数量,价格\n笔记本,100,5000\n鼠标,200,50")
             archive.writestr("data/users.csv", "用户名,邮箱\nzhangsan,zhang@test.com\nlisi,li@test.com")
@@ -611,16 +695,14 @@ class TestZipReader(unittest.TestCase):
         self.assertEqual(len(docs), 2)
 
     def test_json_and_yaml_in_nested_zip(self) -> None:
-        archive_path = Path(self.temp_dir.name) / "config_archive.zip"
-        
-        nested = io.BytesIO()
-        with zipfile.ZipFile(nested, "w") as z:
-            z.writestr("app.json", '{"name": "app", "version": "2.0"}')
-            z.writestr("db.yml", "host: localhost\nport: 3306")
+        archive_path = self.temp_path / "config_archive.zip"
         
         with zipfile.ZipFile(archive_path, "w") as archive:
             archive.writestr("main.json", '{"type": "main"}')
-            archive.writestr("configs/nested.zip", nested.getvalue())
+            _nested_zip_entry(archive, "configs/nested.zip", {
+                "app.json": '{"name": "app", "version": "2.0"}',
+                "db.yml": "host: localhost\nport: 3306",
+            })
         
         docs = self.reader._load_data(archive_path)
         self.assertEqual(len(docs), 3)
@@ -629,15 +711,11 @@ class TestZipReader(unittest.TestCase):
         self.assertEqual(len(json_docs), 2)
 
     def test_metadata_propagation_through_nesting(self) -> None:
-        archive_path = Path(self.temp_dir.name) / "meta_nest.zip"
-        
-        nested = io.BytesIO()
-        with zipfile.ZipFile(nested, "w") as z:
-            z.writestr("inner.txt", "内部内容")
+        archive_path = self.temp_path / "meta_nest.zip"
         
         with zipfile.ZipFile(archive_path, "w") as archive:
             archive.writestr("outer.txt", "外部内容")
-            archive.writestr("nest/inner.zip", nested.getvalue())
+            _nested_zip_entry(archive, "nest/inner.zip", {"inner.txt": "内部内容"})
         
         custom_meta = {
             "project": "测试项目",
@@ -653,7 +731,7 @@ class TestZipReader(unittest.TestCase):
             self.assertEqual(doc.metadata.get("author"), "测试者")
 
     def test_archive_root_and_path_metadata(self) -> None:
-        archive_path = Path(self.temp_dir.name) / "test_archive.zip"
+        archive_path = self.temp_path / "test_archive.zip"
         with zipfile.ZipFile(archive_path, "w") as archive:
             archive.writestr("level1/file.txt", "内容")
         
@@ -666,14 +744,10 @@ class TestZipReader(unittest.TestCase):
         self.assertEqual(doc.metadata.get("archive_depth"), 0)
 
     def test_nested_archive_path_construction(self) -> None:
-        archive_path = Path(self.temp_dir.name) / "path_test.zip"
-        
-        level2 = io.BytesIO()
-        with zipfile.ZipFile(level2, "w") as z:
-            z.writestr("deep/file.txt", "深层内容")
+        archive_path = self.temp_path / "path_test.zip"
         
         with zipfile.ZipFile(archive_path, "w") as archive:
-            archive.writestr("container/level2.zip", level2.getvalue())
+            _nested_zip_entry(archive, "container/level2.zip", {"deep/file.txt": "深层内容"})
         
         docs = self.reader._load_data(archive_path)
         doc = docs[0]
@@ -683,16 +757,29 @@ class TestZipReader(unittest.TestCase):
         self.assertEqual(doc.metadata.get("archive_depth"), 1)
 
     def test_large_number_of_small_files(self) -> None:
-        archive_path = Path(self.temp_dir.name) / "many_small.zip"
-        with zipfile.ZipFile(archive_path, "w") as archive:
-            for i in range(500):
-                archive.writestr(f"files/batch_{i // 100}/file_{i}.txt", f"内容 {i}")
+        archive_path = self.temp_path / "many_small.zip"
+        payloads = {f"files/batch_{i // 100}/file_{i}.txt": f"内容 {i}".encode("utf-8") for i in range(500)}
+        archive_path.write_bytes(_make_zip(payloads))
         
         docs = self.reader._load_data(archive_path)
         self.assertEqual(len(docs), 500)
 
+    def test_parallel_decode_matches_serial(self) -> None:
+        archive_path = self.temp_path / "parallel.zip"
+        with zipfile.ZipFile(archive_path, "w", compression=zipfile.ZIP_DEFLATED, strict_timestamps=False) as archive:
+            for i in range(100):
+                name = f"files/file_{i}.txt" if i % 2 else f"files/file_{i}.json"
+                archive.writestr(_fixed_zip_info(name), f"内容 {i}".encode("utf-8"))
+
+        serial = ZipReader(max_workers=1)._load_data(archive_path)
+        parallel = ZipReader(max_workers=4)._load_data(archive_path)
+        self.assertEqual(
+            [(d.text, d.metadata["archive_path"]) for d in serial],
+            [(d.text, d.metadata["archive_path"]) for d in parallel],
+        )
+
     def test_whitespace_only_files(self) -> None:
-        archive_path = Path(self.temp_dir.name) / "whitespace.zip"
+        archive_path = self.temp_path / "whitespace.zip"
         with zipfile.ZipFile(archive_path, "w") as archive:
             archive.writestr("spaces.txt", "   ")
             archive.writestr("tabs.txt", "\t\t\t")
@@ -705,7 +792,7 @@ class TestZipReader(unittest.TestCase):
         self.assertLessEqual(len(docs), 5)
 
     def test_binary_files_skipped(self) -> None:
-        archive_path = Path(self.temp_dir.name) / "binary.zip"
+        archive_path = self.temp_path / "binary.zip"
         with zipfile.ZipFile(archive_path, "w") as archive:
             archive.writestr("image.png", bytes([0x89, 0x50, 0x4E, 0x47] + [0] * 100))
             archive.writestr("data.bin", bytes(range(256)))
@@ -716,6 +803,18 @@ class TestZipReader(unittest.TestCase):
         text_docs = [d for d in docs if d.metadata.get("file_name") == "text.txt"]
         self.assertEqual(len(text_docs), 1)
 
+    def test_binary_content_with_text_suffix_skipped(self) -> None:
+        archive_path = self.temp_path / "disguised_binary.zip"
+        with zipfile.ZipFile(archive_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr("image.txt", bytes([0x89, 0x50, 0x4E, 0x47] + [0] * 100))
+            archive.writestr("archive.log", b"\x1f\x8b\x08\x00" + bytes(range(1, 64)))
+            archive.writestr("nul.json", b'{"a": 1}\x00\x00')
+            archive.writestr("text.txt", "文本内容")
+        
+        docs = self.reader._load_data(archive_path)
+        
+        self.assertEqual([d.metadata.get("file_name") for d in docs], ["text.txt"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -7,7 +7,6 @@
 
 import logging
 import os
-import shutil
 import tempfile
 import unittest
 from unittest.mock import Mock
@@ -35,20 +34,8 @@ class TestFAISSStore(unittest.TestCase):
         # Suppress logging during tests
         logging.getLogger("agentuniverse.agent.action.knowledge.store.faiss_store").setLevel(logging.CRITICAL)
 
-    def setUp(self):
-        """Set up test environment."""
-        # Create temporary directory for test files
-        self.temp_dir = tempfile.mkdtemp()
-        self.index_path = os.path.join(self.temp_dir, "test_faiss.index")
-        self.metadata_path = os.path.join(self.temp_dir, "test_faiss_metadata.pkl")
-
-        # Import here to avoid import error when FAISS is not available
-        from agentuniverse.agent.action.knowledge.store.faiss_store import FAISSStore
-
-        self.FAISSStore = FAISSStore
-
-        # Create test documents with embeddings
-        self.test_documents = [
+        # Documents are only read by the tests, so they are built once per class
+        cls.test_documents = [
             Document(
                 id="doc1",
                 text="Python is a high-level programming language known for its simplicity.",
@@ -82,9 +69,9 @@ class TestFAISSStore(unittest.TestCase):
         ]
 
         # Create large dataset for performance testing
-        self.large_dataset = []
+        cls.large_dataset = []
         for i in range(100):
-            self.large_dataset.append(
+            cls.large_dataset.append(
                 Document(
                     id=f"large_doc_{i}",
                     text=f"This is document number {i} for performance testing.",
@@ -93,10 +80,22 @@ class TestFAISSStore(unittest.TestCase):
                 )
             )
 
+    def setUp(self):
+        """Set up test environment."""
+        # Create temporary directory for test files
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.temp_dir = self._temp_dir.name
+        self.index_path = os.path.join(self.temp_dir, "test_faiss.index")
+        self.metadata_path = os.path.join(self.temp_dir, "test_faiss_metadata.pkl")
+
+        # Import here to avoid import error when FAISS is not available
+        from agentuniverse.agent.action.knowledge.store.faiss_store import FAISSStore
+
+        self.FAISSStore = FAISSStore
+
     def tearDown(self):
         """Clean up test environment."""
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+        self._temp_dir.cleanup()
 
     def create_store(self, index_type="IndexFlatL2", **kwargs):
         """Helper method to create a FAISS store for testing."""
@@ -309,23 +308,20 @@ class TestFAISSStore(unittest.TestCase):
         self.assertEqual(store.get_document_by_id("dup").text, "Original")
 
         # Test querying empty store
-        empty_temp_dir = tempfile.mkdtemp()
-        empty_index_path = os.path.join(empty_temp_dir, "empty_faiss.index")
-        empty_metadata_path = os.path.join(empty_temp_dir, "empty_faiss_metadata.pkl")
-
-        empty_store = self.FAISSStore(
-            index_path=empty_index_path,
-            metadata_path=empty_metadata_path,
-            embedding_model=None,
-            index_config={"index_type": "IndexFlatL2", "dimension": 4},
-        )
-        empty_store._new_client()
-        query = Query(embeddings=[[0.1, 0.2, 0.3, 0.4]])
-        results = empty_store.query(query)
-        self.assertEqual(len(results), 0)
-
-        # Clean up empty store temp directory
-        shutil.rmtree(empty_temp_dir)
+        with tempfile.TemporaryDirectory() as empty_temp_dir:
+            empty_index_path = os.path.join(empty_temp_dir, "empty_faiss.index")
+            empty_metadata_path = os.path.join(empty_temp_dir, "empty_faiss_metadata.pkl")
+
+            empty_store = self.FAISSStore(
+                index_path=empty_index_path,
+                metadata_path=empty_metadata_path,
+                embedding_model=None,
+                index_config={"index_type": "IndexFlatL2", "dimension": 4},
+            )
+            empty_store._new_client()
+            query = Query(embeddings=[[0.1, 0.2, 0.3, 0.4]])
+            results = empty_store.query(query)
+            self.assertEqual(len(results), 0)
 
         # Test invalid query
         invalid_query = Query()  # No embeddings or query_str
@@ -0,0 +1,162 @@
+# !/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# @FileName: test_sqlite_store.py
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import jieba
+import numpy as np
+
+from agentuniverse.agent.action.knowledge.store.document import Document
+from agentuniverse.agent.action.knowledge.store.query import Query
+from agentuniverse.agent.action.knowledge.store.sqlite_store import SQLiteStore
+
+
+def _extract_keywords(document: Document):
+    """Stand-in for the configured keyword extractor: every non-blank token."""
+    document.keywords = {word for word in jieba.lcut(document.text) if word.strip()}
+    return document.keywords
+
+
+class TestSQLiteStore(unittest.TestCase):
+    """Tests for the BM25 scoring, top-k selection and batched writes of SQLiteStore."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.store = SQLiteStore(db_path=os.path.join(self.temp_dir.name, "store.db"))
+        self.store._new_client()
+        self.addCleanup(self.store.conn.close)
+
+        keyword_patch = patch.object(SQLiteStore, "_get_document_keyword",
+                                     side_effect=_extract_keywords)
+        keyword_patch.start()
+        self.addCleanup(keyword_patch.stop)
+
+        self.documents = [
+            Document(id="doc1", text="apple banana apple cherry", metadata={"n": 1}),
+            Document(id="doc2", text="banana banana date", metadata={"n": 2}),
+            Document(id="doc3", text="apple date elderberry fig grape", metadata={"n": 3}),
+            Document(id="doc4", text="cherry fig", metadata={"n": 4}),
+            Document(id="doc5", text="kiwi lemon mango", metadata={"n": 5}),
+        ]
+
+    def _inverted_index(self, terms):
+        cursor = self.store.conn.cursor()
+        index = {}
+        for term in terms:
+            cursor.execute('SELECT doc_id FROM inverted_index WHERE term = ?', (term,))
+            index[term] = [row[0] for row in cursor.fetchall()]
+        cursor.close()
+        return index
+
+    def _reference_scores(self, query_text):
+        """compute_bm25 score of every document the query hits, keyed by id."""
+        terms = _extract_keywords(Document(text=query_text))
+        index = self._inverted_index(terms)
+        hits = {doc_id for doc_ids in index.values() for doc_id in doc_ids}
+        total_docs = self.store._get_all_docs_count()
+        total_words = self.store._get_all_docs_words_count()
+        return {document.id: self.store.compute_bm25(query_text, document.text, index,
+                                                     total_docs, total_words)
+                for document in self.documents if document.id in hits}
+
+    def _assert_top_k(self, results, query_text, top_k):
+        """Results hold the top_k best scoring hits, best first; tied hits may come in any order."""
+        reference = self._reference_scores(query_text)
+        expected = sorted(reference.values(), reverse=True)[:top_k]
+        self.assertEqual(len({document.id for document in results}), len(results))
+        self.assertEqual([reference[document.id] for document in results], expected)
+
+    def test_bm25_scores_match_compute_bm25(self):
+        self.store.insert_document(self.documents)
+        # A repeated query term counts once per occurrence, as in compute_bm25.
+        query_text = "apple banana apple fig"
+        index = self._inverted_index(_extract_keywords(Document(text=query_text)))
+        texts = [document.text for document in self.documents]
+        total_docs = self.store._get_all_docs_count()
+        total_words = self.store._get_all_docs_words_count()
+
+        scores = self.store._compute_bm25_scores(jieba.lcut(query_text), texts, index,
+                                                 total_docs, total_words)
+        expected = [self.store.compute_bm25(query_text, text, index, total_docs, total_words)
+                    for text in texts]
+
+        np.testing.assert_allclose(scores, expected)
+
+    def test_query_returns_top_k_in_score_order(self):
+        self.store.insert_document(self.documents)
+        self.store.similarity_top_k = 2
+        query_text = "apple banana cherry"
+
+        results = self.store.query(Query(query_str=query_text))
+
+        self._assert_top_k(results, query_text, 2)
+
+    def test_query_top_k_larger_than_hits(self):
+        self.store.insert_document(self.documents)
+        self.store.similarity_top_k = 10
+        query_text = "apple fig"
+
+        results = self.store.query(Query(query_str=query_text))
+
+        self._assert_top_k(results, query_text, 10)
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[0].metadata, {"n": 3})
+
+    def test_query_without_hits(self):
+        self.store.insert_document(self.documents)
+
+        self.assertEqual(self.store.query(Query(query_str="pineapple")), [])
+
+    def test_query_over_fetch_batch_size(self):
+        self.documents = [Document(id=f"doc{i}", text=f"common term{i} " + "filler " * (i % 7),
+                                   metadata={"n": i})
+                          for i in range(1000)]
+        self.store.insert_document(self.documents)
+        self.store.similarity_top_k = 5
+
+        self.assertEqual(len(self.store._fetch_documents([d.id for d in self.documents])), 1000)
+        results = self.store.query(Query(query_str="common"))
+
+        self._assert_top_k(results, "common", 5)
+
+    def test_insert_document_indexes_each_term_once(self):
+        self.store.insert_document(self.documents[:2])
+
+        cursor = self.store.conn.cursor()
+        cursor.execute("SELECT term FROM inverted_index WHERE doc_id = 'doc2' ORDER BY term")
+        terms = [row[0] for row in cursor.fetchall()]
+        cursor.execute("SELECT COUNT(*) FROM documents")
+        document_count = cursor.fetchone()[0]
+        cursor.close()
+
+        self.assertEqual(terms, ["banana", "date"])
+        self.assertEqual(document_count, 2)
+
+    def test_upsert_document_replaces_stale_index_rows(self):
+        self.store.insert_document(self.documents[:2])
+        self.store.upsert_document([
+            Document(id="doc1", text="kiwi apple", metadata={"n": 1}),
+            Document(id="doc1", text="kiwi lemon", metadata={"n": 10}),
+        ])
+
+        cursor = self.store.conn.cursor()
+        cursor.execute("SELECT term FROM inverted_index WHERE doc_id = 'doc1' ORDER BY term")
+        terms = [row[0] for row in cursor.fetchall()]
+        cursor.execute("SELECT text, word_count, metadata FROM documents WHERE id = 'doc1'")
+        row = cursor.fetchone()
+        cursor.close()
+
+        # The last document in the batch wins, and only its terms stay indexed.
+        self.assertEqual(terms, ["kiwi", "lemon"])
+        self.assertEqual(row, ("kiwi lemon", 3, '{"n": 10}'))
+        self.assertEqual(self.store._get_all_docs_count(), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,6 +6,12 @@ Standalone Excel Tool Test - Direct openpyxl test
 """
 
 import os
+import tempfile
+
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
 
 
 def test_openpyxl_installation():
@@ -23,7 +29,9 @@ def test_openpyxl_installation():
 
 def test_excel_operations():
     """Test basic Excel operations"""
-    test_file = "/tmp/test_excel_standalone.xlsx"
+    # Per-process file name so parallel (pytest-xdist) workers don't collide.
+    test_file = os.path.join(tempfile.gettempdir(),
+                             f"test_excel_standalone_{os.getpid()}.xlsx")
 
     print("\n" + "="*60)
     print("  Excel Operations Test")
@@ -33,10 +41,13 @@ def test_excel_operations():
     print("\n📝 Test 1: Writing Excel file...")
     try:
         import openpyxl
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Font
 
-        workbook = openpyxl.Workbook()
-        sheet = workbook.active
-        sheet.title = "TestSheet"
+        # Write-only mode streams rows straight to XML instead of keeping a
+        # cell object per value.
+        workbook = openpyxl.Workbook(write_only=True)
+        sheet = workbook.create_sheet("TestSheet")
 
         # Write data
         data = [
@@ -46,12 +57,16 @@ def test_excel_operations():
             ["Charlie", 35, "Los Angeles"]
         ]
 
-        for row_data in data:
-            sheet.append(row_data)
-
         # Format header
-        for cell in sheet[1]:
-            cell.font = openpyxl.styles.Font(bold=True)
+        header = []
+        for value in data[0]:
+            cell = WriteOnlyCell(sheet, value=value)
+            cell.font = Font(bold=True)
+            header.append(cell)
+        sheet.append(header)
+
+        for row_data in data[1:]:
+            sheet.append(row_data)
 
         workbook.save(test_file)
         workbook.close()
@@ -66,14 +81,17 @@ def test_excel_operations():
     # Test 2: Read Excel file
     print("\n📖 Test 2: Reading Excel file...")
     try:
-        workbook = openpyxl.load_workbook(test_file, read_only=True, data_only=True)
-        sheet = workbook.active
+        if CalamineWorkbook is not None:
+            data = CalamineWorkbook.from_path(test_file).get_sheet_by_index(0).to_python()
+        else:
+            workbook = openpyxl.load_workbook(test_file, read_only=True, data_only=True)
+            sheet = workbook.active
 
-        data = []
-        for row in sheet.iter_rows(values_only=True):
-            data.append(list(row))
+            data = []
+            for row in sheet.iter_rows(values_only=True):
+                data.append(list(row))
 
-        workbook.close()
+            workbook.close()
 
         print(f"   ✅ Rows read: {len(data)}")
         print(f"   ✅ Data preview: {data[0]}")
@@ -6,12 +6,13 @@ Excel Tool Test Script
 Tests all four modes: read, write, append, info
 """
 
+import datetime
 import json
-import os
 import sys
+from unittest.mock import patch
 
-# Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import openpyxl
+import pytest
 
 from agentuniverse.agent.action.tool.common_tool.excel_tool import ExcelTool
 
@@ -21,182 +22,292 @@ def print_result(title: str, result: str):
     print(f"\n{'='*60}")
     print(f"  {title}")
     print(f"{'='*60}")
-    result_dict = json.loads(result)
-    print(json.dumps(result_dict, indent=2, ensure_ascii=False))
-    return result_dict
+    # Success results already come back indented; print them as returned
+    # instead of re-serialising the parsed dict.
+    print(result)
+    return json.loads(result)
 
 
-def test_excel_tool():
-    """Test all Excel tool operations"""
-    print("🧪 Starting Excel Tool Tests...")
+TEST_DATA = [
+    ["Name", "Age", "City", "Score"],
+    ["Alice", 25, "New York", 95],
+    ["Bob", 30, "San Francisco", 88],
+    ["Charlie", 35, "Los Angeles", 92],
+    ["David", 28, "Chicago", 87]
+]
 
-    tool = ExcelTool()
-    test_file = "/tmp/test_excel_tool_data.xlsx"
-
-    # Clean up any existing test file
-    if os.path.exists(test_file):
-        os.remove(test_file)
-        print(f"✅ Cleaned up existing test file: {test_file}")
-
-    # Test 1: Write new Excel file
-    print("\n📝 Test 1: Writing new Excel file...")
-    test_data = [
-        ["Name", "Age", "City", "Score"],
-        ["Alice", 25, "New York", 95],
-        ["Bob", 30, "San Francisco", 88],
-        ["Charlie", 35, "Los Angeles", 92],
-        ["David", 28, "Chicago", 87]
-    ]
 
-    result1 = tool.execute(
-        file_path=test_file,
+@pytest.fixture(scope="module")
+def excel_tool():
+    """One tool instance shared by every test in this module."""
+    return ExcelTool()
+
+
+def _write_students(path) -> str:
+    """Save TEST_DATA to a "Students" sheet at path and return it as a str."""
+    workbook = openpyxl.Workbook()
+    workbook.active.title = "Students"
+    for row in TEST_DATA:
+        workbook.active.append(row)
+    workbook.save(path)
+    return str(path)
+
+
+@pytest.fixture
+def test_file(tmp_path):
+    """A fresh workbook holding TEST_DATA, private to each test."""
+    return _write_students(tmp_path / "test_excel_tool_data.xlsx")
+
+
+@pytest.fixture(scope="module")
+def appended_file(tmp_path_factory):
+    """Workbook shared by test_append and test_read_after_append, which run in order."""
+    return _write_students(tmp_path_factory.mktemp("excel_tool") / "appended.xlsx")
+
+
+def test_write(excel_tool, tmp_path):
+    """Test 1: Write new Excel file"""
+    result = excel_tool.execute(
+        file_path=str(tmp_path / "written.xlsx"),
         mode="write",
-        data=test_data,
+        data=TEST_DATA,
         sheet_name="Students",
         overwrite=True
     )
-    result1_dict = print_result("Test 1: Write Operation", result1)
+    result_dict = print_result("Test 1: Write Operation", result)
+
+    assert result_dict["status"] == "success", "Write operation failed"
+    assert result_dict["rows_written"] == 5, "Wrong number of rows written"
 
-    assert result1_dict["status"] == "success", "Write operation failed"
-    assert result1_dict["rows_written"] == 5, "Wrong number of rows written"
-    print("✅ Test 1 PASSED")
 
-    # Test 2: Read Excel file
-    print("\n📖 Test 2: Reading Excel file...")
-    result2 = tool.execute(
+def test_read(excel_tool, test_file):
+    """Test 2: Read Excel file"""
+    result = excel_tool.execute(
         file_path=test_file,
         mode="read",
         sheet_name="Students"
     )
-    result2_dict = print_result("Test 2: Read Operation", result2)
+    result_dict = print_result("Test 2: Read Operation", result)
 
-    assert result2_dict["status"] == "success", "Read operation failed"
-    assert result2_dict["rows_read"] == 5, "Wrong number of rows read"
-    assert len(result2_dict["data"]) == 5, "Data length mismatch"
-    print("✅ Test 2 PASSED")
+    assert result_dict["status"] == "success", "Read operation failed"
+    assert result_dict["rows_read"] == 5, "Wrong number of rows read"
+    assert len(result_dict["data"]) == 5, "Data length mismatch"
+    assert result_dict["data"] == TEST_DATA, "Read data mismatch"
 
-    # Test 3: Get file info
-    print("\n📊 Test 3: Getting file info...")
-    result3 = tool.execute(
+
+def test_info(excel_tool, test_file):
+    """Test 3: Get file info"""
+    result = excel_tool.execute(
         file_path=test_file,
         mode="info"
     )
-    result3_dict = print_result("Test 3: Info Operation", result3)
+    result_dict = print_result("Test 3: Info Operation", result)
+
+    assert result_dict["status"] == "success", "Info operation failed"
+    assert result_dict["total_sheets"] == 1, "Wrong number of sheets"
+    assert "Students" in result_dict["sheet_names"], "Sheet name not found"
 
-    assert result3_dict["status"] == "success", "Info operation failed"
-    assert result3_dict["total_sheets"] == 1, "Wrong number of sheets"
-    assert "Students" in result3_dict["sheet_names"], "Sheet name not found"
-    print("✅ Test 3 PASSED")
 
-    # Test 4: Append data
-    print("\n➕ Test 4: Appending data to file...")
+def test_append(excel_tool, appended_file):
+    """Test 4: Append data"""
     append_data = [
         ["Eve", 27, "Seattle", 91],
         ["Frank", 32, "Boston", 89]
     ]
 
-    result4 = tool.execute(
-        file_path=test_file,
+    result = excel_tool.execute(
+        file_path=appended_file,
         mode="append",
         data=append_data,
         sheet_name="Students"
     )
-    result4_dict = print_result("Test 4: Append Operation", result4)
+    result_dict = print_result("Test 4: Append Operation", result)
 
-    assert result4_dict["status"] == "success", "Append operation failed"
-    assert result4_dict["rows_appended"] == 2, "Wrong number of rows appended"
-    print("✅ Test 4 PASSED")
+    assert result_dict["status"] == "success", "Append operation failed"
+    assert result_dict["rows_appended"] == 2, "Wrong number of rows appended"
 
-    # Test 5: Read again to verify append
-    print("\n🔍 Test 5: Verifying appended data...")
-    result5 = tool.execute(
-        file_path=test_file,
+
+def test_read_after_append(excel_tool, appended_file):
+    """Test 5: Read again to verify append"""
+    result = excel_tool.execute(
+        file_path=appended_file,
         mode="read",
         sheet_name="Students"
     )
-    result5_dict = print_result("Test 5: Read After Append", result5)
+    result_dict = print_result("Test 5: Read After Append", result)
 
-    assert result5_dict["status"] == "success", "Read after append failed"
-    assert result5_dict["rows_read"] == 7, f"Expected 7 rows, got {result5_dict['rows_read']}"
-    assert result5_dict["data"][-1][0] == "Frank", "Last row data mismatch"
-    print("✅ Test 5 PASSED")
+    assert result_dict["status"] == "success", "Read after append failed"
+    assert result_dict["rows_read"] == 7, f"Expected 7 rows, got {result_dict['rows_read']}"
+    assert result_dict["data"][-1][0] == "Frank", "Last row data mismatch"
 
-    # Test 6: Read with max_rows limit
-    print("\n📏 Test 6: Reading with row limit...")
-    result6 = tool.execute(
-        file_path=test_file,
-        mode="read",
-        sheet_name="Students",
-        max_rows=3
-    )
-    result6_dict = print_result("Test 6: Read with Limit", result6)
 
-    assert result6_dict["status"] == "success", "Limited read failed"
-    assert result6_dict["rows_read"] == 3, "Row limit not applied correctly"
-    print("✅ Test 6 PASSED")
+def test_read_with_limit(excel_tool, test_file):
+    """Test 6: Read with max_rows limit, served from the parsed-sheet cache"""
+    excel_tool.execute(file_path=test_file, mode="read", sheet_name="Students")
+    with patch.object(ExcelTool, "_load_sheet", wraps=ExcelTool._load_sheet) as load_sheet:
+        result = excel_tool.execute(
+            file_path=test_file,
+            mode="read",
+            sheet_name="Students",
+            max_rows=3
+        )
+    result_dict = print_result("Test 6: Read with Limit", result)
 
-    # Test 7: Security - Try to write to forbidden directory
-    print("\n🔒 Test 7: Testing security validation...")
-    result7 = tool.execute(
-        file_path="/etc/passwd.xlsx",
-        mode="write",
-        data=[["test"]]
-    )
-    result7_dict = print_result("Test 7: Security Check", result7)
+    assert result_dict["status"] == "success", "Limited read failed"
+    assert result_dict["rows_read"] == 3, "Row limit not applied correctly"
+    assert load_sheet.call_count == 0, "Unchanged file was parsed again"
+
+
+def test_modified_file_is_read_again(test_file):
+    """Appending changes the file's mtime and size, so the cached sheet is not reused."""
+    tool = ExcelTool()
+    tool.execute(file_path=test_file, mode="read", sheet_name="Students")
+    tool.execute(file_path=test_file, mode="append", data=[["Eve", 27, "Seattle", 91]], sheet_name="Students")
+    result = tool._read_excel(test_file, sheet_name="Students")
+
+    assert result["rows_read"] == 6
+    assert result["data"][-1][0] == "Eve"
+
+
+def test_limited_read_is_not_cached(test_file):
+    """A limited read parses only the rows it returns and leaves the cache empty."""
+    tool = ExcelTool()
+    result = tool._read_excel(test_file, sheet_name="Students", max_rows=2)
+
+    assert result["data"] == TEST_DATA[:2]
+    assert result["total_rows"] == 5
+    assert not tool.sheet_cache
+
+
+def test_sheet_cache_is_bounded(test_file):
+    """Sheets over the cell budget are not kept."""
+    tool = ExcelTool(sheet_cache_max_cells=10)
+    tool._read_excel(test_file, sheet_name="Students")
+
+    assert not tool.sheet_cache
 
-    assert result7_dict["status"] == "error", "Security validation should fail"
-    assert "Access denied" in result7_dict["error"], "Expected access denied error"
-    print("✅ Test 7 PASSED - Security working correctly")
 
+@pytest.fixture(scope="module")
+def typed_workbook(tmp_path_factory):
+    """Two sheets, the second one active, holding date and time cells."""
+    workbook = openpyxl.Workbook()
+    workbook.active.title = "First"
+    workbook.active.append(["first"])
+    second = workbook.create_sheet("Second")
+    second.append(["second", 2])
+    second.append([datetime.date(2024, 1, 2), datetime.datetime(2024, 1, 2, 3, 4, 5),
+                   datetime.time(12, 30), datetime.timedelta(hours=30), True, 1.5])
+    workbook.active = 1
+    path = str(tmp_path_factory.mktemp("excel_tool") / "typed.xlsx")
+    workbook.save(path)
+    return path
+
+
+def test_default_sheet_is_active_sheet(typed_workbook):
+    """Without sheet_name the workbook's active sheet is read, not the first."""
+    result = ExcelTool()._read_excel(typed_workbook)
+
+    assert result["sheet_name"] == "Second"
+    assert result["data"][1][0] == datetime.datetime(2024, 1, 2)
+
+
+@pytest.mark.parametrize("sheet_name, max_rows", [(None, None), ("First", None), (None, 1)])
+def test_calamine_matches_openpyxl(typed_workbook, sheet_name, max_rows):
+    """The calamine fast path returns exactly what openpyxl returns."""
+    pytest.importorskip("python_calamine")
+    calamine = ExcelTool._read_sheet_calamine(typed_workbook, sheet_name, max_rows)
+
+    assert calamine == ExcelTool._read_sheet_openpyxl(typed_workbook, sheet_name, max_rows)
+
+
+def test_calamine_failure_falls_back_to_openpyxl(typed_workbook):
+    """A workbook calamine cannot parse is read with openpyxl instead."""
+    calamine = pytest.importorskip("python_calamine")
+    with patch.object(calamine.CalamineWorkbook, "from_path", side_effect=calamine.CalamineError("boom")):
+        result = ExcelTool()._read_excel(typed_workbook)
+
+    assert result["status"] == "success"
+    assert result["sheet_name"] == "Second"
+
+
+@pytest.mark.parametrize("engine", ["openpyxl", "xlsxwriter"])
+def test_write_engines_round_trip(engine, tmp_path):
+    """Both write engines produce the same readable workbook."""
+    if engine == "xlsxwriter":
+        pytest.importorskip("xlsxwriter")
+    tool = ExcelTool(write_engine=engine)
+    path = str(tmp_path / f"{engine}.xlsx")
+
+    write_result = json.loads(tool.execute(file_path=path, mode="write", data=TEST_DATA, sheet_name="Students"))
+    read_result = json.loads(tool.execute(file_path=path, mode="read"))
+
+    assert write_result["status"] == "success", write_result
+    assert read_result["sheet_name"] == "Students"
+    assert read_result["data"] == TEST_DATA
+
+
+def test_auto_engine_writes_long_sheet_names(tmp_path):
+    """Sheet names xlsxwriter rejects fall back to openpyxl, which accepts them."""
+    sheet_name = "S" * 40
+    path = str(tmp_path / "long_name.xlsx")
+
+    with pytest.warns(UserWarning):
+        result = json.loads(ExcelTool().execute(file_path=path, mode="write", data=TEST_DATA,
+                                                sheet_name=sheet_name))
+
+    assert result["status"] == "success", result
+    assert openpyxl.load_workbook(path).sheetnames == [sheet_name]
+
+
+def test_xlsxwriter_engine_rejects_long_sheet_names(tmp_path):
+    """An explicit xlsxwriter engine reports the bad name without creating the file."""
+    pytest.importorskip("xlsxwriter")
+    path = tmp_path / "rejected.xlsx"
+
+    result = json.loads(ExcelTool(write_engine="xlsxwriter").execute(
+        file_path=str(path), mode="write", data=TEST_DATA, sheet_name="S" * 40))
+
+    assert result["status"] == "error"
+    assert not path.exists()
+
+
+def test_failed_write_leaves_no_file(tmp_path):
+    """A write that fails removes its partial file, so a retry is not blocked."""
+    path = tmp_path / "partial.xlsx"
+
+    def write_partially(file_path, data, sheet_name):
+        path.write_bytes(b"PK")
+        raise OSError("disk full")
+
+    tool = ExcelTool(write_engine="openpyxl")
+    with patch.object(ExcelTool, "_write_rows_openpyxl", side_effect=write_partially):
+        result = json.loads(tool.execute(file_path=str(path), mode="write", data=TEST_DATA))
+    retry = json.loads(tool.execute(file_path=str(path), mode="write", data=TEST_DATA))
+
+    assert result["status"] == "error"
+    assert retry["status"] == "success", retry
+
+
+def test_write_engine_rejects_unknown_values():
+    with pytest.raises(ValueError):
+        ExcelTool(write_engine="xlsxwritr")
+
+
+@pytest.mark.parametrize("title, kwargs, expected_error", [
+    # Test 7: Security - Try to write to forbidden directory
+    ("Security Check", {"file_path": "/etc/passwd.xlsx", "mode": "write", "data": [["test"]]}, "Access denied"),
     # Test 8: Error handling - Invalid mode
-    print("\n❌ Test 8: Testing error handling (invalid mode)...")
-    result8 = tool.execute(
-        file_path=test_file,
-        mode="invalid_mode"
-    )
-    result8_dict = print_result("Test 8: Invalid Mode", result8)
-
-    assert result8_dict["status"] == "error", "Should return error for invalid mode"
-    assert "Invalid mode" in result8_dict["error"], "Expected invalid mode error"
-    print("✅ Test 8 PASSED - Error handling working correctly")
-
-    # Test 9: Error handling - Missing required parameter
-    print("\n❌ Test 9: Testing error handling (missing data)...")
-    result9 = tool.execute(
-        file_path="/tmp/test_new.xlsx",
-        mode="write"
-        # Missing 'data' parameter
-    )
-    result9_dict = print_result("Test 9: Missing Parameter", result9)
-
-    assert result9_dict["status"] == "error", "Should return error for missing data"
-    assert "required" in result9_dict["error"].lower(), "Expected parameter required error"
-    print("✅ Test 9 PASSED - Parameter validation working correctly")
-
-    # Clean up test file
-    if os.path.exists(test_file):
-        os.remove(test_file)
-        print(f"\n🧹 Cleaned up test file: {test_file}")
-
-    print("\n" + "="*60)
-    print("  🎉 ALL TESTS PASSED!")
-    print("="*60)
-    print("\nExcel Tool Summary:")
-    print("  ✅ Write operation")
-    print("  ✅ Read operation")
-    print("  ✅ Append operation")
-    print("  ✅ Info operation")
-    print("  ✅ Row limit support")
-    print("  ✅ Security validation")
-    print("  ✅ Error handling")
-    print("  ✅ Parameter validation")
+    ("Invalid Mode", {"file_path": "/tmp/test_new.xlsx", "mode": "invalid_mode"}, "Invalid mode"),
+    # Test 9: Error handling - Missing required 'data' parameter
+    ("Missing Parameter", {"file_path": "/tmp/test_new.xlsx", "mode": "write"}, "required"),
+])
+def test_rejected_requests(excel_tool, title, kwargs, expected_error):
+    """Tests 7-9: invalid requests are rejected before touching any file"""
+    result_dict = print_result(f"Test: {title}", excel_tool.execute(**kwargs))
+
+    assert result_dict["status"] == "error", f"{title} should return an error"
+    assert expected_error in result_dict["error"], f"Expected '{expected_error}' error"
 
 
 if __name__ == "__main__":
-    try:
-        test_excel_tool()
-    except Exception as e:
-        print(f"\n❌ TEST FAILED: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
+    sys.exit(pytest.main([__file__, "-v"]))
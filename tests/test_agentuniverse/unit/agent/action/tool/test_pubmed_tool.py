@@ -72,7 +72,7 @@ class PubMedToolTest(unittest.TestCase):
     def setUp(self) -> None:
         self.tool = PubMedTool()
 
-    @patch("agentuniverse.agent.action.tool.common_tool.pubmed_tool.requests.get")
+    @patch("agentuniverse.agent.action.tool.common_tool.pubmed_tool.requests.Session.get")
     def test_search_returns_structured_metadata(self, mock_get: Mock) -> None:
         mock_get.side_effect = [
             response_mock(json_data={"esearchresult": {"count": "42", "idlist": ["12345678"]}}),
@@ -125,7 +125,7 @@ class PubMedToolTest(unittest.TestCase):
         self.assertEqual(search_call.kwargs["params"]["sort"], "relevance")
         self.assertEqual(search_call.kwargs["params"]["tool"], "agentuniverse_pubmed_tool")
 
-    @patch("agentuniverse.agent.action.tool.common_tool.pubmed_tool.requests.get")
+    @patch("agentuniverse.agent.action.tool.common_tool.pubmed_tool.requests.Session.get")
     def test_search_supports_paging_and_sorting(self, mock_get: Mock) -> None:
         mock_get.side_effect = [
             response_mock(json_data={"esearchresult": {"count": "42", "idlist": ["12345678"]}}),
@@ -149,7 +149,21 @@ class PubMedToolTest(unittest.TestCase):
         self.assertEqual(search_call.kwargs["params"]["retstart"], 20)
         self.assertEqual(search_call.kwargs["params"]["sort"], "pub_date")
 
-    @patch("agentuniverse.agent.action.tool.common_tool.pubmed_tool.requests.get")
+    def test_search_uses_one_session_and_closes_it(self) -> None:
+        responses = [
+            response_mock(json_data={"esearchresult": {"count": "1", "idlist": ["12345678"]}}),
+            response_mock(content=SAMPLE_XML),
+        ]
+        with patch.object(requests.Session, "get", autospec=True, side_effect=responses) as mock_get, \
+                patch.object(requests.Session, "close", autospec=True) as mock_close:
+            self.tool.execute(query="AI medicine")
+
+        sessions = {call.args[0] for call in mock_get.call_args_list}
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(len(sessions), 1)
+        mock_close.assert_called_once_with(sessions.pop())
+
+    @patch("agentuniverse.agent.action.tool.common_tool.pubmed_tool.requests.Session.get")
     def test_search_normalizes_sort_aliases(self, mock_get: Mock) -> None:
         mock_get.return_value = response_mock(
             json_data={"esearchresult": {"count": "0", "idlist": []}}
@@ -160,7 +174,7 @@ class PubMedToolTest(unittest.TestCase):
         self.assertEqual(result["sort"], "pub_date")
         self.assertEqual(mock_get.call_args.kwargs["params"]["sort"], "pub_date")
 
-    @patch("agentuniverse.agent.action.tool.common_tool.pubmed_tool.requests.get")
+    @patch("agentuniverse.agent.action.tool.common_tool.pubmed_tool.requests.Session.get")
     def test_search_keeps_canonical_sort_values_in_result(self, mock_get: Mock) -> None:
         mock_get.return_value = response_mock(
             json_data={"esearchresult": {"count": "0", "idlist": []}}
@@ -173,7 +187,7 @@ class PubMedToolTest(unittest.TestCase):
                 self.assertEqual(result["sort"], sort)
                 self.assertEqual(mock_get.call_args.kwargs["params"]["sort"], api_value)
 
-    @patch("agentuniverse.agent.action.tool.common_tool.pubmed_tool.requests.get")
+    @patch("agentuniverse.agent.action.tool.common_tool.pubmed_tool.requests.Session.get")
     def test_search_supports_date_range_filters(self, mock_get: Mock) -> None:
         mock_get.return_value = response_mock(
             json_data={"esearchresult": {"count": "0", "idlist": []}}
@@ -201,7 +215,7 @@ class PubMedToolTest(unittest.TestCase):
                 with self.assertRaisesRegex(ValueError, "must be provided together"):
                     self.tool.execute(query="AI medicine", **date_filter)
 
-    @patch("agentuniverse.agent.action.tool.common_tool.pubmed_tool.requests.get")
+    @patch("agentuniverse.agent.action.tool.common_tool.pubmed_tool.requests.Session.get")
     def test_search_enforces_pubmed_paging_limit(self, mock_get: Mock) -> None:
         mock_get.return_value = response_mock(
             json_data={"esearchresult": {"count": "100000", "idlist": []}}
@@ -215,7 +229,7 @@ class PubMedToolTest(unittest.TestCase):
             self.tool.execute(query="AI medicine", max_results=1, page=10000)
         mock_get.assert_called_once()
 
-    @patch("agentuniverse.agent.action.tool.common_tool.pubmed_tool.requests.get")
+    @patch("agentuniverse.agent.action.tool.common_tool.pubmed_tool.requests.Session.get")
     def test_empty_search_does_not_fetch_articles(self, mock_get: Mock) -> None:
         mock_get.return_value = response_mock(
             json_data={"esearchresult": {"count": "0", "idlist": []}}
@@ -250,7 +264,7 @@ class PubMedToolTest(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, "datetype must be one of"):
             self.tool.execute(query="cancer", mindate="2024", datetype="published")
 
-    @patch("agentuniverse.agent.action.tool.common_tool.pubmed_tool.requests.get")
+    @patch("agentuniverse.agent.action.tool.common_tool.pubmed_tool.requests.Session.get")
     def test_error_result_preserves_date_filters(self, mock_get: Mock) -> None:
         mock_get.side_effect = requests.Timeout("timed out")
 
@@ -261,7 +275,7 @@ class PubMedToolTest(unittest.TestCase):
         self.assertEqual(result["maxdate"], "2024/12")
         self.assertEqual(result["datetype"], "pdat")
 
-    @patch("agentuniverse.agent.action.tool.common_tool.pubmed_tool.requests.get")
+    @patch("agentuniverse.agent.action.tool.common_tool.pubmed_tool.requests.Session.get")
     def test_timeout_returns_structured_error(self, mock_get: Mock) -> None:
         mock_get.side_effect = requests.Timeout("timed out")
 
@@ -270,7 +284,7 @@ class PubMedToolTest(unittest.TestCase):
         self.assertEqual(result["error"]["type"], "request_timeout")
         self.assertEqual(result["papers"], [])
 
-    @patch("agentuniverse.agent.action.tool.common_tool.pubmed_tool.requests.get")
+    @patch("agentuniverse.agent.action.tool.common_tool.pubmed_tool.requests.Session.get")
     def test_http_error_returns_structured_error(self, mock_get: Mock) -> None:
         response = Mock(status_code=429)
         mock_get.side_effect = requests.HTTPError(response=response)
@@ -280,7 +294,7 @@ class PubMedToolTest(unittest.TestCase):
         self.assertEqual(result["error"]["type"], "http_error")
         self.assertIn("429", result["error"]["message"])
 
-    @patch("agentuniverse.agent.action.tool.common_tool.pubmed_tool.requests.get")
+    @patch("agentuniverse.agent.action.tool.common_tool.pubmed_tool.requests.Session.get")
     def test_connection_error_returns_structured_error(self, mock_get: Mock) -> None:
         mock_get.side_effect = requests.ConnectionError("connection failed")
 
@@ -289,7 +303,7 @@ class PubMedToolTest(unittest.TestCase):
         self.assertEqual(result["error"]["type"], "request_error")
         self.assertIn("connection failed", result["error"]["message"])
 
-    @patch("agentuniverse.agent.action.tool.common_tool.pubmed_tool.requests.get")
+    @patch("agentuniverse.agent.action.tool.common_tool.pubmed_tool.requests.Session.get")
     def test_esearch_api_errors_return_structured_error(self, mock_get: Mock) -> None:
         responses = (
             ({"error": "API rate limit exceeded", "count": "11"}, "API rate limit exceeded"),
@@ -307,7 +321,7 @@ class PubMedToolTest(unittest.TestCase):
                 self.assertIn(expected_message, result["error"]["message"])
                 mock_get.assert_called_once()
 
-    @patch("agentuniverse.agent.action.tool.common_tool.pubmed_tool.requests.get")
+    @patch("agentuniverse.agent.action.tool.common_tool.pubmed_tool.requests.Session.get")
     def test_efetch_api_error_returns_structured_error(self, mock_get: Mock) -> None:
         mock_get.side_effect = [
             response_mock(json_data={"esearchresult": {"count": "1", "idlist": ["1"]}}),
@@ -319,7 +333,7 @@ class PubMedToolTest(unittest.TestCase):
         self.assertEqual(result["error"]["type"], "api_error")
         self.assertIn("Unable to obtain query", result["error"]["message"])
 
-    @patch("agentuniverse.agent.action.tool.common_tool.pubmed_tool.requests.get")
+    @patch("agentuniverse.agent.action.tool.common_tool.pubmed_tool.requests.Session.get")
     def test_invalid_esearch_json_returns_structured_error(self, mock_get: Mock) -> None:
         response = response_mock()
         response.json.side_effect = requests.JSONDecodeError("invalid JSON", "", 0)
@@ -401,7 +415,7 @@ class PubMedToolTest(unittest.TestCase):
         ):
             self.assertIn(boundary_contract, description)
 
-    @patch("agentuniverse.agent.action.tool.common_tool.pubmed_tool.requests.get")
+    @patch("agentuniverse.agent.action.tool.common_tool.pubmed_tool.requests.Session.get")
     def test_invalid_xml_returns_structured_error(self, mock_get: Mock) -> None:
         mock_get.side_effect = [
             response_mock(json_data={"esearchresult": {"count": "1", "idlist": ["1"]}}),
@@ -11,15 +11,9 @@ DOCX_AVAILABLE = importlib.util.find_spec("docx") is not None
 class WriteWordDocumentToolTest(unittest.TestCase):
     def setUp(self):
         self.tool = WriteWordDocumentTool()
-        self.temp_dir = tempfile.mkdtemp()
-
-    def tearDown(self):
-        for root, dirs, files in os.walk(self.temp_dir, topdown=False):
-            for name in files:
-                os.unlink(os.path.join(root, name))
-            for name in dirs:
-                os.rmdir(os.path.join(root, name))
-        os.rmdir(self.temp_dir)
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_dir = temp_dir.name
 
     @unittest.skipUnless(DOCX_AVAILABLE, "python-docx is required")
     def test_write_new_word_file(self):
@@ -18,6 +18,7 @@ regression is caught at test time rather than at agent runtime.
 
 import os
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
 
 from agentuniverse.agent.action.tool.common_tool import yahoo_finance_tool as yf_module
@@ -227,6 +228,9 @@ class TestExecute(unittest.TestCase):
             def __init__(self, records):
                 self._records = records
 
+            def tail(self, n):
+                return _FakeHistory(self._records[-n:])
+
             def reset_index(self):
                 return self
 
@@ -252,12 +256,95 @@ class TestExecute(unittest.TestCase):
         # newest first → the 01-02 row precedes the 01-01 row.
         self.assertLess(out.index("2024-01-02"), out.index("2024-01-01"))
 
+    def test_execute_history_converts_only_the_latest_rows(self) -> None:
+        self.tool.max_history_rows = 3
+        latest = Mock()
+        latest.reset_index.return_value.rename.return_value.to_dict.return_value = [
+            {"date": "2024-01-01"}, {"date": "2024-01-02"}, {"date": "2024-01-03"},
+        ]
+        frame = Mock(empty=False)
+        frame.tail.return_value = latest
+        ticker = Mock()
+        ticker.history.return_value = frame
+
+        rows = self.tool._fetch_history(ticker, period="max", interval="1d")
+
+        # Only the tail is converted; the full frame is never turned into dicts.
+        frame.tail.assert_called_once_with(3)
+        frame.reset_index.assert_not_called()
+        self.assertEqual([row["date"] for row in rows],
+                         ["2024-01-03", "2024-01-02", "2024-01-01"])
+
     def test_execute_symbol_uppercased_before_fetch(self) -> None:
         ticker = self._mock_ticker({"regularMarketPrice": 1.0})
         with patch.object(self.tool, "_get_ticker", return_value=ticker) as m:
             self.tool.execute(mode="quote", symbol="aapl")
         m.assert_called_once_with("AAPL")
 
+    def test_execute_fetches_every_call_by_default(self) -> None:
+        ticker = self._mock_ticker({"regularMarketPrice": 1.0})
+        with patch.object(self.tool, "_get_ticker", return_value=ticker) as m:
+            self.tool.execute(mode="quote", symbol="AAPL")
+            self.tool.execute(mode="quote", symbol="AAPL")
+        self.assertEqual(m.call_count, 2)
+
+    def test_execute_reuses_cached_payload_within_ttl(self) -> None:
+        self.tool.response_cache_ttl = 60.0
+        ticker = self._mock_ticker({"regularMarketPrice": 150.0})
+        with patch.object(self.tool, "_get_ticker", return_value=ticker) as m:
+            first = self.tool.execute(mode="quote", symbol="AAPL")
+            second = self.tool.execute(mode="quote", symbol="aapl")
+            self.tool.execute(mode="info", symbol="AAPL")
+        self.assertEqual(first, second)
+        # quote is served from the cache; info is a different request.
+        self.assertEqual(m.call_count, 2)
+
+    def test_execute_refetches_after_ttl_expires(self) -> None:
+        self.tool.response_cache_ttl = 60.0
+        ticker = self._mock_ticker({"regularMarketPrice": 150.0})
+        with patch.object(self.tool, "_get_ticker", return_value=ticker) as m, \
+                patch.object(yf_module.time, "monotonic", side_effect=[0.0, 61.0]):
+            self.tool.execute(mode="quote", symbol="AAPL")
+            self.tool.execute(mode="quote", symbol="AAPL")
+        self.assertEqual(m.call_count, 2)
+
+    def test_expired_entries_are_evicted(self) -> None:
+        self.tool.response_cache_ttl = 60.0
+        ticker = self._mock_ticker({"regularMarketPrice": 150.0})
+        with patch.object(self.tool, "_get_ticker", return_value=ticker), \
+                patch.object(yf_module.time, "monotonic", side_effect=[0.0, 61.0]):
+            self.tool.execute(mode="quote", symbol="AAPL")
+            self.tool.execute(mode="quote", symbol="MSFT")
+        self.assertEqual(list(self.tool.response_cache), [("quote", "MSFT")])
+
+    def test_cache_is_bounded(self) -> None:
+        self.tool.response_cache_ttl = 60.0
+        self.tool.response_cache_max_entries = 2
+        ticker = self._mock_ticker({"regularMarketPrice": 150.0})
+        with patch.object(self.tool, "_get_ticker", return_value=ticker):
+            for symbol in ("AAPL", "MSFT", "GOOG"):
+                self.tool.execute(mode="quote", symbol=symbol)
+        self.assertEqual(list(self.tool.response_cache),
+                         [("quote", "MSFT"), ("quote", "GOOG")])
+
+    def test_copies_share_cache_across_threads(self) -> None:
+        self.tool.response_cache_ttl = 60.0
+        self.tool.response_cache_max_entries = 4
+        ticker = self._mock_ticker({"regularMarketPrice": 150.0})
+        copies = [self.tool.create_copy() for _ in range(8)]
+        symbols = [f"SYM{i}" for i in range(50)]
+
+        def run(index: int) -> str:
+            tool = copies[index % len(copies)]
+            return tool.execute(mode="quote", symbol=symbols[index % len(symbols)])
+
+        with patch.object(YahooFinanceTool, "_get_ticker", return_value=ticker), \
+                ThreadPoolExecutor(max_workers=8) as pool:
+            outputs = list(pool.map(run, range(2000)))
+        self.assertFalse([out for out in outputs if out.startswith("Error")])
+        self.assertIs(copies[0].response_cache, self.tool.response_cache)
+        self.assertLessEqual(len(self.tool.response_cache), 4)
+
     def test_execute_invalid_mode(self) -> None:
         out = self.tool.execute(mode="frobnicate", symbol="AAPL")
         self.assertIn("invalid mode", out)
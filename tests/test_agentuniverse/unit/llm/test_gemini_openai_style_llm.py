@@ -2,11 +2,17 @@ import unittest
 
 from langchain.chains.conversation.base import ConversationChain
 
-import asyncio
 from agentuniverse.llm.default.gemini_openai_style_llm import GeminiOpenAIStyleLLM
 
+MESSAGES = [
+    {
+        "role": "user",
+        "content": "hi, please introduce yourself",
+    }
+]
 
-class TestGeminiOpenAIStyleLLM(unittest.TestCase):
+
+class TestGeminiOpenAIStyleLLM(unittest.IsolatedAsyncioTestCase):
     def setUp(self) -> None:
         self.llm = GeminiOpenAIStyleLLM(model_name='gemini-2.0-flash',
                                         api_key='xxxx',
@@ -14,51 +20,21 @@ class TestGeminiOpenAIStyleLLM(unittest.TestCase):
                                         proxy='http://127.0.0.1:10808')
 
     def test_call(self) -> None:
-        messages = [
-            {
-                "role": "user",
-                "content": "hi, please introduce yourself",
-            }
-        ]
-        output = self.llm.call(messages=messages, streaming=False)
+        output = self.llm.call(messages=MESSAGES, streaming=False)
         print(output.__str__())
 
-    def test_acall(self) -> None:
-        messages = [
-            {
-                "role": "user",
-                "content": "hi, please introduce yourself",
-            }
-        ]
-        output = asyncio.run(self.llm.acall(messages=messages, streaming=False))
+    async def test_acall(self) -> None:
+        output = await self.llm.acall(messages=MESSAGES, streaming=False)
         print(output.__str__())
 
     def test_call_stream(self):
-        messages = [
-            {
-                "role": "user",
-                "content": "hi, please introduce yourself",
-            }
-        ]
-        for chunk in self.llm.call(messages=messages, streaming=True):
-            print(chunk.text, end='')
-        print()
+        chunks = [chunk.text for chunk in self.llm.call(messages=MESSAGES, streaming=True)]
+        print(''.join(chunks))
 
     #
-    def test_acall_stream(self):
-        messages = [
-            {
-                "role": "user",
-                "content": "hi, please introduce yourself",
-            }
-        ]
-        asyncio.run(self.call_stream(messages=messages))
-
-    async def call_stream(self, messages: list):
-
-        async for chunk in await self.llm.acall(messages=messages, streaming=True):
-            print(chunk, end='')
-        print()
+    async def test_acall_stream(self):
+        chunks = [chunk.text async for chunk in await self.llm.acall(messages=MESSAGES, streaming=True)]
+        print(''.join(chunks))
 
     def test_as_langchain(self):
         langchain_llm = self.llm.as_langchain()
@@ -4,15 +4,21 @@
 # @Author  : wangchongshi
 # @Email   : wangchongshi.wcs@antgroup.com
 # @FileName: test_llm.py
-import asyncio
 import unittest
 
 from langchain.chains import ConversationChain
 
 from agentuniverse.llm.default.default_openai_llm import DefaultOpenAILLM
 
+MESSAGES = [
+    {
+        "role": "user",
+        "content": "hi, please introduce yourself",
+    }
+]
 
-class LLMTest(unittest.TestCase):
+
+class LLMTest(unittest.IsolatedAsyncioTestCase):
     """
     Test cases for LLM class
     """
@@ -21,52 +27,21 @@ class LLMTest(unittest.TestCase):
         self.llm = DefaultOpenAILLM(model_name='gpt-4o')
 
     def test_call(self) -> None:
-        messages = [
-            {
-                "role": "user",
-                "content": "hi, please introduce yourself",
-            }
-        ]
-        output = self.llm.call(messages=messages, streaming=False)
+        output = self.llm.call(messages=MESSAGES, streaming=False)
         print(output.__str__())
 
-    def test_acall(self) -> None:
-        messages = [
-            {
-                "role": "user",
-                "content": "hi, please introduce yourself",
-            }
-        ]
-        output = asyncio.run(self.llm.acall(messages=messages, streaming=False))
+    async def test_acall(self) -> None:
+        output = await self.llm.acall(messages=MESSAGES, streaming=False)
         print(output.__str__())
 
     def test_call_stream(self):
-        messages = [
-            {
-                "role": "user",
-                "content": "hi, please introduce yourself",
-            }
-        ]
-        for chunk in self.llm.call(messages=messages, streaming=True):
-            print(chunk.text, end='')
-        print()
-
-    #
-    def test_acall_stream(self):
-        messages = [
-            {
-                "role": "user",
-                "content": "hi, please introduce yourself",
-            }
-        ]
-        asyncio.run(self.call_stream(messages=messages))
+        chunks = [chunk.text for chunk in self.llm.call(messages=MESSAGES, streaming=True)]
+        print(''.join(chunks))
 
     #
-    async def call_stream(self, messages: list):
-
-        async for chunk in await self.llm.acall(messages=messages, streaming=True):
-            print(chunk, end='')
-        print()
+    async def test_acall_stream(self):
+        chunks = [chunk.text async for chunk in await self.llm.acall(messages=MESSAGES, streaming=True)]
+        print(''.join(chunks))
 
     def test_as_langchain(self):
         langchain_llm = self.llm.as_langchain()
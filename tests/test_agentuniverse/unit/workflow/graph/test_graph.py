@@ -0,0 +1,30 @@
+# !/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# @FileName: test_graph.py
+
+import unittest
+
+from agentuniverse.workflow.graph.graph import Graph
+
+
+class GraphSortedNodesTest(unittest.TestCase):
+
+    def test_order_follows_edge_replacement(self):
+        """Swapping one edge for another keeps the counts but must re-sort."""
+        graph = Graph()
+        graph.add_edges_from([("a", "b"), ("c", "d")])
+        order = graph._get_sorted_nodes()
+        self.assertLess(order.index("a"), order.index("b"))
+
+        graph.remove_edge("a", "b")
+        graph.add_edge("b", "a")
+        order = graph._get_sorted_nodes()
+        self.assertLess(order.index("b"), order.index("a"))
+
+    def test_order_is_reused_without_changes(self):
+        graph = Graph([("a", "b")])
+        self.assertIs(graph._get_sorted_nodes(), graph._get_sorted_nodes())
+
+
+if __name__ == '__main__':
+    unittest.main()